@@ -1,10 +1,28 @@
 """Base API client utilities"""
 import os
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Optional
 from common.vault_client import VaultClient
 
 
+def _build_session() -> requests.Session:
+    """Create a keep-alive HTTP session with a pooled HTTPS adapter"""
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+    return session
+
+
+# Connection pool shared by every BaseYNABClient in the process, so YNAB
+# requests reuse TCP/TLS connections instead of reconnecting per call
+_session = _build_session()
+
+
+def close_session() -> None:
+    """Close pooled YNAB connections (reopened on the next request)."""
+    _session.close()
+
+
 class YNABAPIError(Exception):
     """Base exception for YNAB API errors"""
     pass
@@ -35,9 +53,16 @@ class YNABRateLimitError(YNABAPIError):
 class BaseYNABClient:
     """YNAB API client with authentication and error handling"""
     
-    def __init__(self):
-        """Initialize client with API token from Vault or environment"""
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize client with API token from Vault or environment.
+        
+        Args:
+            session: HTTP session to send requests on (default: the shared
+                process-wide session)
+        """
         self.base_url = "https://api.youneedabudget.com/v1"
+        self.session = session or _session
         self.api_token = self._load_api_token()
         
     def _load_api_token(self) -> str:
@@ -96,7 +121,7 @@ class BaseYNABClient:
         url = f'{self.base_url}{endpoint}'
         
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.session.get(url, headers=headers, params=params, timeout=10)
             
             if response.status_code == 200:
                 return response.json()
@@ -140,7 +165,7 @@ class BaseYNABClient:
         url = f'{self.base_url}{endpoint}'
         
         try:
-            response = requests.put(url, headers=headers, json=data, timeout=10)
+            response = self.session.put(url, headers=headers, json=data, timeout=10)
             
             if response.status_code == 200:
                 return response.json()
@@ -160,3 +185,52 @@ class BaseYNABClient:
         
         except requests.RequestException as e:
             raise YNABAPIError(f"Network error: {str(e)}")
+    
+    def patch(self, endpoint: str, data: Dict) -> Dict:
+        """
+        Make authenticated PATCH request to YNAB API.
+        
+        Used for bulk updates (e.g., '/budgets/{id}/transactions'), which YNAB
+        answers with 209 rather than 200.
+        
+        Args:
+            endpoint: API endpoint path (e.g., '/budgets/{id}/transactions')
+            data: JSON payload as dictionary
+            
+        Returns:
+            JSON response as dictionary
+            
+        Raises:
+            YNABUnauthorizedError: Invalid API token (401)
+            YNABNotFoundError: Resource not found (404)
+            YNABConflictError: Conflict - transaction outdated (409)
+            YNABRateLimitError: Rate limit exceeded (429)
+            YNABAPIError: Other API or network errors
+        """
+        headers = {
+            'Authorization': f'Bearer {self.api_token}',
+            'Content-Type': 'application/json'
+        }
+        url = f'{self.base_url}{endpoint}'
+        
+        try:
+            response = self.session.patch(url, headers=headers, json=data, timeout=30)
+            
+            if response.status_code in (200, 209):
+                return response.json()
+            elif response.status_code == 401:
+                raise YNABUnauthorizedError("Invalid YNAB API token")
+            elif response.status_code == 404:
+                raise YNABNotFoundError(f"Resource not found: {endpoint}")
+            elif response.status_code == 409:
+                raise YNABConflictError("Transaction conflict - version outdated")
+            elif response.status_code == 429:
+                retry_after = int(response.headers.get('Retry-After', 60))
+                raise YNABRateLimitError(retry_after)
+            else:
+                raise YNABAPIError(
+                    f"YNAB API error {response.status_code}: {response.text}"
+                )
+        
+        except requests.RequestException as e:
+            raise YNABAPIError(f"Network error: {str(e)}")
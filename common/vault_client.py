@@ -1,47 +1,149 @@
 """Vault client wrapper for secrets management"""
+import functools
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+
+# Keep-alive connection pool shared by every VaultClient in the process
+_session = requests.Session()
+_session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+
+
+def close_session():
+    """Close pooled Vault connections (reopened on the next request)."""
+    _session.close()
+
+
+# Token file written by `vault login`, used when VAULT_TOKEN is not set
+_VAULT_TOKEN_PATH = os.path.expanduser('~/.vault-token')
+
+# Seconds a kv_get result is reused before Vault is asked again
+VAULT_CACHE_TTL = float(os.getenv('VAULT_CACHE_TTL', '300'))
+
+# Process-wide kv_get results: full secret URL -> (monotonic read time, data)
+_secret_cache = {}
+
+
+def clear_secret_cache():
+    """Drop every cached kv_get result (e.g. after rotating secrets)."""
+    _secret_cache.clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _read_token_file():
+    """Read the Vault CLI token file once per process (None if missing or empty)"""
+    try:
+        with open(_VAULT_TOKEN_PATH, 'rb', buffering=0) as f:
+            return f.read(256).decode().strip() or None
+    except OSError:
+        return None
+
 
 class VaultClient:
     """HashiCorp Vault API client"""
     
     def __init__(self):
         self.addr = os.getenv('VAULT_ADDR', 'http://127.0.0.1:8200')
-        self.token = os.getenv('VAULT_TOKEN', 'dev-token')
+        self.token = os.getenv('VAULT_TOKEN') or _read_token_file() or 'dev-token'
         
     def is_connected(self):
         """Check if Vault is accessible"""
         try:
-            resp = requests.get(f"{self.addr}/v1/sys/health", timeout=2)
+            resp = _session.get(f"{self.addr}/v1/sys/health", timeout=2)
             return resp.status_code == 200
         except:
             return False
     
     def kv_get(self, path):
-        """Read secret from KV store (supports both KV v1 and v2)"""
+        """
+        Read secret from KV store (supports both KV v1 and v2).
+
+        Successful reads are cached process-wide for VAULT_CACHE_TTL seconds,
+        keyed by Vault address and path, so repeated lookups skip the HTTP
+        round-trip. Each call returns its own copy of the secret dict.
+        """
+        key = f"{self.addr}/v1/{path}"
+        cached = _secret_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < VAULT_CACHE_TTL:
+            return dict(cached[1])
+
+        data = self._kv_read(path)
+        if data is not None:
+            _secret_cache[key] = (time.monotonic(), dict(data))
+        return data
+
+    def kv_get_many(self, paths):
+        """
+        Read several secrets concurrently.
+
+        Args:
+            paths: Secret paths to read
+
+        Returns:
+            Dict mapping each path to its secret, None if not found, or the
+            exception raised while reading it
+        """
+        def read(path):
+            try:
+                return self.kv_get(path)
+            except Exception as e:
+                return e
+
+        if not paths:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+            return dict(zip(paths, pool.map(read, paths)))
+
+    def _kv_read(self, path):
+        """Fetch a secret from Vault, bypassing the cache"""
         headers = {"X-Vault-Token": self.token}
 
         # Try KV v2 first (path needs /data/ inserted)
         if path.startswith('secret/') and '/data/' not in path:
             v2_path = path.replace('secret/', 'secret/data/', 1)
-            resp = requests.get(f"{self.addr}/v1/{v2_path}", headers=headers)
+            resp = _session.get(f"{self.addr}/v1/{v2_path}", headers=headers)
             if resp.status_code == 200:
                 data = resp.json().get('data', {})
                 if 'data' in data:
                     return data['data']  # KV v2
 
         # Fallback to KV v1 or direct path
-        resp = requests.get(f"{self.addr}/v1/{path}", headers=headers)
+        resp = _session.get(f"{self.addr}/v1/{path}", headers=headers)
         if resp.status_code == 200:
             return resp.json().get('data', {})
         return None
     
     def kv_put(self, path, data):
-        """Write secret to KV store"""
+        """Write secret to KV store (drops any cached read of the same path)"""
         headers = {"X-Vault-Token": self.token}
-        resp = requests.post(f"{self.addr}/v1/{path}", headers=headers, json=data)
+        resp = _session.post(f"{self.addr}/v1/{path}", headers=headers, json=data)
+        _secret_cache.pop(f"{self.addr}/v1/{path}", None)
         return resp.status_code in [200, 204]
 
+    def kv_put_many(self, items):
+        """
+        Write several secrets concurrently.
+
+        Args:
+            items: Dict mapping secret path to the data to store there
+
+        Returns:
+            Dict mapping each path to True if it was stored, False otherwise
+        """
+        def write(item):
+            try:
+                return self.kv_put(*item)
+            except Exception:
+                return False
+
+        if not items:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(items)) as pool:
+            return dict(zip(items, pool.map(write, items.items())))
+
     def get_postgres_credentials(self, db_name):
         """
         Get PostgreSQL credentials from Vault.
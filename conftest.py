@@ -21,6 +21,14 @@ except FileNotFoundError:
     os.environ.setdefault('VAULT_TOKEN', 'dev-token')
 
 
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line(
+        "markers",
+        "slow: makes real Anthropic/YNAB API calls (deselect with -m \"not slow\")"
+    )
+
+
 @pytest.fixture(scope="session", autouse=True)
 def initialize_database_schema():
     """
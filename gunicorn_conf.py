@@ -0,0 +1,36 @@
+"""
+Gunicorn configuration for the YNAB Transaction Tagger web server.
+
+Runs several Uvicorn worker processes so concurrent /api/load-and-tag
+workflows are not serialized behind one process's GIL.
+
+Usage:
+    gunicorn -c gunicorn_conf.py templates.web_server:app
+
+Environment Variables (optional):
+    WEB_CONCURRENCY  - Number of worker processes (default: 2 x CPU cores + 1)
+    BIND             - Address to listen on (default: 0.0.0.0:5001)
+    LOG_LEVEL        - Log level for Gunicorn and the app (default: WARNING)
+
+Note: each worker keeps its own in-memory caches (Vault secrets, accounts,
+SOP rules) and its own SOP writer thread.
+"""
+
+import multiprocessing
+import os
+
+worker_class = 'uvicorn.workers.UvicornWorker'
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+bind = os.getenv('BIND', '0.0.0.0:5001')
+
+# load-and-tag runs the full workflow (YNAB fetch + categorization) per request
+timeout = 300
+graceful_timeout = 30
+
+# Access logging off, matching serve() in templates/web_server.py
+accesslog = None
+
+# Per-request INFO logging is noise in production; workers inherit this
+# environment, so templates/web_server.py picks up the same level
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+loglevel = os.environ['LOG_LEVEL'].lower()
@@ -13,7 +13,7 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
-from templates.web_server import app
+from templates.web_server import serve, use_uvloop
 
 # Configure logging
 logging.basicConfig(
@@ -52,7 +52,7 @@ async def run_server():
     asyncio.create_task(delayed_browser_open(host, port))
     
     # Start server
-    await app.run_task(host=host, port=port, debug=False)
+    await serve(host=host, port=port)
 
 
 async def delayed_browser_open(host: str, port: int, delay: float = 1.5):
@@ -71,6 +71,8 @@ async def delayed_browser_open(host: str, port: int, delay: float = 1.5):
 def main():
     """Main entry point"""
     try:
+        if use_uvloop():
+            logger.info('Using uvloop event loop')
         asyncio.run(run_server())
     except KeyboardInterrupt:
         logger.info('\nServer stopped by user')
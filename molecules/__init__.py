@@ -5,9 +5,18 @@ Molecules combine 2-3 atoms to create higher-level business logic.
 Each molecule orchestrates atoms to implement a specific workflow.
 """
 
-from .sop_manager import get_sop_match, update_sop_with_rule
+from .sop_manager import (
+    flush_sop_writes,
+    get_sop_match,
+    get_sop_matches_batch,
+    queue_sop_rule,
+    update_sop_with_rule,
+)
 
 __all__ = [
+    'flush_sop_writes',
     'get_sop_match',
+    'get_sop_matches_batch',
+    'queue_sop_rule',
     'update_sop_with_rule',
 ]
@@ -8,8 +8,11 @@ orchestrates the atoms to implement the complete SOP management workflow.
 Part of Layer 2: Molecules (2-3 atom combinations)
 
 Public API:
-    - get_sop_match(payee_name, rules_dict=None) -> Optional[Dict]
+    - get_sop_match(payee_name, rules_dict=None) -> Optional[Mapping]
+    - get_sop_matches_batch(payees, rules_dict=None) -> List[Optional[Mapping]]
     - update_sop_with_rule(rule_type, rule_data) -> bool
+    - queue_sop_rule(rule_type, rule_data) -> bool
+    - flush_sop_writes() -> None
 
 Pattern Matching Support:
     - exact: "Starbucks" matches "Starbucks" (case-insensitive)
@@ -25,92 +28,377 @@ Rule Types:
 """
 
 import re
+import os
+import atexit
+import functools
 import logging
-from typing import Dict, List, Any, Optional
+import queue
+import threading
+import time
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from pathlib import Path
 
 # Import atoms at module level for testability
+from tools.ynab.transaction_tagger.atoms import sop_loader
 from tools.ynab.transaction_tagger.atoms.sop_loader import load_categorization_rules
-from tools.ynab.transaction_tagger.atoms.sop_updater import append_rule_to_sop
+from tools.ynab.transaction_tagger.atoms.sop_updater import append_rule_to_sop, append_rules_to_sop
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Background SOP writer: max rules per append, and how long (seconds) to
+# wait for more rules to arrive before writing a batch
+MAX_BATCH = 50
+FLUSH_INTERVAL = 0.05
 
-def _match_pattern(payee: str, pattern: str, pattern_type: str) -> bool:
+
+# SOP file read when no rules_dict is passed (sop_loader's default)
+SOP_PATH = Path(sop_loader.__file__).parent.parent / "categorization_rules.md"
+
+
+# Sections searched by get_sop_match, in priority order
+_SECTION_ORDER = ['core_patterns', 'split_patterns', 'user_corrections', 'web_research']
+
+# _SopIndex.scan_types codes (ints, so the per-candidate dispatch in
+# match() compares small ints rather than strings)
+_SCAN_CONTAINS = 0
+_SCAN_CONTAINS_BYTES = 1
+_SCAN_REGEX = 2
+_SCAN_REGEX_UNION = 3
+
+
+def _rule_pattern(section_name: str, rule: Dict[str, Any]) -> Tuple[str, str]:
     """
-    Check if payee matches pattern using specified pattern type.
+    Resolve (pattern, pattern_type) for a rule based on its section.
     
-    Implements pattern matching logic for all 4 pattern types:
-    exact, prefix, contains, and regex. All matching is case-insensitive.
-    
-    Args:
-        payee: Payee name to test
-        pattern: Pattern string (may contain * wildcards or regex)
-        pattern_type: 'exact' | 'prefix' | 'contains' | 'regex'
+    User corrections and web research entries are always exact matches
+    on their payee field; core and split patterns carry their own type.
+    """
+    if section_name == 'user_corrections':
+        return rule.get('payee', ''), 'exact'
+    elif section_name == 'web_research':
+        return rule.get('unknown_payee', ''), 'exact'
+    else:
+        return rule.get('pattern', ''), rule.get('pattern_type', 'exact')
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_regex(pattern: str) -> Optional[re.Pattern]:
+    """
+    Compile a case-insensitive SOP regex pattern, or None if it is invalid.
     
-    Returns:
-        bool: True if match, False otherwise
+    Cached across index rebuilds: every SOP append rebuilds the index, and
+    only newly added regex patterns need compiling. Invalid patterns are
+    cached as None, so their warning is logged once.
+    """
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error as e:
+        logger.warning(f"Invalid regex pattern '{pattern}': {e}")
+        return None
+
+
+def _byte_mask(data: bytes) -> int:
+    """Return a 256-bit mask with bit b set for every byte value b in data."""
+    mask = 0
+    for byte in set(data):
+        mask |= 1 << byte
+    return mask
+
+
+class _SopIndex:
+    """
+    Pre-normalized view of a rules dict for repeated matching.
+    
+    Built once per rules dict so that lowercasing, wildcard stripping and
+    regex compilation happen at index time instead of per payee. Exact
+    patterns go into a dict keyed by the lowercased pattern, and prefix
+    patterns into a dict keyed by the stripped prefix, probed once per
+    distinct prefix length; contains and regex patterns are kept in an
+    ordered scan list. Each dict keeps the first (highest-priority)
+    position for its key.
+    
+    Rules are stored as parallel lists (struct-of-arrays) indexed by global
+    position (section priority, then file order): the scan touches only
+    the compact type/matcher lists, and the rule dict itself is fetched
+    only once a match is found. match() returns the same rule as the
+    original linear scan did.
+    
+    Rules are stored as read-only MappingProxyType views, so the matched
+    rule can be shared with callers without a defensive copy.
+    
+    Regex patterns without their own groups or inline flags are also
+    joined into one alternation with a named group per rule: a single
+    match() call finds the highest-priority of them that matches, and each
+    such rule in the scan just compares its position against that result.
+    
+    Contains patterns are bucketed by their first character, so a payee
+    only scans the patterns whose first character it contains (plus every
+    regex). Cheap prefilters then reject most of those before the real
+    comparison: patterns longer than the payee are skipped, and ASCII
+    patterns when they use a byte the payee doesn't have.
+    """
     
-    Examples:
-        >>> _match_pattern("Starbucks", "starbucks", "exact")
-        True
-        >>> _match_pattern("Starbucks Pike Place", "Starbucks*", "prefix")
-        True
-        >>> _match_pattern("Local Coffee Shop", "*coffee*", "contains")
-        True
-        >>> _match_pattern("Starbucks", "^Star.*s$", "regex")
-        True
+    def __init__(self, rules_dict: Dict[str, List[Dict[str, Any]]]):
+        # lowercased exact pattern -> position of first rule with it
+        self.exact: Dict[str, int] = {}
+        # lowercased prefix (without '*') -> position of first rule with it
+        self.prefixes: Dict[str, int] = {}
+        
+        # Non-exact patterns in priority order: position, _SCAN_* type code,
+        # and clean pattern (str/bytes) or compiled regex
+        self.scan_positions: List[int] = []
+        self.scan_types: List[int] = []
+        self.scan_matchers: List[Any] = []
+        # Prefilter data: matcher length, byte mask (contains_bytes)
+        self.scan_lengths: List[int] = []
+        self.scan_masks: List[int] = []
+        
+        # Indexed by position
+        self.sections: List[str] = []
+        self.patterns: List[str] = []
+        self.rules: List[Mapping[str, Any]] = []
+        
+        for section_name in _SECTION_ORDER:
+            for rule in rules_dict.get(section_name, []):
+                pattern, pattern_type = _rule_pattern(section_name, rule)
+                position = len(self.rules)
+                self.sections.append(section_name)
+                self.patterns.append(pattern)
+                self.rules.append(MappingProxyType(rule))
+                
+                if not pattern:
+                    continue
+                
+                pattern_lower = pattern.lower()
+                if pattern_type == 'exact':
+                    self.exact.setdefault(pattern_lower, position)
+                    continue
+                
+                if pattern_type == 'prefix':
+                    self.prefixes.setdefault(pattern_lower.rstrip('*'), position)
+                    continue
+                
+                byte_mask = 0
+                if pattern_type == 'contains':
+                    scan_type = _SCAN_CONTAINS
+                    matcher = pattern_lower.strip('*')
+                    # ASCII patterns are tested against the encoded payee (bytes
+                    # search skips str's Unicode handling); '?' is excluded since
+                    # it stands in for non-ASCII payee characters after encoding
+                    if matcher.isascii() and '?' not in matcher:
+                        scan_type = _SCAN_CONTAINS_BYTES
+                        matcher = matcher.encode('ascii')
+                        byte_mask = _byte_mask(matcher)
+                elif pattern_type == 'regex':
+                    scan_type = _SCAN_REGEX
+                    matcher = _compile_regex(pattern)
+                    if matcher is None:
+                        continue
+                else:
+                    logger.warning(f"Unknown pattern_type '{pattern_type}'")
+                    continue
+                
+                self.scan_positions.append(position)
+                self.scan_types.append(scan_type)
+                self.scan_matchers.append(matcher)
+                self.scan_lengths.append(len(matcher) if scan_type != _SCAN_REGEX else 0)
+                self.scan_masks.append(byte_mask)
+        
+        self.prefix_lengths: List[int] = sorted({len(prefix) for prefix in self.prefixes})
+        
+        # One alternation over groupless regexes, in priority order
+        self.regex_union: Optional[re.Pattern] = None
+        self.regex_group_positions: Dict[str, int] = {}
+        union_members = [
+            i for i, matcher in enumerate(self.scan_matchers)
+            if self.scan_types[i] == _SCAN_REGEX
+            and not matcher.groups and '(?' not in matcher.pattern
+        ]
+        if len(union_members) > 1:
+            try:
+                self.regex_union = re.compile(
+                    '|'.join(f"(?P<r{i}>{self.scan_matchers[i].pattern})" for i in union_members),
+                    re.IGNORECASE
+                )
+            except re.error as e:
+                # Patterns compiled individually, so this shouldn't happen
+                logger.warning(f"Failed to combine SOP regex patterns, matching individually: {e}")
+            else:
+                for i in union_members:
+                    self.scan_types[i] = _SCAN_REGEX_UNION
+                    self.regex_group_positions[f"r{i}"] = self.scan_positions[i]
+        
+        # Scan indices by first character of the contains pattern; regexes
+        # (and empty contains patterns) are candidates for every payee
+        self.scan_by_first: Dict[str, List[int]] = {}
+        self.scan_always: List[int] = []
+        for i, matcher in enumerate(self.scan_matchers):
+            if self.scan_types[i] >= _SCAN_REGEX or not matcher:
+                self.scan_always.append(i)
+                continue
+            first_char = chr(matcher[0]) if isinstance(matcher, bytes) else matcher[0]
+            self.scan_by_first.setdefault(first_char, []).append(i)
+    
+    def match(self, payee_name: str) -> Optional[int]:
+        """
+        Return the position of the highest-priority rule matching payee_name.
+        
+        Args:
+            payee_name: Non-empty payee name
+        
+        Returns:
+            Position into self.rules, or None if no rule matches
+        """
+        payee_lower = payee_name.lower()
+        payee_len = len(payee_lower)
+        payee_bytes = None  # encoded lazily, only if a bytes pattern is reached
+        payee_mask = 0
+        no_match = len(self.rules)
+        regex_hit = None  # position matched by regex_union, computed lazily
+        best = self.exact.get(payee_lower, no_match)
+        
+        # Prefix rules: one dict probe per distinct prefix length
+        prefixes = self.prefixes
+        for length in self.prefix_lengths:
+            if length > payee_len:
+                break
+            position = prefixes.get(payee_lower[:length], no_match)
+            if position < best:
+                best = position
+        
+        scan_positions = self.scan_positions
+        scan_types = self.scan_types
+        scan_matchers = self.scan_matchers
+        scan_lengths = self.scan_lengths
+        scan_masks = self.scan_masks
+        
+        # Scan candidates in priority order (scan indices follow positions)
+        scan_by_first = self.scan_by_first
+        candidates = list(self.scan_always)
+        for char in set(payee_lower):
+            bucket = scan_by_first.get(char)
+            if bucket is not None:
+                candidates.extend(bucket)
+        candidates.sort()
+        
+        # Only rules ahead of the exact/prefix hit can take priority over it
+        for i in candidates:
+            position = scan_positions[i]
+            if position >= best:
+                break
+            scan_type = scan_types[i]
+            if scan_type < _SCAN_REGEX:
+                # Contains patterns, the common case
+                if scan_lengths[i] > payee_len:
+                    continue
+                if scan_type == _SCAN_CONTAINS_BYTES:
+                    if payee_bytes is None:
+                        payee_bytes = payee_lower.encode('ascii', errors='replace')
+                        payee_mask = _byte_mask(payee_bytes)
+                    if scan_masks[i] & ~payee_mask:
+                        continue
+                    matched = scan_matchers[i] in payee_bytes
+                else:
+                    matched = scan_matchers[i] in payee_lower
+            elif scan_type == _SCAN_REGEX_UNION:
+                if regex_hit is None:
+                    union_match = self.regex_union.match(payee_name)
+                    regex_hit = (no_match if union_match is None
+                                 else self.regex_group_positions[union_match.lastgroup])
+                matched = position == regex_hit
+            else:
+                matched = scan_matchers[i].match(payee_name) is not None
+            if matched:
+                best = position
+                break
+        
+        if best == no_match:
+            logger.debug(f"No SOP match found for '{payee_name}'")
+            return None
+        
+        logger.info(f"Found SOP match for '{payee_name}' in {self.sections[best]}: {self.patterns[best]}")
+        return best
+
+
+# Most recently built index: (rules_dict, section-size fingerprint, _SopIndex).
+# Readers take a single unlocked reference load; rebuilds publish a fresh
+# tuple with one assignment and never mutate a published one.
+_last_index: Optional[Tuple[Dict[str, List[Dict[str, Any]]], Tuple[int, ...], _SopIndex]] = None
+
+
+def _get_index(rules_dict: Dict[str, List[Dict[str, Any]]]) -> _SopIndex:
     """
-    # Input validation
-    if not payee or not pattern:
-        logger.debug(f"Empty input: payee='{payee}', pattern='{pattern}'")
-        return False
+    Return the _SopIndex for rules_dict, reusing the last one if still current.
     
-    # Case-insensitive comparison
-    payee_lower = payee.lower()
-    pattern_lower = pattern.lower()
-    
-    # Pattern type logic
-    if pattern_type == 'exact':
-        result = payee_lower == pattern_lower
-        logger.debug(f"Exact match: '{payee}' == '{pattern}' → {result}")
-        return result
-    
-    elif pattern_type == 'prefix':
-        # Strip trailing * from pattern
-        clean_pattern = pattern_lower.rstrip('*')
-        result = payee_lower.startswith(clean_pattern)
-        logger.debug(f"Prefix match: '{payee}' starts with '{clean_pattern}' → {result}")
-        return result
-    
-    elif pattern_type == 'contains':
-        # Strip * from both ends
-        clean_pattern = pattern_lower.strip('*')
-        result = clean_pattern in payee_lower
-        logger.debug(f"Contains match: '{clean_pattern}' in '{payee}' → {result}")
-        return result
-    
-    elif pattern_type == 'regex':
-        # Compile and match with case-insensitive flag
-        try:
-            regex = re.compile(pattern, re.IGNORECASE)
-            result = bool(regex.match(payee))
-            logger.debug(f"Regex match: '{pattern}' matches '{payee}' → {result}")
-            return result
-        except re.error as e:
-            logger.warning(f"Invalid regex pattern '{pattern}': {e}")
-            return False
+    The cached index is keyed on the identity of rules_dict (held by strong
+    reference, so the id can't be recycled) plus the size of each section,
+    so rules appended to the dict trigger a rebuild.
+    """
+    global _last_index
+    fingerprint = tuple(len(rules_dict.get(section, ())) for section in _SECTION_ORDER)
+    cached = _last_index
+    if cached is not None and cached[0] is rules_dict and cached[1] == fingerprint:
+        return cached[2]
+    
+    index = _SopIndex(rules_dict)
+    _last_index = (rules_dict, fingerprint, index)
+    # Memoized results refer to the previous index
+    _get_sop_match_cached.cache_clear()
+    return index
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_sop_match_cached(payee_name: str, index: _SopIndex) -> Optional[int]:
+    """Memoized _SopIndex.match(); repeated payees in a batch hit the cache."""
+    return index.match(payee_name)
+
+
+def _invalidate_match_cache() -> None:
+    """Drop the cached rules, index and memoized matches after the SOP file changes."""
+    global _last_index
+    _last_index = None
+    _get_sop_match_cached.cache_clear()
+    _load_rules_cached.cache_clear()
+
+
+def _sop_file_stamp() -> Optional[Tuple[int, int]]:
+    """
+    Return (mtime_ns, size) of the SOP file, or None if it can't be stat'ed.
+    """
+    try:
+        stat = os.stat(SOP_PATH)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_rules_cached(stamp: Tuple[int, int]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Parse the SOP file once per file version.
     
-    else:
-        logger.warning(f"Unknown pattern_type '{pattern_type}'")
-        return False
+    Returning the same dict while the stamp is unchanged also lets
+    _get_index() reuse its index and memoized matches across calls.
+    Callers must not mutate the returned rules.
+    """
+    return load_categorization_rules(str(SOP_PATH))
+
+
+def _load_rules() -> Dict[str, List[Dict[str, Any]]]:
+    """Load SOP rules from SOP_PATH, reparsing only when the file changed."""
+    stamp = _sop_file_stamp()
+    if stamp is None:
+        # Missing/unreadable file: let the loader log and return {}
+        return load_categorization_rules(str(SOP_PATH))
+    return _load_rules_cached(stamp)
 
 
 def get_sop_match(
     payee_name: str,
     rules_dict: Optional[Dict[str, List[Dict[str, Any]]]] = None
-) -> Optional[Dict[str, Any]]:
+) -> Optional[Mapping[str, Any]]:
     """
     Find matching SOP rule for given payee name.
     
@@ -120,10 +408,13 @@ def get_sop_match(
     
     Args:
         payee_name: Transaction payee name to match against patterns
-        rules_dict: Optional pre-loaded rules dict (if None, loads from file)
+        rules_dict: Optional pre-loaded rules dict (if None, loads from file;
+            the parsed file is cached until its mtime or size changes)
     
     Returns:
-        Matching rule dict with all fields from SOP section, or None if no match
+        Read-only view (MappingProxyType) of the matching rule with all fields
+        from its SOP section, or None if no match. Use dict(match) for a
+        mutable copy.
         
     Pattern Matching Logic:
         - exact: payee_name == pattern (case-insensitive)
@@ -134,7 +425,7 @@ def get_sop_match(
     Example:
         >>> rules = load_categorization_rules()
         >>> match = get_sop_match("Starbucks Pike Place", rules)
-        >>> print(match)
+        >>> print(dict(match))
         {
             'pattern': 'Starbucks*',
             'category': 'Coffee Shops',
@@ -151,42 +442,92 @@ def get_sop_match(
     
     # Load rules if not provided
     if rules_dict is None:
-        rules_dict = load_categorization_rules()
+        rules_dict = _load_rules()
         
         if not rules_dict:
             logger.error("Failed to load categorization rules")
             return None
     
-    # Search sections in priority order
-    sections = ['core_patterns', 'split_patterns', 'user_corrections', 'web_research']
+    index = _get_index(rules_dict)
+    position = _get_sop_match_cached(payee_name, index)
+    return None if position is None else index.rules[position]
+
+
+def get_sop_matches_batch(
+    payees: List[str],
+    rules_dict: Optional[Dict[str, List[Dict[str, Any]]]] = None
+) -> List[Optional[Mapping[str, Any]]]:
+    """
+    Find matching SOP rules for many payee names at once.
+    
+    Equivalent to calling get_sop_match() for each payee, but loads the
+    rules and builds the match index only once for the whole batch.
+    
+    Args:
+        payees: Payee names to match (empty names yield None)
+        rules_dict: Optional pre-loaded rules dict (if None, loads from file)
+    
+    Returns:
+        List aligned with payees: read-only matching rule or None per payee
+    
+    Example:
+        >>> matches = get_sop_matches_batch(["Starbucks Pike Place", "Walmart"])
+        >>> [m['category'] if m else None for m in matches]
+        ['Coffee Shops', None]
+    """
+    if not payees:
+        return []
     
-    for section_name in sections:
-        section = rules_dict.get(section_name, [])
+    # Load rules if not provided
+    if rules_dict is None:
+        rules_dict = _load_rules()
         
-        for rule in section:
-            # Get pattern and pattern_type based on section
-            if section_name == 'user_corrections':
-                pattern = rule.get('payee', '')
-                pattern_type = 'exact'  # User corrections are exact matches
-            elif section_name == 'web_research':
-                pattern = rule.get('unknown_payee', '')
-                pattern_type = 'exact'  # Web research is exact matches
-            else:
-                pattern = rule.get('pattern', '')
-                pattern_type = rule.get('pattern_type', 'exact')
-            
-            # Check if pattern matches
-            if _match_pattern(payee_name, pattern, pattern_type):
-                logger.info(f"Found SOP match for '{payee_name}' in {section_name}: {pattern}")
-                return rule
+        if not rules_dict:
+            logger.error("Failed to load categorization rules")
+            return [None] * len(payees)
+    
+    index = _get_index(rules_dict)
+    matches = []
+    for payee in payees:
+        position = _get_sop_match_cached(payee, index) if payee else None
+        matches.append(None if position is None else index.rules[position])
+    return matches
+
+
+@functools.lru_cache(maxsize=None)
+def _section_field_order(section_header: str) -> Optional[Tuple[str, ...]]:
+    """
+    Return the markdown field order for a section header.
     
-    logger.debug(f"No SOP match found for '{payee_name}'")
+    Cached per header, since only the four SOP section headers are ever
+    formatted. None means the section is unknown and all fields are written.
+    """
+    header = section_header.lower()
+    if 'split' in header:
+        # Split pattern fields - handle allocations specially
+        return ('pattern', 'allocations', 'confidence', 'source', 'note')
+    elif 'core' in header or 'patterns' in header:
+        # Core pattern fields
+        return ('pattern', 'category', 'category_id', 'confidence', 'source')
+    elif 'correction' in header:
+        # User correction fields
+        return ('payee', 'correct_category', 'category_id', 'agent_initially_suggested', 'reasoning', 'confidence')
+    elif 'research' in header:
+        # Web research fields
+        return ('unknown_payee', 'business_type', 'category', 'category_id', 'reasoning', 'confidence')
     return None
 
 
+@functools.lru_cache(maxsize=256)
+def _display_name(field: str) -> str:
+    """Capitalize a rule field name for display ('category_id' -> 'Category Id')."""
+    return field.replace('_', ' ').title()
+
+
 def _format_rule_to_markdown(
     section_header: str,
-    rule_data: Dict[str, Any]
+    rule_data: Dict[str, Any],
+    defaults: Optional[Dict[str, Any]] = None
 ) -> str:
     """
     Format rule data into markdown bullet list format.
@@ -201,6 +542,8 @@ def _format_rule_to_markdown(
     Args:
         section_header: Markdown section header (e.g., "## Core Patterns")
         rule_data: Dict with rule fields
+        defaults: Optional fallback values for fields missing from rule_data
+            (looked up per field, so rule_data never needs to be copied)
     
     Returns:
         Formatted markdown string ready for appending to SOP file
@@ -227,33 +570,21 @@ def _format_rule_to_markdown(
         - **Category**: Groceries
         - **Confidence**: High
     """
+    if defaults is None:
+        defaults = {}
+    
     # Start with section header
     lines = [f"{section_header}"]
     
-    # Determine field order based on section type
-    if 'split' in section_header.lower():
-        # Split pattern fields - handle allocations specially
-        field_order = ['pattern', 'allocations', 'confidence', 'source', 'note']
-    elif 'core' in section_header.lower() or 'patterns' in section_header.lower():
-        # Core pattern fields
-        field_order = ['pattern', 'category', 'category_id', 'confidence', 'source']
-    elif 'correction' in section_header.lower():
-        # User correction fields
-        field_order = ['payee', 'correct_category', 'category_id', 'agent_initially_suggested', 'reasoning', 'confidence']
-    elif 'research' in section_header.lower():
-        # Web research fields
-        field_order = ['unknown_payee', 'business_type', 'category', 'category_id', 'reasoning', 'confidence']
-    else:
-        # Generic fallback: all fields
-        field_order = list(rule_data.keys())
+    # Determine field order based on section type (generic fallback: all fields)
+    field_order = _section_field_order(section_header) or list(rule_data.keys())
     
     # Format ALL fields as bullets (not indented - sop_loader requirement)
     for field in field_order:
-        if field not in rule_data or rule_data[field] is None:
+        value = rule_data.get(field, defaults.get(field))
+        if value is None:
             continue  # Skip missing/None fields
         
-        value = rule_data[field]
-        
         # Skip empty strings
         if isinstance(value, str) and not value.strip():
             continue
@@ -264,14 +595,161 @@ def _format_rule_to_markdown(
             for alloc in value:
                 lines.append(f"  * {alloc['category']}: {alloc['percentage']}%")
         else:
-            # Capitalize field name for display
-            display_name = field.replace('_', ' ').title()
-            lines.append(f"- **{display_name}**: {value}")
+            lines.append(f"- **{_display_name(field)}**: {value}")
     
     # Join with newlines and add final newline
     return '\n'.join(lines) + '\n'
 
 
+# SOP section header for each rule_type accepted by update_sop_with_rule
+_RULE_SECTION_HEADERS = {
+    'core_pattern': '## Core Patterns',
+    'split_pattern': '## Split Transaction Patterns',
+    'user_correction': '## Learned from User Corrections',
+    'web_research': '## Web Research Results'
+}
+
+# Fields rule_data must contain for each rule_type
+_RULE_REQUIRED_FIELDS = {
+    'core_pattern': ('pattern', 'category'),
+    'split_pattern': ('pattern', 'allocations'),
+    'user_correction': ('payee', 'correct_category'),
+    'web_research': ('unknown_payee', 'business_type', 'category')
+}
+
+
+def _prepare_rule(rule_type: str, rule_data: Dict[str, Any]) -> Optional[str]:
+    """
+    Validate rule_data for rule_type and format it as a markdown SOP entry.
+    
+    Args:
+        rule_type: 'core_pattern' | 'split_pattern' | 'user_correction' | 'web_research'
+        rule_data: Dict with rule fields (see update_sop_with_rule)
+    
+    Returns:
+        Formatted markdown entry, or None if validation failed
+    """
+    # Validate rule_type
+    section_header = _RULE_SECTION_HEADERS.get(rule_type)
+    if section_header is None:
+        logger.error(f"Invalid rule_type '{rule_type}'. Must be one of: {list(_RULE_SECTION_HEADERS)}")
+        return None
+    
+    # Validate required fields for each type
+    missing_fields = [f for f in _RULE_REQUIRED_FIELDS[rule_type] if f not in rule_data]
+    if missing_fields:
+        logger.error(f"Missing required fields for {rule_type}: {missing_fields}")
+        return None
+    
+    # Default values for optional fields (resolved during formatting, input is never copied)
+    defaults = {'confidence': 'High' if rule_type == 'user_correction' else 'Medium'}
+    
+    if rule_type in ('core_pattern', 'split_pattern'):
+        defaults['source'] = 'Agent'
+    
+    # Format to markdown
+    return _format_rule_to_markdown(section_header, rule_data, defaults)
+
+
+class _WriteQueue:
+    """
+    Single background writer that coalesces queued SOP rules.
+    
+    Producers put formatted rule entries and return immediately. A daemon
+    thread (started on first use) drains the queue, waiting up to
+    FLUSH_INTERVAL for more entries, and appends up to MAX_BATCH of them
+    with one append_rules_to_sop() call, i.e. one file lock and one write.
+    Once close() has run (at interpreter exit) no more entries are taken.
+    """
+    
+    _STOP = object()
+    
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+    
+    def put(self, rule_type: str, formatted_content: str) -> bool:
+        """
+        Queue a formatted rule entry for the writer thread.
+        
+        Returns:
+            True if queued, False if the queue has been closed
+        """
+        with self._lock:
+            if self._closed:
+                return False
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name='sop-writer', daemon=True
+                )
+                self._thread.start()
+            self._queue.put((rule_type, formatted_content))
+        return True
+    
+    def flush(self) -> None:
+        """Block until every queued rule has been written (or failed)."""
+        self._queue.join()
+    
+    def close(self) -> None:
+        """Flush pending rules and stop the writer thread; later puts are refused."""
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+            self._thread = None
+        if thread is None or not thread.is_alive():
+            return
+        self._queue.put(self._STOP)
+        thread.join()
+    
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            if item is self._STOP:
+                self._queue.task_done()
+                return
+            
+            # Coalesce whatever arrives within the flush window
+            batch = [item]
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            while len(batch) < MAX_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            
+            self._write(batch)
+            for _ in range(len(batch) + stop):
+                self._queue.task_done()
+    
+    def _write(self, batch: List[Tuple[str, str]]) -> None:
+        rule_types = [rule_type for rule_type, _ in batch]
+        try:
+            success = append_rules_to_sop([content for _, content in batch])
+        except Exception as e:
+            logger.error(f"Unexpected error updating SOP: {e}")
+            return
+        
+        if success:
+            _invalidate_match_cache()
+            logger.info(f"Successfully added {len(batch)} rule(s) to SOP: {rule_types}")
+        else:
+            logger.error(f"Failed to add {len(batch)} rule(s) to SOP: {rule_types}")
+
+
+_write_queue = _WriteQueue()
+atexit.register(_write_queue.close)
+
+
 def update_sop_with_rule(
     rule_type: str,
     rule_data: Dict[str, Any]
@@ -279,9 +757,10 @@ def update_sop_with_rule(
     """
     Update SOP file with new categorization rule.
     
-    Formats rule_data into markdown bullet list format and appends
-    to appropriate section in categorization_rules.md using thread-safe
-    append_rule_to_sop() atom.
+    Validates and formats rule_data into markdown bullet list format, then
+    appends it to the appropriate section in categorization_rules.md
+    before returning. Use queue_sop_rule() when the caller should not
+    wait on the file lock and write.
     
     Args:
         rule_type: Section to append to:
@@ -344,51 +823,16 @@ def update_sop_with_rule(
         >>> print(success)
         True
     """
-    # Validate rule_type
-    valid_types = ['core_pattern', 'split_pattern', 'user_correction', 'web_research']
-    if rule_type not in valid_types:
-        logger.error(f"Invalid rule_type '{rule_type}'. Must be one of: {valid_types}")
+    formatted_content = _prepare_rule(rule_type, rule_data)
+    if formatted_content is None:
         return False
     
-    # Map rule_type to section header
-    section_headers = {
-        'core_pattern': '## Core Patterns',
-        'split_pattern': '## Split Transaction Patterns',
-        'user_correction': '## Learned from User Corrections',
-        'web_research': '## Web Research Results'
-    }
-    section_header = section_headers[rule_type]
-    
-    # Validate required fields for each type
-    required_fields = {
-        'core_pattern': ['pattern', 'category'],
-        'split_pattern': ['pattern', 'allocations'],
-        'user_correction': ['payee', 'correct_category'],
-        'web_research': ['unknown_payee', 'business_type', 'category']
-    }
-    
-    missing_fields = [f for f in required_fields[rule_type] if f not in rule_data]
-    if missing_fields:
-        logger.error(f"Missing required fields for {rule_type}: {missing_fields}")
-        return False
-    
-    # Add default values for optional fields (create copy to avoid modifying input)
-    rule_data_copy = rule_data.copy()
-    
-    if 'confidence' not in rule_data_copy:
-        rule_data_copy['confidence'] = 'High' if rule_type == 'user_correction' else 'Medium'
-    
-    if 'source' not in rule_data_copy and rule_type in ['core_pattern', 'split_pattern']:
-        rule_data_copy['source'] = 'Agent'
-    
-    # Format to markdown
-    formatted_content = _format_rule_to_markdown(section_header, rule_data_copy)
-    
     # Append to SOP file
     try:
         success = append_rule_to_sop(formatted_content)
         
         if success:
+            _invalidate_match_cache()
             logger.info(f"Successfully added {rule_type} rule to SOP")
         else:
             logger.error(f"Failed to add {rule_type} rule to SOP")
@@ -398,3 +842,49 @@ def update_sop_with_rule(
     except Exception as e:
         logger.error(f"Unexpected error updating SOP: {e}")
         return False
+
+
+def queue_sop_rule(
+    rule_type: str,
+    rule_data: Dict[str, Any]
+) -> bool:
+    """
+    Queue a new categorization rule for the background SOP writer.
+    
+    Same validation and formatting as update_sop_with_rule(), but returns
+    as soon as the rule is queued. Rules queued in quick succession are
+    coalesced into a single locked write, and pending rules are flushed at
+    interpreter exit; call flush_sop_writes() to wait for them earlier.
+    Write failures are only logged by the writer, so callers that need to
+    know the rule reached the file should use update_sop_with_rule().
+    
+    Args:
+        rule_type: Section to append to (see update_sop_with_rule)
+        rule_data: Dict with rule fields (see update_sop_with_rule)
+    
+    Returns:
+        bool: True if rule was validated and queued, False if validation
+        failed or the writer has already shut down
+    """
+    formatted_content = _prepare_rule(rule_type, rule_data)
+    if formatted_content is None:
+        return False
+    
+    if not _write_queue.put(rule_type, formatted_content):
+        logger.error(f"SOP writer is shut down, {rule_type} rule not queued")
+        return False
+    return True
+
+
+def flush_sop_writes() -> None:
+    """
+    Block until every rule queued by queue_sop_rule() is written.
+    
+    Rules whose write failed are logged by the writer and are not retried.
+    
+    Example:
+        >>> queue_sop_rule('core_pattern', {'pattern': 'Trader Joe*', 'category': 'Groceries'})
+        True
+        >>> flush_sop_writes()  # rule is now in categorization_rules.md
+    """
+    _write_queue.flush()
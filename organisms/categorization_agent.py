@@ -9,27 +9,491 @@ Composes molecules and atoms to provide 3-tier categorization:
 Part of Layer 3: Organisms (Complex business logic composition)
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
+from pathlib import Path
+import asyncio
+import functools
 import logging
 import os
 import json
 import re
+import threading
 import time
+import weakref
 
 # Anthropic SDK
 import anthropic
 
+# Faster JSON parsing for Claude responses when orjson is installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 # Internal imports
 from common.vault_client import VaultClient
+from tools.ynab.transaction_tagger.atoms import sop_loader
 from tools.ynab.transaction_tagger.atoms.sop_loader import load_categorization_rules
 from tools.ynab.transaction_tagger.atoms.sop_updater import append_rule_to_sop
-from tools.ynab.transaction_tagger.atoms.api_fetch import fetch_categories
+from tools.ynab.transaction_tagger.atoms.api_fetch import fetch_category_changes
 from tools.ynab.transaction_tagger.molecules.pattern_analyzer import analyze_transaction
+from molecules.sop_manager import queue_sop_rule
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Max payees kept in each agent's Tier 3 result cache
+TIER3_CACHE_SIZE = 512
+
+# Required fields in each Claude Tier 3 decision
+TIER3_REQUIRED_FIELDS = ['category_id', 'category_name', 'confidence', 'reasoning']
+
+# Output token budget per transaction in a batched Tier 3 prompt
+TIER3_BATCH_TOKENS_PER_TXN = 256
+
+# Tier 3 models: the default, and the cheaper one tried first for easy payees
+TIER3_MODEL = "claude-sonnet-4-5-20250929"
+TIER3_FAST_MODEL = "claude-haiku-4-5-20251001"
+
+# Tier 3 prompts ask for confidence in this band, reserving the part below
+# TIER3_ESCALATE_CONFIDENCE for unsure answers; fast-model decisions below
+# it are re-asked with TIER3_MODEL
+TIER3_MIN_CONFIDENCE = 0.60
+TIER3_MAX_CONFIDENCE = 0.79
+TIER3_ESCALATE_CONFIDENCE = 0.65
+
+# Longest payee (chars) still treated as easy when there is no memo
+TIER3_FAST_MAX_PAYEE_LEN = 24
+
+# Async Tier 3 limits: max in-flight Claude requests, and request starts per minute
+ANTHROPIC_MAX_CONCURRENCY = int(os.getenv('ANTHROPIC_MAX_CONCURRENCY', '5'))
+ANTHROPIC_REQUESTS_PER_MINUTE = int(os.getenv('ANTHROPIC_REQUESTS_PER_MINUTE', '50'))
+
+# Longest server retry-after (seconds) honored before falling back to backoff
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+# SOP file shared by sop_loader/sop_updater
+SOP_PATH = Path(sop_loader.__file__).parent.parent / "categorization_rules.md"
+
+# Markdown code fence around a Claude JSON response (```json ... ```)
+_FENCE_RE = re.compile(r'^```(?:json)?\n?(.*?)\n?```$', re.DOTALL)
+
+# Whitespace and an optional opening fence before a streamed JSON body
+_RESPONSE_LEAD_RE = re.compile(r'\s*(?:```(?:json)?\s*)?')
+
+
+def _check_response_head(head: str, expect: str) -> bool:
+    """
+    Check the start of a streamed Claude response against the expected JSON.
+    
+    Args:
+        head: Response text received so far
+        expect: Expected first JSON character ('{' or '[')
+    
+    Returns:
+        True once the body is confirmed to start with expect, False while
+        there isn't enough text to tell (only whitespace/partial fence yet)
+    
+    Raises:
+        ValueError: If the response has drifted off-spec (e.g. prose)
+    """
+    rest = head[_RESPONSE_LEAD_RE.match(head).end():]
+    if not rest or '```json'.startswith(rest) or 'json'.startswith(rest):
+        return False
+    if rest[0] != expect:
+        raise ValueError(f"Claude response is not JSON (starts with {head[:40]!r})")
+    return True
+
+# YNAB categories: how often to ask for a delta, and the full-refetch safety net
+CATEGORY_REFRESH_INTERVAL = timedelta(seconds=60)
+CATEGORY_FULL_REFRESH_INTERVAL = timedelta(hours=1)
+
+# Phase 1 mock web search: (keywords, response), in priority order
+MOCK_WEB_SEARCH_RESPONSES = [
+    (('starbucks', 'coffee'), "Starbucks is a multinational coffee shop chain."),
+    (('whole foods', 'grocery'), "Whole Foods is a grocery store chain specializing in organic products."),
+    (('amazon',), "Amazon is an online retail platform selling various products."),
+    (('shell', 'chevron', 'gas'), "Gas station for vehicle fuel."),
+]
+
+
+def _build_mock_keyword_index(
+    responses: List[Tuple[Tuple[str, ...], str]]
+) -> Tuple[Dict[str, int], re.Pattern]:
+    """
+    Build the keyword lookup used by _mock_web_search.
+    
+    Returns a keyword -> response index map (first listing wins) and one
+    regex that finds every keyword occurrence in a single scan, including
+    overlapping ones (zero-width lookahead). Alternatives are listed in
+    priority order, so the best keyword starting at each position is the
+    one reported.
+    """
+    priorities: Dict[str, int] = {}
+    for priority, (keywords, _) in enumerate(responses):
+        for keyword in keywords:
+            priorities.setdefault(keyword, priority)
+    
+    ordered = sorted(priorities, key=priorities.get)
+    pattern = re.compile('(?=(' + '|'.join(re.escape(k) for k in ordered) + '))')
+    return priorities, pattern
+
+
+_MOCK_KEYWORD_PRIORITY, _MOCK_KEYWORD_RE = _build_mock_keyword_index(MOCK_WEB_SEARCH_RESPONSES)
+
+
+def _mock_search_priority(payee_lower: str) -> Optional[int]:
+    """
+    Return the MOCK_WEB_SEARCH_RESPONSES index for a lowercased payee.
+    
+    The highest-priority keyword anywhere in the payee wins; None if no
+    keyword occurs.
+    """
+    best = None
+    for match in _MOCK_KEYWORD_RE.finditer(payee_lower):
+        priority = _MOCK_KEYWORD_PRIORITY[match.group(1)]
+        if best is None or priority < best:
+            best = priority
+            if best == 0:
+                break
+    return best
+
+
+# Tier 1 confidence per SOP pattern type (also the match precedence order)
+SOP_MATCH_CONFIDENCE = {
+    'exact': 1.0,
+    'prefix': 0.95,
+    'contains': 0.92,
+    'regex': 0.90,
+}
+
+
+def _normalize_sop_patterns(core_patterns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Precompute per-rule matching fields for SOP core patterns at load time.
+    
+    Adds to each rule dict (in place):
+        - 'pattern_lower': lowercased pattern
+        - 'pattern_prefix': lowercased pattern with trailing '*' removed
+        - 'pattern_contains': lowercased pattern with surrounding '*' removed
+        - '_compiled': case-insensitive compiled regex (regex rules only)
+    
+    Regex rules that fail to compile are dropped here, so Tier 1 never
+    has to handle re.error per transaction.
+    
+    Args:
+        core_patterns: 'core_patterns' section from load_categorization_rules()
+    
+    Returns:
+        Valid, enriched rules in their original order
+    """
+    normalized = []
+    for rule in core_patterns:
+        pattern = rule.get('pattern', '')
+        pattern_lower = pattern.lower()
+        rule['pattern_lower'] = pattern_lower
+        rule['pattern_prefix'] = pattern_lower.rstrip('*')
+        rule['pattern_contains'] = pattern_lower.strip('*')
+        
+        if rule.get('pattern_type', 'exact') == 'regex':
+            try:
+                rule['_compiled'] = re.compile(pattern, re.IGNORECASE)
+            except re.error as e:
+                logger.error(f"Dropping SOP rule with invalid regex pattern: {pattern} - {e}")
+                continue
+        
+        normalized.append(rule)
+    
+    return normalized
+
+
+def _compile_sop_index(core_patterns: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Precompile SOP core patterns into lookup structures for Tier 1.
+    
+    Builds, once per SOP load:
+        - 'exact': dict of lowercased pattern -> entry
+        - 'prefix': dict of lowercased prefix -> entry, plus the distinct
+          prefix lengths so a payee needs one dict probe per length
+        - 'regex': a single compiled alternation covering contains and
+          regex patterns, one named group per rule (None if no patterns)
+        - 'group_to_rule': entry for each named group, by group name
+        - 'fallback_regex': regexes that can't join the alternation (they
+          use their own groups or inline flags), checked individually
+    
+    Each entry is (file_order, rule, pattern_type, pattern_lower). Every
+    alternative is a lookahead anchored at the start of the payee, so the
+    alternation reports the first listed rule that matches anywhere,
+    not the leftmost match in the payee.
+    
+    Args:
+        core_patterns: Rules already enriched by _normalize_sop_patterns()
+    
+    Returns:
+        Index dict consumed by _match_sop_index()
+    """
+    exact: Dict[str, tuple] = {}
+    prefix: Dict[str, tuple] = {}
+    contains_alternatives = []
+    regex_alternatives = []
+    group_to_rule: Dict[str, tuple] = {}
+    fallback_regex = []
+    
+    for order, rule in enumerate(core_patterns):
+        pattern = rule.get('pattern', '')
+        pattern_type = rule.get('pattern_type', 'exact')
+        entry = (order, rule, pattern_type, rule['pattern_lower'])
+        
+        if pattern_type == 'exact':
+            exact.setdefault(rule['pattern_lower'], entry)
+        elif pattern_type == 'prefix':
+            prefix.setdefault(rule['pattern_prefix'], entry)
+        elif pattern_type == 'contains':
+            group = f"r{order}"
+            group_to_rule[group] = entry
+            contains_alternatives.append(
+                f"(?=[\\s\\S]*?(?P<{group}>{re.escape(rule['pattern_contains'])}))"
+            )
+        elif pattern_type == 'regex':
+            compiled = rule['_compiled']
+            if compiled.groups or '(?' in pattern:
+                fallback_regex.append((compiled, entry))
+                continue
+            
+            group = f"r{order}"
+            group_to_rule[group] = entry
+            regex_alternatives.append(f"(?=[\\s\\S]*?(?P<{group}>{pattern}))")
+    
+    # Contains alternatives first: contains outranks regex
+    alternatives = contains_alternatives + regex_alternatives
+    combined = None
+    if alternatives:
+        try:
+            combined = re.compile('|'.join(alternatives), re.IGNORECASE)
+        except re.error as e:
+            # Should not happen (patterns compiled individually); keep Tier 1 working
+            logger.error(f"Failed to compile combined SOP regex, using per-rule matching: {e}")
+            for group, entry in group_to_rule.items():
+                if entry[2] == 'regex':
+                    fallback_regex.append((entry[1]['_compiled'], entry))
+                else:
+                    fallback_regex.append((re.compile(re.escape(entry[1]['pattern_contains'])), entry))
+            fallback_regex.sort(key=lambda item: (item[1][2] != 'contains', item[1][0]))
+            group_to_rule = {}
+    
+    return {
+        'exact': exact,
+        'prefix': prefix,
+        'prefix_lengths': sorted({len(p) for p in prefix}),
+        'regex': combined,
+        'group_to_rule': group_to_rule,
+        'fallback_regex': fallback_regex,
+    }
+
+
+def _match_sop_index(index: Dict[str, Any], payee: str) -> Optional[tuple]:
+    """
+    Look up a lowercased payee in a compiled SOP index.
+    
+    Precedence: exact > prefix > contains > regex; within a pattern type,
+    the rule listed first in the SOP file wins.
+    
+    Args:
+        index: Index from _compile_sop_index()
+        payee: Lowercased payee name
+    
+    Returns:
+        Matching (file_order, rule, pattern_type, pattern_lower) entry, or None
+    """
+    # 1. Exact: one dict probe
+    entry = index['exact'].get(payee)
+    if entry is not None:
+        return entry
+    
+    # 2. Prefix: one dict probe per distinct prefix length
+    prefix = index['prefix']
+    candidates = [
+        prefix[payee[:length]]
+        for length in index['prefix_lengths']
+        if length <= len(payee) and payee[:length] in prefix
+    ]
+    if candidates:
+        return min(candidates, key=lambda candidate: candidate[0])
+    
+    # 3. Contains + regex: one scan of the combined alternation
+    best = None
+    if index['regex'] is not None:
+        match = index['regex'].match(payee)
+        if match is not None:
+            best = index['group_to_rule'][match.lastgroup]
+            if best[2] == 'contains':
+                return best
+    
+    # 4. Regexes that couldn't join the alternation
+    for compiled, entry in index['fallback_regex']:
+        if best is not None and entry[0] > best[0]:
+            break
+        if compiled.search(payee):
+            return entry
+    
+    return best
+
+
+def _tier2_lookup(payee_name: str, amount_bucket: Optional[int]) -> Optional[Dict[str, Any]]:
+    """
+    Tier 2 historical lookup for a payee and amount bucket.
+    
+    Batch callers memoize this per batch (see _categorize_local), keyed by
+    the exact payee name (the historical SQL match is case-sensitive) and
+    the amount in whole currency units. Callers must copy the returned
+    dict before adding per-transaction fields.
+    
+    Args:
+        payee_name: Payee name as it appears on the transaction
+        amount_bucket: amount // 1000 (milliunits to units), or None
+    
+    Returns:
+        analyze_transaction() result, or None if no historical match
+    """
+    amount = None if amount_bucket is None else amount_bucket * 1000
+    return analyze_transaction({
+        'id': 'tier2-lookup',
+        'payee_name': payee_name,
+        'amount': amount
+    })
+
+
+def _sop_file_stamp() -> Optional[Tuple[int, int]]:
+    """
+    Return (mtime_ns, size) of the SOP file, or None if it can't be stat'ed.
+    """
+    try:
+        stat = os.stat(SOP_PATH)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_sop_cached(stamp: Optional[Tuple[int, int]]) -> Tuple[Dict, Dict]:
+    """
+    Load parsed SOP rules and compiled Tier 1 index for a SOP file stamp.
+    
+    Process-wide: agents for different budgets read the same SOP file,
+    so they share one parse per file version. A new stamp (the file
+    changed) is simply a new cache key.
+    
+    Args:
+        stamp: SOP file stamp from _sop_file_stamp() (None if unreadable)
+    
+    Returns:
+        Tuple of (rules dict, index from _compile_sop_index)
+    """
+    logger.info("Loading SOP rules from file")
+    rules = load_categorization_rules(str(SOP_PATH))
+    
+    if not rules:
+        logger.warning("No SOP rules loaded, empty dict")
+        rules = {
+            'core_patterns': [],
+            'split_patterns': [],
+            'user_corrections': [],
+            'web_research': []
+        }
+    
+    rules['core_patterns'] = _normalize_sop_patterns(rules.get('core_patterns', []))
+    index = _compile_sop_index(rules['core_patterns'])
+    
+    logger.info(f"Loaded {len(rules['core_patterns'])} core patterns")
+    return rules, index
+
+
+def _retry_wait_seconds(error: Exception, attempt: int) -> float:
+    """
+    Seconds to wait before retrying a failed Claude call.
+    
+    Honors the server's retry-after header on rate limit responses, up to
+    MAX_RETRY_AFTER_SECONDS; otherwise (missing, bogus or longer header)
+    uses exponential backoff (1s, 2s, 4s, ...).
+    
+    Args:
+        error: RateLimitError or APIConnectionError from the Anthropic SDK
+        attempt: Zero-based attempt number that failed
+    
+    Returns:
+        Wait time in seconds
+    """
+    backoff = 2 ** attempt
+    if isinstance(error, anthropic.RateLimitError):
+        try:
+            retry_after = float(error.response.headers.get('retry-after'))
+        except (TypeError, ValueError):
+            return backoff
+        # Negated so inf/nan also fall back to backoff
+        if not retry_after <= MAX_RETRY_AFTER_SECONDS:
+            return backoff
+        return max(0.0, retry_after)
+    return backoff
+
+
+def _retry_reason(error: Exception) -> str:
+    """Short log label for a retryable Claude API error."""
+    if isinstance(error, anthropic.RateLimitError):
+        return "Rate limit hit"
+    return "Connection error"
+
+
+# (epoch second, ISO 8601 timestamp) last produced by _now_iso()
+_now_iso_cache: Tuple[int, str] = (0, '')
+
+
+def _now_iso() -> str:
+    """
+    Current UTC time as ISO 8601, reused for the rest of the wall-clock second.
+    
+    Result timestamps are informational; sharing one per second avoids a
+    datetime/timezone format per result in tight categorization loops.
+    """
+    global _now_iso_cache
+    now = time.time()
+    second = int(now)
+    cached_second, cached = _now_iso_cache
+    if cached_second == second:
+        return cached
+    
+    timestamp = datetime.fromtimestamp(now, timezone.utc).isoformat()
+    _now_iso_cache = (second, timestamp)
+    return timestamp
+
+
+class _RequestPacer:
+    """
+    Async limiter that spaces request starts evenly to stay under a rate.
+    
+    Proactively paces Claude requests (rather than reacting to 429s) by
+    allowing one request start every 60/requests_per_minute seconds.
+    Bound to the event loop it is first used on; create one per run.
+    """
+    
+    def __init__(self, requests_per_minute: int):
+        self._interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def wait(self) -> None:
+        """Sleep until the next request start slot is available."""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
 
 class CategorizationAgent:
     """
@@ -39,6 +503,44 @@ class CategorizationAgent:
     fallback tiers for resilience.
     """
     
+    # Shared agents per budget_id (see get()); dropped once nothing references them
+    _instances: "weakref.WeakValueDictionary[str, CategorizationAgent]" = weakref.WeakValueDictionary()
+    _instances_lock = threading.Lock()
+    
+    @classmethod
+    def get(cls, budget_id: str) -> 'CategorizationAgent':
+        """
+        Return the shared agent for a budget, creating it on first use.
+        
+        Reusing one agent keeps its SOP, category and Anthropic client
+        setup warm across callers (e.g. RecommendationEngine instances in
+        a long-running worker) instead of redoing it per instance.
+        
+        Args:
+            budget_id: YNAB budget UUID
+        
+        Returns:
+            CategorizationAgent shared by all callers for budget_id
+        
+        Raises:
+            ValueError: If budget_id invalid or Anthropic API key missing
+        
+        Example:
+            >>> agent = CategorizationAgent.get('budget-123')
+            >>> agent is CategorizationAgent.get('budget-123')
+            True
+        """
+        with cls._instances_lock:
+            agent = cls._instances.get(budget_id)
+        if agent is not None:
+            return agent
+        
+        # Build outside the lock (Vault lookups, Anthropic client); if two
+        # callers race, setdefault keeps the first agent registered
+        agent = cls(budget_id)
+        with cls._instances_lock:
+            return cls._instances.setdefault(budget_id, agent)
+    
     def __init__(self, budget_id: str):
         """
         Initialize agent with YNAB budget context.
@@ -54,13 +556,22 @@ class CategorizationAgent:
         
         self.budget_id = budget_id
         
-        # Initialize Anthropic client
+        # Initialize Anthropic client (async client created on first async use)
         self.anthropic_client = self._init_anthropic()
+        self._async_anthropic_client = None
         
         # Lazy-loaded caches
         self.sop_rules = None  # Loaded on first use
+        self._sop_index = None  # Compiled Tier 1 lookup, built with sop_rules
+        self._sop_stamp = None  # SOP file (mtime_ns, size) sop_rules reflects
         self.ynab_categories = None  # Loaded on first use
-        self.categories_cached_at = None  # Timestamp for cache TTL
+        self.categories_cached_at = None  # When categories were last confirmed current
+        self._categories_server_knowledge = None  # YNAB server_knowledge for delta fetches
+        self._categories_full_fetch_at = None  # Timestamp of last full category fetch
+        self._tier3_prompt_prefix = None  # Static Tier 3 prompt head, see _get_tier3_prompt_prefix
+        self._tier3_prompt_categories = None  # Categories list the prefix was rendered from
+        self._tier3_cache: "OrderedDict[str, Dict]" = OrderedDict()  # payee.lower() -> Tier 3 result (LRU)
+        self._tier3_cache_lock = threading.Lock()  # Agent is shared across threads (see get())
         
         logger.info(f"CategorizationAgent initialized for budget {budget_id}")
     
@@ -140,8 +651,11 @@ class CategorizationAgent:
         txn_id = transaction['id']
         logger.info(f"Categorizing transaction {txn_id}")
         
+        # Lowercased once, shared by Tier 1 and the Tier 3 cache
+        payee_lower = transaction['payee_name'].lower()
+        
         # Tier 1: SOP Rules
-        result = self._tier1_sop_match(transaction)
+        result = self._tier1_sop_match(transaction, payee_lower)
         if result:
             logger.info(f"Tier 1 match: {result['category_name']} (confidence: {result['confidence']:.2%})")
             return result
@@ -153,10 +667,122 @@ class CategorizationAgent:
             return result
         
         # Tier 3: Research + Reasoning
-        result = self._tier3_research_and_reasoning(transaction)
+        result = self._tier3_research_and_reasoning(transaction, payee_lower)
         logger.info(f"Tier 3 result: {result['category_name']} (confidence: {result['confidence']:.2%})")
         return result
     
+    def categorize_transactions(
+        self,
+        transactions: List[Dict[str, Any]],
+        batch_size: int = 20
+    ) -> List[Dict[str, Any]]:
+        """
+        Categorize many transactions, batching Tier 3 Claude calls.
+        
+        Runs Tier 1 and Tier 2 per transaction, then sends the remaining
+        transactions to Claude in groups of batch_size, one request per
+        group (category list and instructions are sent once per group).
+        
+        Args:
+            transactions: List of transaction dicts (see categorize_transaction)
+            batch_size: Max transactions per Tier 3 Claude request (default: 20).
+                Smaller batches trade throughput for per-item answer quality.
+        
+        Returns:
+            List of categorization result dicts, aligned with transactions
+        
+        Raises:
+            ValueError: If any transaction invalid or batch_size < 1
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        
+        for transaction in transactions:
+            if not self._validate_transaction(transaction):
+                raise ValueError("Invalid transaction format")
+        
+        logger.info(f"Categorizing batch of {len(transactions)} transactions")
+        
+        results, tier3_queue, duplicates = self._categorize_local(transactions)
+        
+        # Tier 3 in groups of batch_size
+        for start in range(0, len(tier3_queue), batch_size):
+            chunk = tier3_queue[start:start + batch_size]
+            chunk_txns = [transactions[i] for i in chunk]
+            
+            if len(chunk_txns) == 1:
+                chunk_results = [self._tier3_research_and_reasoning(chunk_txns[0])]
+            else:
+                chunk_results = self._tier3_research_batch(chunk_txns)
+            
+            for i, result in zip(chunk, chunk_results):
+                results[i] = result
+        
+        for i, leader in duplicates:
+            results[i] = self._reuse_tier3_result(results[leader], transactions[i])
+        
+        return results
+    
+    async def acategorize_transactions(
+        self,
+        transactions: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Categorize many transactions, running Tier 3 Claude calls concurrently.
+        
+        Tier 1 and Tier 2 (file and database bound) run in a worker thread;
+        the remaining transactions each get their own Claude request, with
+        at most max_concurrency in flight and request starts paced to
+        ANTHROPIC_REQUESTS_PER_MINUTE.
+        
+        Args:
+            transactions: List of transaction dicts (see categorize_transaction)
+            max_concurrency: Max in-flight Claude requests
+                (default: ANTHROPIC_MAX_CONCURRENCY env var, 5)
+        
+        Returns:
+            List of categorization result dicts, aligned with transactions
+        
+        Raises:
+            ValueError: If any transaction invalid
+        """
+        for transaction in transactions:
+            if not self._validate_transaction(transaction):
+                raise ValueError("Invalid transaction format")
+        
+        logger.info(f"Categorizing batch of {len(transactions)} transactions (async)")
+        
+        results, tier3_queue, duplicates = await asyncio.to_thread(
+            self._categorize_local, transactions
+        )
+        if not tier3_queue:
+            return results
+        
+        categories = await asyncio.to_thread(self._load_ynab_categories)
+        
+        semaphore = asyncio.Semaphore(max_concurrency or ANTHROPIC_MAX_CONCURRENCY)
+        pacer = _RequestPacer(ANTHROPIC_REQUESTS_PER_MINUTE)
+        
+        async def research(transaction: Dict[str, Any]) -> Dict[str, Any]:
+            if not categories:
+                logger.error("No YNAB categories available for Tier 3")
+                return self._manual_review_response(transaction['id'], "Categories unavailable")
+            async with semaphore:
+                await pacer.wait()
+                return await self._atier3_research_and_reasoning(transaction, categories)
+        
+        tier3_results = await asyncio.gather(
+            *(research(transactions[i]) for i in tier3_queue)
+        )
+        for i, result in zip(tier3_queue, tier3_results):
+            results[i] = result
+        
+        for i, leader in duplicates:
+            results[i] = self._reuse_tier3_result(results[leader], transactions[i])
+        
+        return results
+    
     def learn_from_correction(
         self,
         transaction_id: str,
@@ -202,9 +828,11 @@ class CategorizationAgent:
             success = append_rule_to_sop(rule_content)
             
             if success:
+                # The append changes the SOP file stamp, so the next
+                # _load_sop_rules() reparses and picks the correction up
                 logger.info(f"Learned correction: {payee_name} → {correct_category_name}")
-                # Invalidate SOP cache to force reload
-                self.sop_rules = None
+                with self._tier3_cache_lock:
+                    self._tier3_cache.pop(payee_name.lower(), None)
             else:
                 logger.error("Failed to append correction to SOP")
             
@@ -236,37 +864,182 @@ class CategorizationAgent:
         
         return True
     
+    def _categorize_local(
+        self,
+        transactions: List[Dict[str, Any]]
+    ) -> Tuple[List[Optional[Dict[str, Any]]], List[int], List[Tuple[int, int]]]:
+        """
+        Run Tier 1, Tier 2 and the Tier 3 result cache over a batch.
+        
+        Payees are lowercased once here and shared by every step.
+        
+        Args:
+            transactions: Validated transaction dicts
+        
+        Returns:
+            Tuple of (results aligned with transactions, None where unresolved;
+            indices that still need Tier 3, one per distinct payee;
+            (index, leader index) pairs whose Tier 3 result is copied
+            from the leader, see _split_duplicate_payees)
+        """
+        # One timestamp for every result resolved locally in this batch
+        timestamp = _now_iso()
+        payees_lower = [transaction['payee_name'].lower() for transaction in transactions]
+        
+        results: List[Optional[Dict[str, Any]]] = self._tier1_sop_match_batch(
+            transactions, timestamp, payees_lower
+        )
+        tier3_queue = []
+        # Tier 2 lookups for this batch only, so repeated payees hit the
+        # database once while new history is picked up by the next batch
+        tier2_memo: Dict[Tuple[str, Optional[int]], Optional[Dict[str, Any]]] = {}
+        
+        for i, transaction in enumerate(transactions):
+            if results[i] is not None:
+                continue
+            
+            results[i] = self._tier2_historical_match(transaction, timestamp, tier2_memo)
+            if results[i] is None:
+                results[i] = self._tier3_cache_get(transaction, timestamp, payees_lower[i])
+            if results[i] is None:
+                tier3_queue.append(i)
+        
+        logger.info(
+            f"Batch Tier 1/2 resolved {len(transactions) - len(tier3_queue)}, "
+            f"{len(tier3_queue)} sent to Tier 3"
+        )
+        tier3_queue, duplicates = self._split_duplicate_payees(payees_lower, tier3_queue)
+        return results, tier3_queue, duplicates
+    
+    def _split_duplicate_payees(
+        self,
+        payees_lower: List[str],
+        tier3_queue: List[int]
+    ) -> Tuple[List[int], List[Tuple[int, int]]]:
+        """
+        Keep one Tier 3 request per distinct payee in a batch.
+        
+        Args:
+            payees_lower: Lowercased payee of each batch transaction
+            tier3_queue: Indices of transactions that need Tier 3
+        
+        Returns:
+            Tuple of (indices to research, first occurrence of each payee;
+            (index, leader index) pairs to copy the leader's result to)
+        """
+        leaders: Dict[str, int] = {}
+        queue = []
+        duplicates = []
+        for i in tier3_queue:
+            payee = payees_lower[i]
+            if payee in leaders:
+                duplicates.append((i, leaders[payee]))
+            else:
+                leaders[payee] = i
+                queue.append(i)
+        
+        if duplicates:
+            logger.info(f"Tier 3: {len(duplicates)} repeated payees reuse another transaction's result")
+        return queue, duplicates
+    
+    def _tier3_cache_get(
+        self,
+        transaction: Dict,
+        timestamp: Optional[str] = None,
+        payee_lower: Optional[str] = None
+    ) -> Optional[Dict]:
+        """
+        Look up a previous Tier 3 result for the transaction's payee.
+        
+        Args:
+            transaction: Transaction dict
+            timestamp: Result timestamp to use (default: _now_iso())
+            payee_lower: Already-lowercased payee name, if the caller has it
+        
+        Returns:
+            Copy of the cached result for this transaction, or None
+        """
+        key = payee_lower or transaction['payee_name'].lower()
+        with self._tier3_cache_lock:
+            cached = self._tier3_cache.get(key)
+            if cached is None:
+                return None
+            self._tier3_cache.move_to_end(key)
+        
+        logger.debug(f"Tier 3 cache hit for {transaction['payee_name']}")
+        return self._reuse_tier3_result(cached, transaction, timestamp)
+    
+    def _tier3_cache_put(self, transaction: Dict, result: Dict) -> None:
+        """
+        Remember a successful Tier 3 result for the transaction's payee.
+        
+        Args:
+            transaction: Transaction the result belongs to
+            result: Finalized Tier 3 result
+        """
+        key = transaction['payee_name'].lower()
+        entry = dict(result)
+        with self._tier3_cache_lock:
+            self._tier3_cache[key] = entry
+            self._tier3_cache.move_to_end(key)
+            if len(self._tier3_cache) > TIER3_CACHE_SIZE:
+                self._tier3_cache.popitem(last=False)
+    
+    def _reuse_tier3_result(
+        self,
+        result: Dict,
+        transaction: Dict,
+        timestamp: Optional[str] = None
+    ) -> Dict:
+        """
+        Copy a Tier 3 result for another transaction with the same payee.
+        
+        Args:
+            result: Result produced for an earlier transaction
+            transaction: Transaction to attach the copy to
+            timestamp: Result timestamp to use (default: _now_iso())
+        
+        Returns:
+            New result dict with this transaction's ID and a fresh timestamp
+        """
+        reused = dict(result)
+        reused['transaction_id'] = transaction['id']
+        reused['timestamp'] = timestamp or _now_iso()
+        return reused
+    
     def _load_sop_rules(self) -> Dict:
         """
-        Lazy-load SOP rules from markdown file with caching.
+        Load SOP rules with an mtime-guarded cache.
+        
+        Cache layers, cheapest first:
+        1. This agent's rules, reused while the SOP file's (mtime, size)
+           stamp is unchanged
+        2. Process-wide _load_sop_cached() entry for that stamp, shared by
+           every agent (and budget) in the process
+        3. Full markdown parse (inside _load_sop_cached)
         
         Returns:
             Dict with core_patterns, split_patterns, user_corrections, web_research
         """
-        if self.sop_rules is not None:
+        stamp = _sop_file_stamp()
+        if self.sop_rules is not None and stamp == self._sop_stamp:
             logger.debug("Using cached SOP rules")
             return self.sop_rules
         
-        logger.info("Loading SOP rules from file")
-        self.sop_rules = load_categorization_rules()
-        
-        if not self.sop_rules:
-            logger.warning("No SOP rules loaded, empty dict")
-            self.sop_rules = {
-                'core_patterns': [],
-                'split_patterns': [],
-                'user_corrections': [],
-                'web_research': []
-            }
-        
-        logger.info(f"Loaded {len(self.sop_rules.get('core_patterns', []))} core patterns")
+        self.sop_rules, self._sop_index = _load_sop_cached(stamp)
+        self._sop_stamp = stamp
         return self.sop_rules
     
-    def _tier1_sop_match(self, transaction: Dict) -> Optional[Dict]:
+    def _tier1_sop_match(
+        self,
+        transaction: Dict,
+        payee_lower: Optional[str] = None
+    ) -> Optional[Dict]:
         """
         Tier 1: Match transaction against SOP rules.
         
-        Implements pattern matching with precedence:
+        Implements pattern matching with precedence (via the compiled
+        SOP index, see _compile_sop_index):
         1. exact (confidence: 1.0)
         2. prefix (confidence: 0.95)
         3. contains (confidence: 0.92)
@@ -274,78 +1047,141 @@ class CategorizationAgent:
         
         Args:
             transaction: Transaction dict
+            payee_lower: Already-lowercased payee name, if the caller has it
         
         Returns:
             Match result dict or None if no match
         """
-        # Load SOP rules (cached)
-        rules = self._load_sop_rules()
+        # Load SOP rules (cached, compiles self._sop_index)
+        self._load_sop_rules()
         
-        payee = transaction['payee_name'].lower()
+        payee = payee_lower or transaction['payee_name'].lower()
         txn_id = transaction['id']
         
-        # Check core_patterns section
-        for rule in rules.get('core_patterns', []):
-            pattern = rule.get('pattern', '').lower()
-            pattern_type = rule.get('pattern_type', 'exact')
-            
-            matched = False
-            confidence = 1.0
-            
-            if pattern_type == 'exact':
-                matched = (payee == pattern)
-                confidence = 1.0
-            elif pattern_type == 'prefix':
-                matched = payee.startswith(pattern.rstrip('*'))
-                confidence = 0.95
-            elif pattern_type == 'contains':
-                matched = pattern.strip('*') in payee
-                confidence = 0.92
-            elif pattern_type == 'regex':
-                try:
-                    matched = bool(re.search(pattern, payee))
-                    confidence = 0.90
-                except re.error as e:
-                    logger.error(f"Invalid regex pattern: {pattern} - {e}")
-                    continue
+        entry = _match_sop_index(self._sop_index, payee)
+        if entry is None:
+            logger.debug(f"No SOP match for {payee}")
+            return None
+        
+        logger.debug(f"SOP match: {entry[3]} ({entry[2]}) for {payee}")
+        return self._sop_match_result(entry, txn_id)
+    
+    def _tier1_sop_match_batch(
+        self,
+        transactions: List[Dict],
+        timestamp: Optional[str] = None,
+        payees_lower: Optional[List[str]] = None
+    ) -> List[Optional[Dict]]:
+        """
+        Tier 1 over a batch of transactions.
+        
+        Payees are lowercased once and each distinct payee is looked up in
+        the compiled SOP index once, so batches with repeated merchants do
+        one index lookup per merchant rather than per transaction.
+        
+        Args:
+            transactions: Validated transaction dicts
+            timestamp: Result timestamp shared by the batch (default: _now_iso())
+            payees_lower: Lowercased payee per transaction, if the caller has them
+        
+        Returns:
+            Match result dicts (or None) aligned with transactions
+        """
+        self._load_sop_rules()
+        timestamp = timestamp or _now_iso()
+        
+        matches: Dict[str, Optional[tuple]] = {}
+        results: List[Optional[Dict]] = []
+        if payees_lower is None:
+            payees_lower = [transaction['payee_name'].lower() for transaction in transactions]
+        
+        for transaction, payee in zip(transactions, payees_lower):
+            if payee not in matches:
+                matches[payee] = _match_sop_index(self._sop_index, payee)
             
-            if matched:
-                logger.debug(f"SOP match: {pattern} ({pattern_type}) for {payee}")
-                return {
-                    'transaction_id': txn_id,
-                    'type': 'single',
-                    'category_id': rule.get('category_id', 'unknown'),
-                    'category_name': rule.get('category', 'Uncategorized'),
-                    'confidence': confidence,
-                    'tier': 'sop',
-                    'method': pattern_type,
-                    'reasoning': f"SOP rule match: '{pattern}' ({pattern_type})",
-                    'timestamp': datetime.now(timezone.utc).isoformat()
-                }
-        
-        logger.debug(f"No SOP match for {payee}")
-        return None
+            entry = matches[payee]
+            results.append(
+                None if entry is None else self._sop_match_result(entry, transaction['id'], timestamp)
+            )
+        
+        logger.debug(f"Tier 1 batch: {len(matches)} distinct payees for {len(transactions)} transactions")
+        return results
+    
+    def _sop_match_result(
+        self,
+        entry: tuple,
+        txn_id: str,
+        timestamp: Optional[str] = None
+    ) -> Dict:
+        """
+        Build the Tier 1 result for a SOP index entry.
+        
+        Args:
+            entry: (file_order, rule, pattern_type, pattern_lower) from _match_sop_index
+            txn_id: Transaction ID
+            timestamp: Result timestamp (default: _now_iso())
+        
+        Returns:
+            Match result dict
+        """
+        _, rule, pattern_type, pattern = entry
+        return {
+            'transaction_id': txn_id,
+            'type': 'single',
+            'category_id': rule.get('category_id', 'unknown'),
+            'category_name': rule.get('category', 'Uncategorized'),
+            'confidence': SOP_MATCH_CONFIDENCE[pattern_type],
+            'tier': 'sop',
+            'method': pattern_type,
+            'reasoning': f"SOP rule match: '{pattern}' ({pattern_type})",
+            'timestamp': timestamp or _now_iso()
+        }
     
     def _load_ynab_categories(self) -> List[Dict]:
         """
-        Lazy-load YNAB categories with 1-hour TTL cache.
+        Lazy-load YNAB categories, kept current with delta requests.
+        
+        Cached categories are reused for CATEGORY_REFRESH_INTERVAL, then
+        refreshed with a YNAB delta request (last_knowledge_of_server): an
+        unchanged budget costs an empty response and keeps the same list,
+        and changes are merged in as soon as they are seen. A full fetch
+        runs on first use and every CATEGORY_FULL_REFRESH_INTERVAL.
         
         Returns:
             List of category dicts: [{'id': str, 'name': str}]
         """
         now = datetime.now(timezone.utc)
         
-        # Check cache TTL (1 hour)
         if (self.ynab_categories and self.categories_cached_at and
-            now - self.categories_cached_at < timedelta(hours=1)):
+            now - self.categories_cached_at < CATEGORY_REFRESH_INTERVAL):
             logger.debug("Using cached YNAB categories")
             return self.ynab_categories
         
-        logger.info("Fetching YNAB categories from API")
+        full_fetch = (
+            not self.ynab_categories or
+            self._categories_server_knowledge is None or
+            self._categories_full_fetch_at is None or
+            now - self._categories_full_fetch_at >= CATEGORY_FULL_REFRESH_INTERVAL
+        )
+        
         try:
-            self.ynab_categories = fetch_categories(self.budget_id)
+            if full_fetch:
+                logger.info("Fetching YNAB categories from API")
+                categories, knowledge = fetch_category_changes(self.budget_id)
+                self._categories_full_fetch_at = now
+            else:
+                logger.debug("Checking YNAB categories for changes")
+                categories, knowledge = fetch_category_changes(
+                    self.budget_id,
+                    since_knowledge=self._categories_server_knowledge,
+                    categories=self.ynab_categories
+                )
+            
+            if categories is not self.ynab_categories:
+                logger.info(f"Loaded {len(categories)} categories")
+            self.ynab_categories = categories
+            self._categories_server_knowledge = knowledge
             self.categories_cached_at = now
-            logger.info(f"Loaded {len(self.ynab_categories)} categories")
             return self.ynab_categories
         except Exception as e:
             logger.error(f"Failed to fetch categories: {e}")
@@ -355,7 +1191,12 @@ class CategorizationAgent:
                 return self.ynab_categories
             return []
     
-    def _tier2_historical_match(self, transaction: Dict) -> Optional[Dict]:
+    def _tier2_historical_match(
+        self,
+        transaction: Dict,
+        timestamp: Optional[str] = None,
+        memo: Optional[Dict[Tuple[str, Optional[int]], Optional[Dict[str, Any]]]] = None
+    ) -> Optional[Dict]:
         """
         Tier 2: Match transaction using historical patterns.
         
@@ -363,15 +1204,25 @@ class CategorizationAgent:
         
         Args:
             transaction: Transaction dict
+            timestamp: Result timestamp (default: _now_iso())
+            memo: Per-batch lookup results keyed by (payee, amount bucket);
+                failed lookups are not stored
         
         Returns:
             Match result dict or None if no match or confidence too low
         """
         txn_id = transaction['id']
+        amount = transaction.get('amount')
+        key = (transaction['payee_name'], None if amount is None else amount // 1000)
         
         try:
             # Delegate to pattern_analyzer molecule
-            result = analyze_transaction(transaction)
+            if memo is not None and key in memo:
+                result = memo[key]
+            else:
+                result = _tier2_lookup(*key)
+                if memo is not None:
+                    memo[key] = result
             
             if not result:
                 logger.debug(f"No historical pattern for transaction {txn_id}")
@@ -382,10 +1233,11 @@ class CategorizationAgent:
                 logger.debug(f"Historical match confidence too low: {result['confidence']:.2%}")
                 return None
             
-            # Add transaction_id and timestamp
+            # Add transaction_id and timestamp (copy: result may be shared via the memo)
+            result = dict(result)
             result['transaction_id'] = txn_id
             result['tier'] = 'historical'
-            result['timestamp'] = datetime.now(timezone.utc).isoformat()
+            result['timestamp'] = timestamp or _now_iso()
             
             logger.debug(f"Historical match: {result['category_name']} ({result['confidence']:.2%})")
             return result
@@ -407,90 +1259,201 @@ class CategorizationAgent:
         Note:
             Real WebSearch via MCP server will be added in Phase 2.
         """
-        payee_lower = payee_name.lower()
-        
-        # Mock responses for common patterns
-        if 'starbucks' in payee_lower or 'coffee' in payee_lower:
-            return "Starbucks is a multinational coffee shop chain."
-        elif 'whole foods' in payee_lower or 'grocery' in payee_lower:
-            return "Whole Foods is a grocery store chain specializing in organic products."
-        elif 'amazon' in payee_lower:
-            return "Amazon is an online retail platform selling various products."
-        elif 'shell' in payee_lower or 'chevron' in payee_lower or 'gas' in payee_lower:
-            return "Gas station for vehicle fuel."
-        else:
+        best = _mock_search_priority(payee_name.lower())
+        if best is None:
             return f"No specific information found for {payee_name}."
+        return MOCK_WEB_SEARCH_RESPONSES[best][1]
     
     def _call_claude_with_retry(
         self,
         prompt: str,
-        max_retries: int = 3
+        max_retries: int = 3,
+        max_tokens: int = 1024,
+        expect: Optional[str] = None,
+        model: str = TIER3_MODEL
     ) -> str:
         """
         Call Claude API with exponential backoff retry.
         
+        With expect set, the response is streamed and the request is
+        abandoned as soon as the text visibly isn't the expected JSON,
+        instead of paying for the full generation first.
+        
         Args:
             prompt: Prompt text for Claude
             max_retries: Maximum retry attempts (default: 3)
+            max_tokens: Maximum response tokens (default: 1024)
+            expect: Expected first JSON character ('{' or '['), or None
+                for a plain non-streaming call
+            model: Claude model ID (default: TIER3_MODEL)
         
         Returns:
             Response text from Claude
         
         Raises:
+            ValueError: If a streamed response drifts off-spec (not retried)
             Exception: If all retries exhausted or non-retryable error
         """
         for attempt in range(max_retries):
             try:
-                logger.debug(f"Calling Claude API (attempt {attempt + 1}/{max_retries})")
+                logger.debug(f"Calling Claude API {model} (attempt {attempt + 1}/{max_retries})")
                 
-                response = self.anthropic_client.messages.create(
-                    model="claude-sonnet-4-5-20250929",
-                    max_tokens=1024,
-                    messages=[{
-                        "role": "user",
-                        "content": prompt
-                    }]
-                )
+                messages = [{
+                    "role": "user",
+                    "content": prompt
+                }]
+                
+                if expect is None:
+                    response = self.anthropic_client.messages.create(
+                        model=model,
+                        max_tokens=max_tokens,
+                        messages=messages
+                    )
+                    result_text = response.content[0].text
+                else:
+                    chunks = []
+                    head_ok = False
+                    with self.anthropic_client.messages.stream(
+                        model=model,
+                        max_tokens=max_tokens,
+                        messages=messages
+                    ) as stream:
+                        for text in stream.text_stream:
+                            chunks.append(text)
+                            if not head_ok:
+                                head_ok = _check_response_head(''.join(chunks), expect)
+                    result_text = ''.join(chunks)
                 
-                result_text = response.content[0].text
                 logger.debug(f"Claude API call successful ({len(result_text)} chars)")
                 return result_text
             
+            except (anthropic.RateLimitError, anthropic.APIConnectionError) as e:
+                if attempt >= max_retries - 1:
+                    logger.error(f"Claude API call failed after {max_retries} attempts: {e}")
+                    raise
+                wait_time = _retry_wait_seconds(e, attempt)
+                logger.warning(f"{_retry_reason(e)}, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
+                time.sleep(wait_time)
+            
             except Exception as e:
-                error_str = str(e)
+                # Non-retryable error (bad request, auth, off-spec response, ...)
+                logger.error(f"Claude API call failed: {e}")
+                raise
+        
+        raise Exception(f"Claude API call failed after {max_retries} retries")
+    
+    async def _acall_claude(
+        self,
+        prompt: str,
+        max_retries: int = 3,
+        max_tokens: int = 1024,
+        expect: Optional[str] = None,
+        model: str = TIER3_MODEL
+    ) -> str:
+        """
+        Async variant of _call_claude_with_retry() using AsyncAnthropic.
+        
+        Args:
+            prompt: Prompt text for Claude
+            max_retries: Maximum retry attempts (default: 3)
+            max_tokens: Maximum response tokens (default: 1024)
+            expect: Expected first JSON character ('{' or '['), or None
+                for a plain non-streaming call
+            model: Claude model ID (default: TIER3_MODEL)
+        
+        Returns:
+            Response text from Claude
+        
+        Raises:
+            ValueError: If a streamed response drifts off-spec (not retried)
+            Exception: If all retries exhausted or non-retryable error
+        """
+        if self._async_anthropic_client is None:
+            self._async_anthropic_client = anthropic.AsyncAnthropic(
+                api_key=self.anthropic_client.api_key
+            )
+        
+        for attempt in range(max_retries):
+            try:
+                logger.debug(f"Calling Claude API {model} async (attempt {attempt + 1}/{max_retries})")
                 
-                # Check if rate limit error (429)
-                if '429' in error_str and attempt < max_retries - 1:
-                    wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
-                    logger.warning(f"Rate limit hit, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
+                messages = [{
+                    "role": "user",
+                    "content": prompt
+                }]
+                
+                if expect is None:
+                    response = await self._async_anthropic_client.messages.create(
+                        model=model,
+                        max_tokens=max_tokens,
+                        messages=messages
+                    )
+                    result_text = response.content[0].text
                 else:
-                    # Non-retryable error or max retries reached
-                    logger.error(f"Claude API call failed: {error_str}")
+                    chunks = []
+                    head_ok = False
+                    async with self._async_anthropic_client.messages.stream(
+                        model=model,
+                        max_tokens=max_tokens,
+                        messages=messages
+                    ) as stream:
+                        async for text in stream.text_stream:
+                            chunks.append(text)
+                            if not head_ok:
+                                head_ok = _check_response_head(''.join(chunks), expect)
+                    result_text = ''.join(chunks)
+                
+                logger.debug(f"Claude API call successful ({len(result_text)} chars)")
+                return result_text
+            
+            except (anthropic.RateLimitError, anthropic.APIConnectionError) as e:
+                if attempt >= max_retries - 1:
+                    logger.error(f"Claude API call failed after {max_retries} attempts: {e}")
                     raise
+                wait_time = _retry_wait_seconds(e, attempt)
+                logger.warning(f"{_retry_reason(e)}, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
+                await asyncio.sleep(wait_time)
+            
+            except Exception as e:
+                # Non-retryable error (bad request, auth, off-spec response, ...)
+                logger.error(f"Claude API call failed: {e}")
+                raise
         
         raise Exception(f"Claude API call failed after {max_retries} retries")
     
-    def _tier3_research_and_reasoning(self, transaction: Dict) -> Dict:
+    def _tier3_research_and_reasoning(
+        self,
+        transaction: Dict,
+        payee_lower: Optional[str] = None,
+        model: Optional[str] = None
+    ) -> Dict:
         """
         Tier 3: Claude-powered research and reasoning.
         
-        Uses Claude Sonnet 4.5 to:
+        Uses Claude (Haiku 4.5 for easy payees, Sonnet 4.5 otherwise, see
+        _choose_model) to:
         1. Perform mock web search for unknown payee
         2. Analyze business type
         3. Recommend appropriate YNAB category
         
+        If the fast model fails, the transaction is retried once with
+        TIER3_MODEL before falling back to manual review.
+        
         Args:
             transaction: Transaction dict
+            payee_lower: Already-lowercased payee name, if the caller has it
+            model: Claude model ID, or None to pick one with _choose_model
         
         Returns:
             Categorization result dict (always returns, never None)
         """
         payee = transaction['payee_name']
-        amount = transaction.get('amount', 0)
-        memo = transaction.get('memo', '')
         txn_id = transaction['id']
         
+        cached = self._tier3_cache_get(transaction, payee_lower=payee_lower)
+        if cached is not None:
+            return cached
+        
         logger.info(f"Tier 3: Researching payee '{payee}'")
         
         # Load categories
@@ -500,25 +1463,49 @@ class CategorizationAgent:
             logger.error("No YNAB categories available for Tier 3")
             return self._manual_review_response(txn_id, "Categories unavailable")
         
-        # Build category list for prompt
-        category_list = "\n".join([
-            f"- {cat['name']} (ID: {cat['id']})"
-            for cat in categories
-        ])
+        prompt = self._build_tier3_prompt(transaction, categories)
+        if model is None:
+            model = self._choose_model(payee, transaction.get('memo'), payee_lower)
         
-        # Mock web search
-        search_results = self._mock_web_search(payee)
+        try:
+            # Call Claude
+            response_text = self._call_claude_with_retry(prompt, expect='{', model=model)
+            
+            # Parse JSON (strip any markdown code blocks if present)
+            result = _loads(self._strip_code_fences(response_text))
+            
+            if self._needs_escalation(model, result):
+                logger.info(f"Tier 3: {model} unsure about '{payee}', asking {TIER3_MODEL}")
+                model = TIER3_MODEL
+                response_text = self._call_claude_with_retry(prompt, expect='{')
+                result = _loads(self._strip_code_fences(response_text))
+            
+            return self._finalize_tier3_result(result, transaction)
         
-        # Build prompt
-        prompt = f"""Analyze this transaction and recommend the most appropriate YNAB category.
-
-Transaction Details:
-- Payee: {payee}
-- Amount: ${abs(amount)/1000:.2f}
-- Memo: {memo or 'N/A'}
-
-Web Search Results:
-{search_results}
+        except Exception as e:
+            if model != TIER3_MODEL:
+                logger.warning(f"Tier 3: {model} failed for '{payee}' ({e}), asking {TIER3_MODEL}")
+                return self._tier3_research_and_reasoning(transaction, payee_lower, model=TIER3_MODEL)
+            logger.error(f"Tier 3 research failed: {e}")
+            return self._manual_review_response(txn_id, f"Research failed: {str(e)}")
+    
+    def _get_tier3_prompt_prefix(self, categories: List[Dict]) -> str:
+        """
+        Return the static head of the single-transaction Tier 3 prompt.
+        
+        Instructions and the category list only change when categories are
+        refetched (a new list from _load_ynab_categories), so the rendered
+        prefix is cached against that list and rebuilt with it.
+        
+        Args:
+            categories: Category list from _load_ynab_categories()
+        
+        Returns:
+            Prompt prefix; per-transaction details are appended after it
+        """
+        if self._tier3_prompt_prefix is None or self._tier3_prompt_categories is not categories:
+            category_list = self._format_category_list(categories)
+            self._tier3_prompt_prefix = f"""Analyze the transaction below and recommend the most appropriate YNAB category.
 
 Available Categories:
 {category_list}
@@ -526,7 +1513,7 @@ Available Categories:
 Instructions:
 1. Based on the web search results, identify the business type
 2. Determine the most appropriate category from the list
-3. Provide confidence score between 0.60-0.79 (research-based categorization)
+3. Provide confidence score between {TIER3_MIN_CONFIDENCE:.2f}-{TIER3_MAX_CONFIDENCE:.2f} (research-based categorization); go below {TIER3_ESCALATE_CONFIDENCE:.2f} only if the business type or category is unclear
 4. Explain your reasoning
 
 Respond ONLY with valid JSON (no markdown, no code blocks):
@@ -536,48 +1523,342 @@ Respond ONLY with valid JSON (no markdown, no code blocks):
     "confidence": 0.75,
     "business_type": "identified business type",
     "reasoning": "brief explanation"
-}}"""
+}}
+
+"""
+            self._tier3_prompt_categories = categories
+        return self._tier3_prompt_prefix
+    
+    def _build_tier3_prompt(self, transaction: Dict, categories: List[Dict]) -> str:
+        """
+        Build the single-transaction Tier 3 prompt.
+        
+        Args:
+            transaction: Transaction dict
+            categories: Category list from _load_ynab_categories()
+        
+        Returns:
+            Prompt text for Claude (cached static prefix + transaction details)
+        """
+        payee = transaction['payee_name']
+        amount = transaction.get('amount', 0)
+        memo = transaction.get('memo', '')
+        
+        # Mock web search
+        search_results = self._mock_web_search(payee)
+        
+        return self._get_tier3_prompt_prefix(categories) + f"""Transaction Details:
+- Payee: {payee}
+- Amount: ${abs(amount)/1000:.2f}
+- Memo: {memo or 'N/A'}
+
+Web Search Results:
+{search_results}"""
+    
+    def _choose_model(
+        self,
+        payee: str,
+        memo: Optional[str],
+        payee_lower: Optional[str] = None
+    ) -> str:
+        """
+        Pick the Claude model for a Tier 3 request.
+        
+        Easy payees (a mock web search hit, or a short payee with no memo)
+        go to TIER3_FAST_MODEL; everything else to TIER3_MODEL.
+        
+        Args:
+            payee: Payee name
+            memo: Transaction memo, if any
+            payee_lower: Already-lowercased payee name, if the caller has it
+        
+        Returns:
+            Claude model ID
+        """
+        if _mock_search_priority(payee_lower or payee.lower()) is not None:
+            return TIER3_FAST_MODEL
+        if not memo and len(payee) <= TIER3_FAST_MAX_PAYEE_LEN:
+            return TIER3_FAST_MODEL
+        return TIER3_MODEL
+    
+    def _needs_escalation(self, model: str, result: Any) -> bool:
+        """
+        Check whether a fast-model decision should be re-asked with TIER3_MODEL.
+        
+        Args:
+            model: Model that produced the decision
+            result: Parsed decision (None if the model returned none)
+        
+        Returns:
+            True if model is not TIER3_MODEL and the decision is missing,
+            has no numeric confidence, or is below TIER3_ESCALATE_CONFIDENCE
+        """
+        if model == TIER3_MODEL:
+            return False
+        if not isinstance(result, dict):
+            return True
+        confidence = result.get('confidence')
+        if not isinstance(confidence, (int, float)):
+            return True
+        return confidence < TIER3_ESCALATE_CONFIDENCE
+    
+    async def _atier3_research_and_reasoning(
+        self,
+        transaction: Dict,
+        categories: List[Dict],
+        model: Optional[str] = None
+    ) -> Dict:
+        """
+        Async Tier 3 for one transaction (see _tier3_research_and_reasoning).
+        
+        Args:
+            transaction: Transaction dict
+            categories: Category list from _load_ynab_categories()
+            model: Claude model ID, or None to pick one with _choose_model
+        
+        Returns:
+            Categorization result dict (always returns, never None)
+        """
+        txn_id = transaction['id']
+        payee = transaction['payee_name']
+        logger.info(f"Tier 3: Researching payee '{payee}' (async)")
+        
+        prompt = self._build_tier3_prompt(transaction, categories)
+        if model is None:
+            model = self._choose_model(payee, transaction.get('memo'))
         
         try:
-            # Call Claude
-            response_text = self._call_claude_with_retry(prompt)
+            response_text = await self._acall_claude(prompt, expect='{', model=model)
+            result = _loads(self._strip_code_fences(response_text))
             
-            # Parse JSON (strip any markdown code blocks if present)
-            response_text = response_text.strip()
-            if response_text.startswith('```'):
-                # Strip markdown code blocks
-                response_text = re.sub(r'^```(?:json)?\n', '', response_text)
-                response_text = re.sub(r'\n```$', '', response_text)
+            if self._needs_escalation(model, result):
+                logger.info(f"Tier 3: {model} unsure about '{payee}', asking {TIER3_MODEL}")
+                model = TIER3_MODEL
+                response_text = await self._acall_claude(prompt, expect='{')
+                result = _loads(self._strip_code_fences(response_text))
             
-            result = json.loads(response_text)
-            
-            # Validate required fields
-            required = ['category_id', 'category_name', 'confidence', 'reasoning']
-            if not all(k in result for k in required):
-                raise ValueError(f"Missing required fields in Claude response: {result}")
-            
-            # Add transaction metadata
-            result['transaction_id'] = txn_id
-            result['type'] = 'single'
-            result['tier'] = 'research'
-            result['method'] = 'claude'
-            result['timestamp'] = datetime.now(timezone.utc).isoformat()
-            
-            # Update SOP with learned rule (Web Research section)
-            self._update_sop_web_research(
-                payee=payee,
-                business_type=result.get('business_type', 'Unknown'),
-                category=result['category_name'],
-                reasoning=result['reasoning']
-            )
-            
-            logger.info(f"Tier 3 success: {result['category_name']} (confidence: {result['confidence']:.2%})")
-            return result
+            return self._finalize_tier3_result(result, transaction)
         
         except Exception as e:
+            if model != TIER3_MODEL:
+                logger.warning(f"Tier 3: {model} failed for '{payee}' ({e}), asking {TIER3_MODEL}")
+                return await self._atier3_research_and_reasoning(transaction, categories, model=TIER3_MODEL)
             logger.error(f"Tier 3 research failed: {e}")
             return self._manual_review_response(txn_id, f"Research failed: {str(e)}")
     
+    def _tier3_research_batch(
+        self,
+        transactions: List[Dict],
+        model: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Tier 3 for several transactions in a single Claude request.
+        
+        Sends the category list and instructions once, followed by a
+        numbered list of transactions, and asks Claude for a JSON array of
+        decisions keyed by index. Transactions without a valid decision in
+        the response fall back to manual review.
+        
+        A batch of only easy payees goes to TIER3_FAST_MODEL first; its
+        missing or low-confidence decisions are re-asked with TIER3_MODEL
+        in one follow-up batch, and a failed fast-model request is retried
+        whole with TIER3_MODEL.
+        
+        Args:
+            transactions: Transaction dicts that missed Tier 1 and Tier 2
+            model: Claude model ID, or None to pick one with _choose_model
+        
+        Returns:
+            Categorization result dicts, aligned with transactions
+        """
+        logger.info(f"Tier 3: Researching {len(transactions)} payees in one request")
+        
+        categories = self._load_ynab_categories()
+        
+        if not categories:
+            logger.error("No YNAB categories available for Tier 3")
+            return [
+                self._manual_review_response(txn['id'], "Categories unavailable")
+                for txn in transactions
+            ]
+        
+        category_list = self._format_category_list(categories)
+        
+        # Numbered transaction table with per-payee search results
+        entries = []
+        for idx, txn in enumerate(transactions):
+            amount = txn.get('amount', 0)
+            entries.append(
+                f"[{idx}] Payee: {txn['payee_name']}\n"
+                f"    Amount: ${abs(amount)/1000:.2f}\n"
+                f"    Memo: {txn.get('memo', '') or 'N/A'}\n"
+                f"    Web Search Results: {self._mock_web_search(txn['payee_name'])}"
+            )
+        transaction_table = "\n\n".join(entries)
+        
+        prompt = f"""Analyze each of these transactions and recommend the most appropriate YNAB category for each.
+
+Transactions:
+{transaction_table}
+
+Available Categories:
+{category_list}
+
+Instructions:
+1. Based on the web search results, identify each business type
+2. Determine the most appropriate category from the list for each transaction
+3. Provide confidence scores between {TIER3_MIN_CONFIDENCE:.2f}-{TIER3_MAX_CONFIDENCE:.2f} (research-based categorization); go below {TIER3_ESCALATE_CONFIDENCE:.2f} only if the business type or category is unclear
+4. Explain your reasoning for each transaction
+5. Return exactly one decision per transaction, using its [idx] number
+
+Respond ONLY with a valid JSON array (no markdown, no code blocks):
+[
+    {{
+        "idx": 0,
+        "category_id": "UUID from list",
+        "category_name": "Exact category name from list",
+        "confidence": 0.75,
+        "business_type": "identified business type",
+        "reasoning": "brief explanation"
+    }}
+]"""
+        
+        if model is None:
+            models = {self._choose_model(txn['payee_name'], txn.get('memo')) for txn in transactions}
+            model = TIER3_FAST_MODEL if models == {TIER3_FAST_MODEL} else TIER3_MODEL
+        
+        try:
+            response_text = self._call_claude_with_retry(
+                prompt,
+                max_tokens=TIER3_BATCH_TOKENS_PER_TXN * len(transactions),
+                expect='[',
+                model=model
+            )
+            decisions = _loads(self._strip_code_fences(response_text))
+            
+            if not isinstance(decisions, list):
+                raise ValueError(f"Expected JSON array in Claude response: {decisions}")
+        
+        except Exception as e:
+            if model != TIER3_MODEL:
+                logger.warning(f"Tier 3: {model} batch failed ({e}), asking {TIER3_MODEL}")
+                return self._tier3_research_batch(transactions, model=TIER3_MODEL)
+            logger.error(f"Tier 3 batch research failed: {e}")
+            return [
+                self._manual_review_response(txn['id'], f"Research failed: {str(e)}")
+                for txn in transactions
+            ]
+        
+        # Map decisions back to transactions by idx
+        decisions_by_idx = {}
+        for decision in decisions:
+            if isinstance(decision, dict) and isinstance(decision.get('idx'), int):
+                decisions_by_idx.setdefault(decision.pop('idx'), decision)
+        
+        escalate = [
+            idx for idx in range(len(transactions))
+            if self._needs_escalation(model, decisions_by_idx.get(idx))
+        ]
+        retried = {}
+        if escalate:
+            logger.info(f"Tier 3: {model} unsure about {len(escalate)} payees, asking {TIER3_MODEL}")
+            retried = dict(zip(escalate, self._tier3_research_batch(
+                [transactions[idx] for idx in escalate],
+                model=TIER3_MODEL
+            )))
+        
+        results = []
+        for idx, txn in enumerate(transactions):
+            if idx in retried:
+                results.append(retried[idx])
+                continue
+            
+            decision = decisions_by_idx.get(idx)
+            if decision is None:
+                logger.error(f"Tier 3 batch response missing decision for {txn['id']}")
+                results.append(self._manual_review_response(
+                    txn['id'], "Research failed: no decision returned in batch response"
+                ))
+                continue
+            
+            try:
+                results.append(self._finalize_tier3_result(decision, txn))
+            except Exception as e:
+                logger.error(f"Tier 3 research failed: {e}")
+                results.append(self._manual_review_response(txn['id'], f"Research failed: {str(e)}"))
+        
+        return results
+    
+    def _format_category_list(self, categories: List[Dict]) -> str:
+        """
+        Format YNAB categories as a bullet list for Tier 3 prompts.
+        
+        Args:
+            categories: List of category dicts with 'id' and 'name'
+        
+        Returns:
+            One "- Name (ID: id)" line per category
+        """
+        return "\n".join([
+            f"- {cat['name']} (ID: {cat['id']})"
+            for cat in categories
+        ])
+    
+    def _strip_code_fences(self, response_text: str) -> str:
+        """
+        Strip surrounding markdown code fences from a Claude response.
+        
+        Args:
+            response_text: Raw response text
+        
+        Returns:
+            Response text without leading/trailing whitespace or fences
+        """
+        response_text = response_text.strip()
+        match = _FENCE_RE.match(response_text)
+        return match.group(1) if match else response_text
+    
+    def _finalize_tier3_result(self, result: Dict, transaction: Dict) -> Dict:
+        """
+        Validate a Claude decision and turn it into a Tier 3 result.
+        
+        Adds transaction metadata and records the decision in the SOP
+        Web Research section.
+        
+        Args:
+            result: Decision dict parsed from Claude's response
+            transaction: Transaction the decision belongs to
+        
+        Returns:
+            Categorization result dict
+        
+        Raises:
+            ValueError: If required fields are missing from the decision
+        """
+        # Validate required fields
+        if not all(k in result for k in TIER3_REQUIRED_FIELDS):
+            raise ValueError(f"Missing required fields in Claude response: {result}")
+        
+        # Add transaction metadata
+        result['transaction_id'] = transaction['id']
+        result['type'] = 'single'
+        result['tier'] = 'research'
+        result['method'] = 'claude'
+        result['timestamp'] = _now_iso()
+        
+        # Update SOP with learned rule (Web Research section)
+        self._update_sop_web_research(
+            payee=transaction['payee_name'],
+            business_type=result.get('business_type', 'Unknown'),
+            category=result['category_name'],
+            reasoning=result['reasoning']
+        )
+        
+        self._tier3_cache_put(transaction, result)
+        
+        logger.info(f"Tier 3 success: {result['category_name']} (confidence: {result['confidence']:.2%})")
+        return result
+    
     def _manual_review_response(
         self,
         transaction_id: str,
@@ -602,7 +1883,7 @@ Respond ONLY with valid JSON (no markdown, no code blocks):
             'tier': 'research',
             'method': 'failed',
             'reasoning': error_message,
-            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'timestamp': _now_iso(),
             'requires_manual_review': True
         }
     
@@ -614,7 +1895,12 @@ Respond ONLY with valid JSON (no markdown, no code blocks):
         reasoning: str
     ) -> bool:
         """
-        Add web research result to SOP file.
+        Queue web research result for the SOP file.
+        
+        Hands the rule to the background SOP writer (see
+        molecules.sop_manager.queue_sop_rule), so Tier 3 never waits
+        on the file lock or write. Once the writer flushes, the changed
+        file stamp makes the next _load_sop_rules pick it up from disk.
         
         Args:
             payee: Payee name
@@ -623,27 +1909,20 @@ Respond ONLY with valid JSON (no markdown, no code blocks):
             reasoning: Explanation
         
         Returns:
-            True if updated, False otherwise
+            True if queued, False otherwise
         """
-        timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
-        
-        rule_content = f"""
-## Web Research Results
-
-- **Unknown Payee**: {payee}
-  **Business Type**: {business_type}
-  **Category**: {category}
-  **Reasoning**: {reasoning}
-  **Confidence**: Medium (web-sourced)
-  **Date Added**: {timestamp}
-"""
+        rule_data = {
+            'unknown_payee': payee,
+            'business_type': business_type,
+            'category': category,
+            'reasoning': reasoning,
+            'confidence': 'Medium (web-sourced)'
+        }
         
         try:
-            success = append_rule_to_sop(rule_content)
+            success = queue_sop_rule('web_research', rule_data)
             if success:
-                logger.info(f"Added web research result for {payee} to SOP")
-                # Invalidate SOP cache
-                self.sop_rules = None
+                logger.info(f"Queued web research result for {payee} for SOP")
             return success
         except Exception as e:
             logger.error(f"Failed to update SOP with web research: {e}")
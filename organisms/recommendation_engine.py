@@ -41,8 +41,8 @@ class RecommendationEngine:
         
         self.budget_id = budget_id
         
-        # Initialize categorization agent (does heavy lifting)
-        self.categorization_agent = CategorizationAgent(budget_id)
+        # Shared categorization agent for this budget (does heavy lifting)
+        self.categorization_agent = CategorizationAgent.get(budget_id)
         
         logger.info(f"RecommendationEngine initialized for budget {budget_id}")
     
@@ -31,7 +31,9 @@ import os
 import sys
 
 # Add project root to path to import common modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from common.vault_client import VaultClient
 
@@ -115,15 +117,12 @@ def prompt_for_secret(prompt_text, env_var_name=None, default=None, allow_empty=
             sys.exit(0)
 
 
-def store_ynab_credentials(vault):
+def prompt_ynab_credentials():
     """
-    Prompt for and store YNAB API credentials in Vault.
+    Prompt for YNAB API credentials.
     
-    Args:
-        vault: VaultClient instance
-        
     Returns:
-        bool: True if storage successful, False otherwise
+        dict: Secret data for secret/ynab/credentials
     """
     print("="*60)
     print("YNAB API Credentials")
@@ -137,28 +136,16 @@ def store_ynab_credentials(vault):
         env_var_name="YNAB_API_KEY"
     )
     
-    print("\nStoring YNAB credentials in Vault...")
-    success = vault.kv_put("secret/ynab/credentials", {
-        "api_key": api_key
-    })
-    
-    if success:
-        print("✓ YNAB credentials stored successfully\n")
-        return True
-    else:
-        print("✗ Failed to store YNAB credentials\n")
-        return False
+    print()
+    return {"api_key": api_key}
 
 
-def store_claude_credentials(vault):
+def prompt_claude_credentials():
     """
-    Prompt for and store Claude API credentials in Vault.
+    Prompt for Claude API credentials.
     
-    Args:
-        vault: VaultClient instance
-        
     Returns:
-        bool: True if storage successful, False otherwise
+        dict: Secret data for secret/claude/api_key
     """
     print("="*60)
     print("Claude API Credentials")
@@ -172,28 +159,16 @@ def store_claude_credentials(vault):
         env_var_name="CLAUDE_API_KEY"
     )
     
-    print("\nStoring Claude API key in Vault...")
-    success = vault.kv_put("secret/claude/api_key", {
-        "api_key": api_key
-    })
-    
-    if success:
-        print("✓ Claude API key stored successfully\n")
-        return True
-    else:
-        print("✗ Failed to store Claude API key\n")
-        return False
+    print()
+    return {"api_key": api_key}
 
 
-def store_postgres_credentials(vault):
+def prompt_postgres_credentials():
     """
-    Prompt for and store PostgreSQL connection credentials in Vault.
+    Prompt for PostgreSQL connection credentials.
     
-    Args:
-        vault: VaultClient instance
-        
     Returns:
-        bool: True if storage successful, False otherwise
+        dict: Secret data for secret/postgres/ynab_db
     """
     print("="*60)
     print("PostgreSQL Connection Credentials")
@@ -216,13 +191,13 @@ def store_postgres_credentials(vault):
     # Validate port
     try:
         port = int(port_str)
-        if port < 1 or port > 65535:
-            print(f"Warning: Port {port} is outside valid range 1-65535")
-            print("Storing anyway - validation will occur when database is accessed")
+        port_warning = None if 1 <= port <= 65535 else f"Port {port} is outside valid range 1-65535"
     except ValueError:
-        print(f"Warning: Port '{port_str}' is not a valid integer")
-        print("Storing anyway - validation will occur when database is accessed")
         port = port_str  # Store as-is if conversion fails
+        port_warning = f"Port '{port_str}' is not a valid integer"
+    if port_warning:
+        print(f"Warning: {port_warning}")
+        print("Storing anyway - validation will occur when database is accessed")
     
     database = prompt_for_secret(
         "Database name: ",
@@ -239,21 +214,40 @@ def store_postgres_credentials(vault):
         env_var_name="POSTGRES_PASSWORD"
     )
     
-    print("\nStoring PostgreSQL credentials in Vault...")
-    success = vault.kv_put("secret/postgres/ynab_db", {
+    print()
+    return {
         "host": host,
         "port": port,
         "database": database,
         "username": username,
         "password": password
-    })
+    }
+
+
+def store_all_credentials(vault, secrets):
+    """
+    Store all collected secrets in Vault with one concurrent batch of writes.
     
-    if success:
-        print("✓ PostgreSQL credentials stored successfully\n")
-        return True
-    else:
-        print("✗ Failed to store PostgreSQL credentials\n")
-        return False
+    Args:
+        vault: VaultClient instance
+        secrets: Dict mapping secret path to secret data
+        
+    Returns:
+        bool: True if every secret was stored, False otherwise
+    """
+    print("="*60)
+    print("Storing Secrets in Vault")
+    print("="*60)
+    
+    results = vault.kv_put_many(secrets)
+    for path, success in results.items():
+        if success:
+            print(f"✓ {path} stored successfully")
+        else:
+            print(f"✗ Failed to store {path}")
+    
+    print()
+    return all(results.values())
 
 
 def verify_all_secrets(vault):
@@ -273,9 +267,21 @@ def verify_all_secrets(vault):
     
     all_valid = True
     
+    # Read all three secrets in one concurrent batch
+    results = vault.kv_get_many([
+        "secret/ynab/credentials",
+        "secret/claude/api_key",
+        "secret/postgres/ynab_db",
+    ])
+    for path, creds in results.items():
+        if isinstance(creds, Exception):
+            print(f"✗ {path} - FAILED ({creds})")
+            results[path] = None
+            all_valid = False
+    
     # Verify YNAB credentials
     print("Checking secret/ynab/credentials...")
-    ynab_creds = vault.kv_get("secret/ynab/credentials")
+    ynab_creds = results["secret/ynab/credentials"]
     if ynab_creds and "api_key" in ynab_creds:
         print("✓ secret/ynab/credentials - OK (api_key present)")
     else:
@@ -284,7 +290,7 @@ def verify_all_secrets(vault):
     
     # Verify Claude API key
     print("Checking secret/claude/api_key...")
-    claude_creds = vault.kv_get("secret/claude/api_key")
+    claude_creds = results["secret/claude/api_key"]
     if claude_creds and "api_key" in claude_creds:
         print("✓ secret/claude/api_key - OK (api_key present)")
     else:
@@ -293,7 +299,7 @@ def verify_all_secrets(vault):
     
     # Verify PostgreSQL credentials
     print("Checking secret/postgres/ynab_db...")
-    pg_creds = vault.kv_get("secret/postgres/ynab_db")
+    pg_creds = results["secret/postgres/ynab_db"]
     required_fields = ["host", "port", "database", "username", "password"]
     if pg_creds and all(field in pg_creds for field in required_fields):
         print(f"✓ secret/postgres/ynab_db - OK ({len(required_fields)} fields present)")
@@ -326,22 +332,19 @@ def main():
         # Step 1: Check Vault connectivity
         vault = check_vault_connectivity()
         
-        # Step 2: Store YNAB credentials
-        if not store_ynab_credentials(vault):
-            print("ERROR: Failed to store YNAB credentials")
-            sys.exit(1)
-        
-        # Step 3: Store Claude credentials
-        if not store_claude_credentials(vault):
-            print("ERROR: Failed to store Claude credentials")
-            sys.exit(1)
+        # Step 2: Collect YNAB, Claude and PostgreSQL credentials
+        secrets = {
+            "secret/ynab/credentials": prompt_ynab_credentials(),
+            "secret/claude/api_key": prompt_claude_credentials(),
+            "secret/postgres/ynab_db": prompt_postgres_credentials(),
+        }
         
-        # Step 4: Store PostgreSQL credentials
-        if not store_postgres_credentials(vault):
-            print("ERROR: Failed to store PostgreSQL credentials")
+        # Step 3: Store all credentials in one batch
+        if not store_all_credentials(vault, secrets):
+            print("ERROR: Failed to store credentials")
             sys.exit(1)
         
-        # Step 5: Verify all secrets
+        # Step 4: Verify all secrets
         if not verify_all_secrets(vault):
             print("ERROR: Secret verification failed")
             sys.exit(1)
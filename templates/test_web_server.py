@@ -4,17 +4,34 @@ Test Suite for Web Server Template (Story 5.4)
 Tests all endpoints and functionality of the Quart web server.
 """
 
+import asyncio
 import pytest
 import json
+from unittest.mock import patch
 from quart import Quart
-from templates.web_server import app
+from templates import web_server
+from templates.web_server import app, _validate_transactions, OrjsonProvider
 
 
-@pytest.fixture
-def client():
-    """Create test client"""
+@pytest.fixture(scope="module", autouse=True)
+def testing_app():
+    """Put the app in testing mode once for the module"""
     app.config['TESTING'] = True
-    return app.test_client()
+    yield app
+
+
+@pytest.fixture(scope="module")
+def client(testing_app):
+    """Create one test client shared by every test in the module"""
+    return testing_app.test_client()
+
+
+@pytest.fixture(autouse=True)
+def clear_accounts_cache():
+    """Start every test with an empty accounts cache"""
+    web_server._accounts_cache.clear()
+    yield
+    web_server._accounts_cache.clear()
 
 
 class TestRootEndpoint:
@@ -31,6 +48,30 @@ class TestRootEndpoint:
         """Test that index returns HTML content"""
         response = await client.get('/')
         assert b'<!DOCTYPE html>' in await response.data or response.status_code == 500
+    
+    @pytest.mark.asyncio
+    async def test_index_not_modified(self, client):
+        """Test that a matching If-None-Match returns 304 with no body"""
+        first = await client.get('/')
+        etag = first.headers['ETag']
+        assert 'no-store' not in first.headers['Cache-Control']
+        
+        response = await client.get('/', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert await response.get_data() == b''
+        assert response.headers['ETag'] == etag
+
+
+class TestHealthcheck:
+    """Tests for GET /healthcheck endpoint"""
+    
+    @pytest.mark.asyncio
+    async def test_healthcheck_returns_ok(self, client):
+        """Test that the health check returns a static JSON status"""
+        response = await client.get('/healthcheck')
+        assert response.status_code == 200
+        assert response.content_type == 'application/json'
+        assert await response.get_json() == {'status': 'ok'}
 
 
 class TestLoadAndTagEndpoint:
@@ -64,6 +105,127 @@ class TestLoadAndTagEndpoint:
             assert 'orchestrator' in data['message'].lower()
 
 
+class TestLoadAndTagStreaming:
+    """Tests for the streamed /api/load-and-tag success response"""
+    
+    @pytest.mark.asyncio
+    async def test_streamed_body_is_complete_json(self, client):
+        """Test that the per-budget chunks join into the full envelope"""
+        result = {
+            'status': 'success',
+            'budgets': {
+                'personal': {'budget_id': 'b-1', 'transactions': [{'id': 't-1'}]},
+                'business': {'budget_id': 'b-2', 'transactions': []}
+            },
+            'errors': [],
+            'timestamp': '2025-01-01T00:00:00Z'
+        }
+        with patch('templates.web_server.generate_recommendations', return_value=result), \
+                patch('templates.web_server.fetch_accounts', return_value=[{'id': 'acc-1'}]):
+            response = await client.get('/api/load-and-tag')
+            data = json.loads(await response.get_data())
+        
+        assert response.status_code == 200
+        assert data['status'] == 'success'
+        assert data['data']['timestamp'] == '2025-01-01T00:00:00Z'
+        assert list(data['data']['budgets']) == ['personal', 'business']
+        assert data['data']['budgets']['personal']['transactions'] == [{'id': 't-1'}]
+        assert data['data']['all_accounts'] == [{'id': 'acc-1'}]
+        assert 'all_accounts' not in data['data']['budgets']['personal']
+    
+    @pytest.mark.asyncio
+    async def test_matching_etag_returns_304(self, client):
+        """Test that an unchanged payload is answered with 304 Not Modified"""
+        def result(**kwargs):
+            return {
+                'status': 'success',
+                'budgets': {'personal': {'budget_id': 'b-1', 'transactions': []}},
+                'errors': []
+            }
+        with patch('templates.web_server.generate_recommendations', side_effect=result), \
+                patch('templates.web_server.fetch_accounts', return_value=[]):
+            first = await client.get('/api/load-and-tag')
+            etag = first.headers['ETag']
+            second = await client.get('/api/load-and-tag', headers={'If-None-Match': etag})
+        
+        assert first.status_code == 200
+        assert 'no-store' not in first.headers['Cache-Control']
+        assert second.status_code == 304
+        assert second.headers['ETag'] == etag
+        assert await second.get_data() == b''
+
+
+class TestLoadAndTagAccounts:
+    """Tests for the accounts fetched alongside the workflow"""
+    
+    @pytest.mark.asyncio
+    async def test_accounts_fetched_once_for_target_budget(self, client):
+        """Test that the speculative fetch is reused when budget_id matches"""
+        result = {
+            'status': 'success',
+            'budgets': {'personal': {'budget_id': web_server.TARGET_BUDGET_ID, 'transactions': []}},
+            'errors': []
+        }
+        with patch('templates.web_server.generate_recommendations', return_value=result), \
+                patch('templates.web_server.fetch_accounts', return_value=[{'id': 'acc-1'}]) as fetch:
+            response = await client.get('/api/load-and-tag')
+            data = json.loads(await response.get_data())
+        
+        fetch.assert_called_once_with(web_server.TARGET_BUDGET_ID)
+        assert data['data']['all_accounts'] == [{'id': 'acc-1'}]
+    
+    @pytest.mark.asyncio
+    async def test_accounts_failure_does_not_fail_workflow(self, client):
+        """Test that a failed accounts fetch only drops all_accounts"""
+        result = {
+            'status': 'success',
+            'budgets': {'personal': {'budget_id': web_server.TARGET_BUDGET_ID, 'transactions': []}},
+            'errors': []
+        }
+        with patch('templates.web_server.generate_recommendations', return_value=result), \
+                patch('templates.web_server.fetch_accounts', side_effect=RuntimeError('down')):
+            response = await client.get('/api/load-and-tag')
+            data = json.loads(await response.get_data())
+        
+        assert response.status_code == 200
+        assert 'all_accounts' not in data['data']
+
+
+class TestAccountsCache:
+    """Tests for get_accounts_cached"""
+    
+    @pytest.mark.asyncio
+    async def test_fresh_entry_skips_fetch(self):
+        """Test that a cached budget is not fetched again within the TTL"""
+        with patch('templates.web_server.fetch_accounts', return_value=[{'id': 'acc-1'}]) as fetch:
+            first = await web_server.get_accounts_cached('b-1')
+            second = await web_server.get_accounts_cached('b-1')
+        assert first == second == [{'id': 'acc-1'}]
+        fetch.assert_called_once_with('b-1')
+    
+    @pytest.mark.asyncio
+    async def test_near_expiry_serves_cache_and_refreshes(self):
+        """Test stale-while-revalidate close to the TTL"""
+        stale_at = web_server.time.monotonic() - web_server.ACCOUNTS_CACHE_TTL * 0.95
+        web_server._accounts_cache['b-1'] = (stale_at, [{'id': 'old'}])
+        with patch('templates.web_server.fetch_accounts', return_value=[{'id': 'new'}]):
+            accounts = await web_server.get_accounts_cached('b-1')
+            await asyncio.gather(*web_server._background_tasks)
+        assert accounts == [{'id': 'old'}]
+        assert web_server._accounts_cache['b-1'][1] == [{'id': 'new'}]
+    
+    @pytest.mark.asyncio
+    async def test_warm_up_prefetches_target_accounts(self, monkeypatch):
+        """Test that the startup warm-up fills the page and accounts caches"""
+        monkeypatch.setitem(app.config, 'TESTING', False)
+        with patch('templates.web_server.fetch_accounts', return_value=[{'id': 'acc-1'}]) as fetch:
+            await web_server.warm_up()
+            await asyncio.gather(*web_server._background_tasks)
+        fetch.assert_called_once_with(web_server.TARGET_BUDGET_ID)
+        assert web_server._accounts_cache[web_server.TARGET_BUDGET_ID][1] == [{'id': 'acc-1'}]
+        assert web_server._index_page is not None
+
+
 class TestSubmitEndpoint:
     """Tests for POST /api/submit endpoint"""
     
@@ -75,6 +237,50 @@ class TestSubmitEndpoint:
         data = await response.json
         assert data['status'] == 'error'
     
+    @pytest.mark.asyncio
+    async def test_submit_rejects_non_json_content_type(self, client):
+        """Test that a declared non-JSON body is rejected with 415"""
+        response = await client.post(
+            '/api/submit',
+            data=b'budget_id=b-1',
+            headers={'Content-Type': 'application/x-www-form-urlencoded'}
+        )
+        assert response.status_code == 415
+    
+    @pytest.mark.asyncio
+    async def test_submit_rejects_oversized_body(self, client):
+        """Test that bodies over MAX_CONTENT_LENGTH get 413, not 500"""
+        response = await client.post(
+            '/api/submit',
+            data=b' ' * (app.config['MAX_CONTENT_LENGTH'] + 1),
+            headers={'Content-Type': 'application/json'}
+        )
+        assert response.status_code == 413
+    
+    @pytest.mark.asyncio
+    async def test_submit_rejects_non_object_body(self, client):
+        """Test that a body not starting with '{' is rejected from its first bytes"""
+        response = await client.post(
+            '/api/submit',
+            data=b'  [{"budget_id": "b-1"}]',
+            headers={'Content-Type': 'application/json'}
+        )
+        assert response.status_code == 400
+        data = await response.json
+        assert 'JSON object' in data['message']
+    
+    @pytest.mark.asyncio
+    async def test_submit_rejects_malformed_json(self, client):
+        """Test that unparseable JSON gets 400"""
+        response = await client.post(
+            '/api/submit',
+            data=b'{"budget_id": ',
+            headers={'Content-Type': 'application/json'}
+        )
+        assert response.status_code == 400
+        data = await response.json
+        assert 'not valid JSON' in data['message']
+    
     @pytest.mark.asyncio
     async def test_submit_requires_transactions_field(self, client):
         """Test validation of transactions field"""
@@ -144,6 +350,83 @@ class TestSubmitEndpoint:
         assert data['status'] == 'success'
 
 
+class TestSubmitSuccess:
+    """Tests for a fully valid /api/submit request"""
+    
+    @pytest.mark.asyncio
+    async def test_submit_returns_sync_result(self, client):
+        """Test that the sync result is returned as JSON"""
+        txn = {
+            'transaction_id': 'txn-1',
+            'category_id': 'cat-1',
+            'category_name': 'Groceries',
+            'categorization_tier': 1,
+            'confidence_score': 0.95,
+            'method': 'sop'
+        }
+        sync_result = {'status': 'success', 'succeeded': 1, 'failed': 0, 'total': 1}
+        with patch('templates.web_server.submit_approved_changes', return_value=sync_result) as sync:
+            response = await client.post(
+                '/api/submit',
+                json={'budget_id': 'b-1', 'transactions': [txn]}
+            )
+            data = await response.json
+        
+        assert response.status_code == 200
+        assert response.content_type == 'application/json'
+        assert data == sync_result
+        sync.assert_called_once_with(budget_id='b-1', approved_changes=[txn])
+        # Byte bodies carry an exact length, so the connection can be reused
+        # for the next request without chunked framing
+        assert response.headers['Content-Length'] == str(len(await response.get_data()))
+
+
+class TestValidateTransactions:
+    """Tests for _validate_transactions helper"""
+    
+    def test_valid_transactions_have_no_errors(self):
+        """Test that complete transactions and transfers pass"""
+        txn = {
+            'transaction_id': 'txn-1',
+            'category_id': 'cat-1',
+            'category_name': 'Groceries',
+            'categorization_tier': 1,
+            'confidence_score': 0.95,
+            'method': 'sop'
+        }
+        transfer = dict(txn, category_name='SKIP_TRANSFER')
+        del transfer['category_id']
+        assert _validate_transactions([txn, transfer]) == []
+    
+    def test_reports_every_invalid_transaction(self):
+        """Test that all errors are collected, not just the first"""
+        errors = _validate_transactions(['invalid', {'transaction_id': 'txn-2'}])
+        assert errors[0] == 'Transaction at index 0 is not an object'
+        assert len(errors) == 2
+        assert errors[1] == (
+            "Transaction at index 1 missing required fields: "
+            "['categorization_tier', 'category_id', 'category_name', "
+            "'confidence_score', 'method']"
+        )
+
+
+class TestOrjsonProvider:
+    """Tests for the orjson JSON provider"""
+    
+    def test_app_uses_orjson_provider(self):
+        """Test that jsonify and request.get_json go through orjson"""
+        pytest.importorskip('orjson')
+        assert isinstance(app.json, OrjsonProvider)
+    
+    def test_dates_match_stdlib_encoding(self):
+        """Test that datetimes keep the stdlib provider's HTTP date format"""
+        pytest.importorskip('orjson')
+        from datetime import datetime
+        from quart.json.provider import DefaultJSONProvider
+        value = {'when': datetime(2025, 1, 2, 3, 4, 5)}
+        assert json.loads(app.json.dumps(value)) == json.loads(DefaultJSONProvider(app).dumps(value))
+
+
 class TestErrorHandlers:
     """Tests for error handlers"""
     
@@ -13,19 +13,14 @@ import sys
 from pathlib import Path
 
 # Add project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 # Set Vault environment variables (must be done before importing common modules)
+# VAULT_TOKEN falls back to ~/.vault-token, read lazily by VaultClient
 if 'VAULT_ADDR' not in os.environ:
     os.environ['VAULT_ADDR'] = 'http://127.0.0.1:8200'
-if 'VAULT_TOKEN' not in os.environ:
-    # Read token from ~/.vault-token file
-    try:
-        with open(os.path.expanduser('~/.vault-token'), 'r') as f:
-            os.environ['VAULT_TOKEN'] = f.read().strip()
-    except:
-        os.environ['VAULT_TOKEN'] = 'dev-token'  # Fallback
 
 # Also set database environment variables as fallback
 if 'POSTGRES_HOST' not in os.environ:
@@ -40,29 +35,428 @@ if 'YNAB_API_TOKEN' not in os.environ:
     os.environ['YNAB_API_TOKEN'] = 'bxZJrzgLIH9S7nrvRRoy1IqkYh-TrF20J-Z020Zd0zc'
 
 # Now import other modules
-from quart import Quart, request, jsonify, render_template
+from quart import Quart, Response, request, render_template
+from quart.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import RequestEntityTooLarge
+import asyncio
+import functools
+import hashlib
+import json
 import logging
-from typing import Dict, Any
-import traceback
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, Any, List, Optional, Set, Tuple
+
+# Faster JSON encoding/decoding for all endpoints when orjson is installed
+try:
+    import orjson
+    # Dates go through the provider's default hook, as with stdlib json
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+except ImportError:
+    orjson = None
+
+# libuv-based event loop for serving, when uvloop is installed
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Uvicorn ASGI server (httptools HTTP parser), when installed
+try:
+    import uvicorn
+except ImportError:
+    uvicorn = None
+
+from tools.ynab.transaction_tagger.templates.tagging_workflow import (
+    TARGET_BUDGET_ID,
+    generate_recommendations,
+    submit_approved_changes
+)
+from tools.ynab.transaction_tagger.atoms.api_fetch import fetch_accounts
+from common import base_client, vault_client
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# (only when the host process hasn't configured logging already;
+# set LOG_LEVEL=WARNING in production to skip per-request INFO records)
+if not logging.getLogger().hasHandlers():
+    logging.basicConfig(
+        level=os.getenv('LOG_LEVEL', 'INFO').upper(),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
 logger = logging.getLogger(__name__)
 
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Quart JSON provider that encodes and decodes with orjson."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=_ORJSON_OPTIONS).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 # Initialize Quart app
 app = Quart(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+# Largest accepted request body; /api/submit batches are far below this
+app.config['MAX_CONTENT_LENGTH'] = 2 * 1024 * 1024
+
+
+# Thread pool for the blocking workflow calls (YNAB, Postgres, Vault); its
+# size caps how many run at once, independent of asyncio's default pool
+WORKFLOW_MAX_WORKERS = 4
+_workflow_executor = ThreadPoolExecutor(
+    max_workers=WORKFLOW_MAX_WORKERS,
+    thread_name_prefix='workflow'
+)
+
+
+async def _run_blocking(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking call on the workflow thread pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_workflow_executor, functools.partial(func, *args, **kwargs))
+
+
+# Fields every submitted transaction must carry
+REQUIRED_TXN_FIELDS = frozenset(['transaction_id', 'category_name',
+                                 'categorization_tier', 'confidence_score', 'method'])
+
+
+def use_uvloop() -> bool:
+    """
+    Make new event loops uvloop loops, if uvloop is installed.
+
+    Called by the server entry points before their loop is created; tests and
+    importers keep the default asyncio loop.
+
+    Returns:
+        True if uvloop was installed as the event loop policy
+    """
+    if uvloop is None:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+async def serve(host: str, port: int) -> None:
+    """
+    Serve the app until shutdown.
+
+    Runs under Uvicorn with its fastest available HTTP parser (httptools) and
+    no per-request access log; falls back to Quart's Hypercorn server when
+    Uvicorn isn't installed.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind
+    """
+    if uvicorn is None:
+        await app.run_task(host=host, port=port, debug=False)
+        return
+    config = uvicorn.Config(app, host=host, port=port, http='auto', access_log=False)
+    await uvicorn.Server(config).serve()
+
+
+def _validate_transactions(transactions: List[Any]) -> List[str]:
+    """
+    Check submitted transactions in a single pass.
+
+    Args:
+        transactions: Transaction objects from the /api/submit payload
+
+    Returns:
+        Error messages for every invalid transaction, empty if all are valid
+    """
+    errors = []
+    # Local bindings keep global/attribute lookups out of the per-item loop
+    required = REQUIRED_TXN_FIELDS
+    is_complete = required.issubset
+    add_error = errors.append
+    for idx, txn in enumerate(transactions):
+        if not isinstance(txn, dict):
+            add_error(f'Transaction at index {idx} is not an object')
+            continue
+
+        # Fast path for the common valid case: no set is built
+        if is_complete(txn) and ('category_id' in txn
+                                 or txn.get('category_name') == 'SKIP_TRANSFER'):
+            continue
+
+        missing = required - txn.keys()
+        # category_id is required for non-transfers
+        if 'category_id' not in txn and txn.get('category_name') != 'SKIP_TRANSFER':
+            missing = missing | {'category_id'}
+        add_error(
+            f'Transaction at index {idx} missing required fields: {sorted(missing)}'
+        )
+    return errors
+
+
+async def _read_json_object_body() -> bytes:
+    """
+    Read the request body chunk by chunk as it arrives.
+
+    Gives up without waiting for the rest of the upload once the body can't
+    be a JSON object or grows past MAX_CONTENT_LENGTH (Quart only enforces
+    the limit per chunk when the body is iterated).
+
+    Returns:
+        The complete body (b'' if empty)
+
+    Raises:
+        RequestEntityTooLarge: If the body exceeds MAX_CONTENT_LENGTH
+        ValueError: If the body doesn't start with '{'
+    """
+    limit = app.config['MAX_CONTENT_LENGTH']
+    body = bytearray()
+    checked = False
+    async for chunk in request.body:
+        body += chunk
+        if len(body) > limit:
+            raise RequestEntityTooLarge()
+        if not checked:
+            head = body.lstrip()[:1]
+            if head and head != b'{':
+                raise ValueError('Request body is not a JSON object')
+            checked = bool(head)
+    return bytes(body)
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize obj to JSON bytes, falling back to the app's encoder for non-JSON types."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=app.json.default, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, default=app.json.default).encode()
+
+
+def _json_response(obj: Any, status: int = 200) -> Response:
+    """Build a JSON response from obj without going through jsonify."""
+    return Response(_json_bytes(obj), status=status, content_type='application/json')
+
+
+def _error_body(message: str) -> bytes:
+    """Serialize a fixed {'status': 'error', 'message': ...} payload."""
+    return _json_bytes({'status': 'error', 'message': message})
+
+
+def _error_response(body: bytes, status: int) -> Response:
+    """Wrap a pre-serialized JSON error body in a fresh response."""
+    return Response(body, status=status, content_type='application/json')
+
+
+# Fixed-message error bodies, serialized once at import
+_INDEX_ERROR_BODY = _error_body('Failed to load application')
+_CONTENT_TYPE_ERROR_BODY = _error_body('Content-Type must be application/json')
+_BODY_TOO_LARGE_BODY = _error_body('Request body too large')
+_NOT_OBJECT_BODY = _error_body('Request body must be a JSON object')
+_INVALID_JSON_BODY = _error_body('Request body is not valid JSON')
+_EMPTY_REQUEST_BODY = _error_body('Empty request body')
+_MISSING_BUDGET_ID_BODY = _error_body('Missing "budget_id" field in payload')
+_MISSING_TRANSACTIONS_BODY = _error_body('Missing "transactions" field in payload')
+_TRANSACTIONS_NOT_ARRAY_BODY = _error_body('"transactions" must be an array')
+_NO_TRANSACTIONS_BODY = _error_body('No transactions provided')
+_NOT_FOUND_BODY = _error_body('Endpoint not found')
+_INTERNAL_ERROR_BODY = _error_body('Internal server error')
+_HEALTH_BODY = _json_bytes({'status': 'ok'})
+
+
+def _encode_budgets(result: Dict[str, Any]) -> List[bytes]:
+    """
+    Serialize each budget of a workflow result as a '"name":{...}' JSON member.
+
+    Args:
+        result: Workflow result from generate_recommendations()
+
+    Returns:
+        One JSON fragment per budget, in result order
+    """
+    return [
+        _json_bytes(budget_name) + b':' + _json_bytes(budget_data)
+        for budget_name, budget_data in result.get('budgets', {}).items()
+    ]
+
+
+def _workflow_etag(result: Dict[str, Any], budget_chunks: List[bytes]) -> str:
+    """
+    Hash the parts of a workflow result the client renders.
+
+    The per-run timestamp is left out, so two runs over unchanged YNAB data
+    get the same ETag.
+
+    Args:
+        result: Workflow result from generate_recommendations()
+        budget_chunks: Encoded budgets from _encode_budgets()
+
+    Returns:
+        Hex digest to send as the response ETag
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for chunk in budget_chunks:
+        digest.update(chunk)
+    digest.update(_json_bytes(result.get('all_accounts')))
+    return digest.hexdigest()
+
+
+async def _stream_workflow_result(
+    result: Dict[str, Any],
+    budget_chunks: List[bytes]
+) -> AsyncIterator[bytes]:
+    """
+    Yield the load-and-tag success envelope one budget at a time.
+
+    The client can start reading before the last budget is sent, and the
+    full payload is never joined into a single buffer.
+
+    Args:
+        result: Workflow result from generate_recommendations()
+        budget_chunks: Encoded budgets from _encode_budgets()
+
+    Yields:
+        Chunks of {"status": "success", "data": result} as JSON bytes
+    """
+    head = {key: value for key, value in result.items() if key != 'budgets'}
+    yield (b'{"status":"success","data":' + _json_bytes(head)[:-1]
+           + (b',' if head else b'') + b'"budgets":{')
+    for idx, chunk in enumerate(budget_chunks):
+        yield (b',' if idx else b'') + chunk
+    yield b'}}}'
+
+
+# YNAB accounts per budget: budget_id -> (monotonic fetch time, accounts).
+# Entries older than 90% of the TTL are refreshed in the background while
+# the cached list keeps being served; expired entries are refetched inline.
+ACCOUNTS_CACHE_TTL = 3600
+_accounts_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+_accounts_refreshing: Set[str] = set()
+_background_tasks: Set[asyncio.Task] = set()
+
+
+async def _refresh_accounts(budget_id: str) -> List[Dict[str, Any]]:
+    """Fetch a budget's accounts from YNAB and store them in the cache."""
+    accounts = await _run_blocking(fetch_accounts, budget_id)
+    _accounts_cache[budget_id] = (time.monotonic(), accounts)
+    return accounts
+
+
+async def _refresh_accounts_quietly(budget_id: str) -> None:
+    """Background account refresh; failures keep the cached list."""
+    try:
+        await _refresh_accounts(budget_id)
+    except Exception as e:
+        logger.warning("Background account refresh failed for %s: %s", budget_id, e)
+    finally:
+        _accounts_refreshing.discard(budget_id)
+
+
+def _schedule_accounts_refresh(budget_id: str) -> None:
+    """Start a background account refresh unless one is already running."""
+    if budget_id in _accounts_refreshing:
+        return
+    _accounts_refreshing.add(budget_id)
+    task = asyncio.create_task(_refresh_accounts_quietly(budget_id))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def get_accounts_cached(budget_id: str) -> List[Dict[str, Any]]:
+    """
+    Get a budget's accounts, fetching from YNAB at most once per TTL.
+
+    Args:
+        budget_id: YNAB budget identifier
+
+    Returns:
+        List of account dictionaries (non-closed, non-deleted only)
+
+    Raises:
+        YNABAPIError: If the accounts are not cached and the fetch fails
+    """
+    cached = _accounts_cache.get(budget_id)
+    if cached is None:
+        return await _refresh_accounts(budget_id)
+
+    age = time.monotonic() - cached[0]
+    if age >= ACCOUNTS_CACHE_TTL:
+        return await _refresh_accounts(budget_id)
+    if age >= ACCOUNTS_CACHE_TTL * 0.9:
+        _schedule_accounts_refresh(budget_id)
+    return cached[1]
+
+
+# Rendered index.html and its ETag; the template takes no context, so it is
+# rendered once per process instead of on every request
+_index_page: Optional[Tuple[bytes, str]] = None
+
+
+async def _get_index_page() -> Tuple[bytes, str]:
+    """
+    Return the rendered index page, rendering it on first use.
+
+    Returns:
+        Tuple of (UTF-8 HTML body, ETag)
+    """
+    global _index_page
+    if _index_page is None:
+        body = (await render_template('index.html')).encode('utf-8')
+        _index_page = (body, hashlib.blake2b(body, digest_size=16).hexdigest())
+    return _index_page
+
+
+@app.before_serving
+async def warm_up():
+    """
+    Pay first-request costs before the server accepts connections.
+
+    Renders index.html into the page cache and starts a background fetch of
+    the target budget's accounts, so the first /api/load-and-tag only waits
+    on the workflow itself. Skipped steps are retried by the first request.
+    """
+    try:
+        await _get_index_page()
+    except Exception as e:
+        logger.warning("Failed to pre-render index page: %s", e)
+
+    if not app.config.get('TESTING'):
+        _schedule_accounts_refresh(TARGET_BUDGET_ID)
+
+
+@app.after_serving
+async def close_upstream_sessions():
+    """Release pooled YNAB and Vault connections on shutdown."""
+    base_client.close_session()
+    vault_client.close_session()
+
+
+# Cache headers set on every response, built once
+_NO_CACHE_HEADERS = {
+    'Cache-Control': 'no-cache, no-store, must-revalidate, max-age=0',
+    'Pragma': 'no-cache',
+    'Expires': '0'
+}
+_REVALIDATE_HEADERS = {
+    **_NO_CACHE_HEADERS,
+    'Cache-Control': 'no-cache, must-revalidate, max-age=0'
+}
+_REVALIDATE_PATHS = frozenset({'/', '/api/load-and-tag'})
 
 
 # Add no-cache headers to all responses
 @app.after_request
 async def add_no_cache_headers(response):
-    """Disable caching for all responses."""
-    response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate, max-age=0'
-    response.headers['Pragma'] = 'no-cache'
-    response.headers['Expires'] = '0'
+    """
+    Disable caching for all responses.
+
+    / and /api/load-and-tag drop no-store so browsers keep the body and
+    revalidate it with If-None-Match against the response ETag.
+    """
+    if request.path in _REVALIDATE_PATHS:
+        response.headers.update(_REVALIDATE_HEADERS)
+    else:
+        response.headers.update(_NO_CACHE_HEADERS)
     return response
 
 
@@ -72,16 +466,33 @@ async def index():
     Serve main application page.
 
     Returns:
-        HTML template for the main application interface
+        Pre-rendered HTML for the main application interface, or 304 if
+        the client's If-None-Match matches its ETag
     """
     try:
-        return await render_template('index.html')
+        body, etag = await _get_index_page()
+        if request.if_none_match.contains(etag):
+            response = Response('', status=304)
+        else:
+            response = Response(body, status=200, content_type='text/html; charset=utf-8')
+        response.set_etag(etag)
+        return response
     except Exception as e:
-        logger.error(f"Error serving index: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': 'Failed to load application'
-        }), 500
+        logger.error("Error serving index: %s", e)
+        return _error_response(_INDEX_ERROR_BODY, 500)
+
+
+@app.route('/healthcheck')
+async def healthcheck():
+    """
+    Liveness probe for load balancers and process supervisors.
+
+    Touches no template, Vault or YNAB state, so it stays cheap to poll.
+
+    Returns:
+        Static {"status": "ok"} JSON response
+    """
+    return Response(_HEALTH_BODY, status=200, content_type='application/json')
 
 
 @app.route('/api/load-and-tag', methods=['GET'])
@@ -99,58 +510,72 @@ async def load_and_tag():
         JSON response with workflow results or error message
     """
     try:
-        logger.info("Starting load-and-tag workflow")
-
-        # Import tagging workflow template
-        # Note: Import here to avoid circular dependencies
-        from tools.ynab.transaction_tagger.templates.tagging_workflow import generate_recommendations
+        logger.debug("Starting load-and-tag workflow")
 
         # Execute workflow - only load personal budget
-        result = generate_recommendations(
-            budget_type='personal',
-            uncategorized_only=True
+        # (blocking YNAB/Postgres I/O, so run it off the event loop).
+        # Accounts for the configured personal budget are fetched alongside.
+        result, all_accounts = await asyncio.gather(
+            _run_blocking(
+                generate_recommendations,
+                budget_type='personal',
+                uncategorized_only=True
+            ),
+            get_accounts_cached(TARGET_BUDGET_ID),
+            return_exceptions=True
         )
+        if isinstance(result, BaseException):
+            raise result
 
         if result['status'] == 'failed':
-            logger.error(f"Workflow failed: {result.get('errors')}")
-            return jsonify({
+            logger.error("Workflow failed: %s", result.get('errors'))
+            return _json_response({
                 'status': 'error',
                 'message': 'Workflow execution failed',
                 'errors': result.get('errors', [])
-            }), 500
+            }, 500)
 
-        # Count total transactions
-        total_txns = sum(
-            len(budget_data.get('transactions', []))
-            for budget_data in result.get('budgets', {}).values()
-        )
+        # Count total transactions (precomputed by the workflow)
+        total_txns = result.get('total_transactions', 0)
 
         # Fetch ALL accounts from YNAB (for tabs)
-        from tools.ynab.transaction_tagger.atoms.api_fetch import fetch_accounts
         budget_id = result.get('budgets', {}).get('personal', {}).get('budget_id')
         if budget_id:
             try:
-                all_accounts = fetch_accounts(budget_id)
-                # Add accounts to result
-                for budget_name, budget_data in result.get('budgets', {}).items():
-                    budget_data['all_accounts'] = all_accounts
+                # Refetch only if the workflow used a different budget
+                if budget_id != TARGET_BUDGET_ID:
+                    all_accounts = await get_accounts_cached(budget_id)
+                elif isinstance(all_accounts, BaseException):
+                    raise all_accounts
+                # Added once at the top level, shared by every budget
+                result['all_accounts'] = all_accounts
             except Exception as e:
-                logger.warning(f"Failed to fetch accounts: {e}")
-
-        logger.info(f"Workflow completed successfully: {total_txns} transactions")
-
-        return jsonify({
-            'status': 'success',
-            'data': result
-        }), 200
+                logger.warning("Failed to fetch accounts: %s", e)
+
+        logger.info("Workflow completed successfully: %d transactions", total_txns)
+
+        # Skip the body when the client already has this exact payload
+        budget_chunks = _encode_budgets(result)
+        etag = _workflow_etag(result, budget_chunks)
+        if request.if_none_match.contains(etag):
+            response = Response('', status=304)
+            response.set_etag(etag)
+            return response
+
+        response = Response(
+            _stream_workflow_result(result, budget_chunks),
+            status=200,
+            content_type='application/json'
+        )
+        response.set_etag(etag)
+        return response
         
     except Exception as e:
-        logger.error(f"Error in load-and-tag: {e}")
-        logger.error(traceback.format_exc())
-        return jsonify({
+        logger.exception("Error in load-and-tag: %s", e)
+        return _json_response({
             'status': 'error',
             'message': str(e)
-        }), 500
+        }, 500)
 
 
 @app.route('/api/submit', methods=['POST'])
@@ -182,114 +607,90 @@ async def submit():
         JSON response with processing results or error message
     """
     try:
-        logger.info("Processing transaction submission")
-
-        # Parse request body
-        data = await request.get_json()
+        logger.debug("Processing transaction submission")
+
+        # Reject non-JSON bodies before reading them
+        if request.mimetype and request.mimetype != 'application/json':
+            return _error_response(_CONTENT_TYPE_ERROR_BODY, 415)
+
+        # Read request body as it arrives, stopping early on bad input
+        try:
+            raw = await _read_json_object_body()
+        except RequestEntityTooLarge:
+            return _error_response(_BODY_TOO_LARGE_BODY, 413)
+        except ValueError:
+            return _error_response(_NOT_OBJECT_BODY, 400)
+        try:
+            data = app.json.loads(raw) if raw else None
+        except ValueError:
+            return _error_response(_INVALID_JSON_BODY, 400)
 
         # Validate payload
         if not data:
-            return jsonify({
-                'status': 'error',
-                'message': 'Empty request body'
-            }), 400
+            return _error_response(_EMPTY_REQUEST_BODY, 400)
 
         if 'budget_id' not in data:
-            return jsonify({
-                'status': 'error',
-                'message': 'Missing "budget_id" field in payload'
-            }), 400
+            return _error_response(_MISSING_BUDGET_ID_BODY, 400)
 
         if 'transactions' not in data:
-            return jsonify({
-                'status': 'error',
-                'message': 'Missing "transactions" field in payload'
-            }), 400
+            return _error_response(_MISSING_TRANSACTIONS_BODY, 400)
 
         if not isinstance(data['transactions'], list):
-            return jsonify({
-                'status': 'error',
-                'message': '"transactions" must be an array'
-            }), 400
+            return _error_response(_TRANSACTIONS_NOT_ARRAY_BODY, 400)
 
         transactions = data['transactions']
         budget_id = data['budget_id']
 
         if len(transactions) == 0:
-            return jsonify({
-                'status': 'error',
-                'message': 'No transactions provided'
-            }), 400
+            return _error_response(_NO_TRANSACTIONS_BODY, 400)
 
         # Validate transaction structure
-        required_fields = ['transaction_id', 'category_name',
-                          'categorization_tier', 'confidence_score', 'method']
-        for idx, txn in enumerate(transactions):
-            if not isinstance(txn, dict):
-                return jsonify({
-                    'status': 'error',
-                    'message': f'Transaction at index {idx} is not an object'
-                }), 400
-
-            for field in required_fields:
-                if field not in txn:
-                    return jsonify({
-                        'status': 'error',
-                        'message': f'Transaction at index {idx} missing required field: {field}'
-                    }), 400
-
-            # category_id is required for non-transfers
-            is_transfer = txn.get('category_name') == 'SKIP_TRANSFER'
-            if not is_transfer and 'category_id' not in txn:
-                return jsonify({
-                    'status': 'error',
-                    'message': f'Transaction at index {idx} missing required field: category_id'
-                }), 400
-
-        logger.info(f"Validated {len(transactions)} transactions for budget {budget_id}")
-
-        # Import submission function
-        from tools.ynab.transaction_tagger.templates.tagging_workflow import submit_approved_changes
-
-        # Submit to YNAB API
-        result = submit_approved_changes(
+        errors = _validate_transactions(transactions)
+        if errors:
+            return _json_response({
+                'status': 'error',
+                'message': errors[0],
+                'errors': errors
+            }, 400)
+
+        logger.info("Validated %d transactions for budget %s", len(transactions), budget_id)
+
+        # Submit to YNAB API (off the event loop)
+        result = await _run_blocking(
+            submit_approved_changes,
             budget_id=budget_id,
             approved_changes=transactions
         )
 
-        logger.info(f"Submission result: {result['status']} - {result.get('succeeded', 0)}/{result.get('total', 0)} succeeded")
+        logger.info("Submission result: %s - %d/%d succeeded",
+                    result['status'], result.get('succeeded', 0), result.get('total', 0))
 
-        # Return result to frontend
-        return jsonify(result), 200
+        # Return result to frontend (encoded straight to bytes)
+        return _json_response(result)
 
     except Exception as e:
-        logger.error(f"Error in submit: {e}")
-        logger.error(traceback.format_exc())
-        return jsonify({
+        logger.exception("Error in submit: %s", e)
+        return _json_response({
             'status': 'error',
             'message': str(e)
-        }), 500
+        }, 500)
 
 
 @app.errorhandler(404)
 async def not_found(error):
     """Handle 404 errors."""
-    return jsonify({
-        'status': 'error',
-        'message': 'Endpoint not found'
-    }), 404
+    return _error_response(_NOT_FOUND_BODY, 404)
 
 
 @app.errorhandler(500)
 async def internal_error(error):
     """Handle 500 errors."""
-    logger.error(f"Internal server error: {error}")
-    return jsonify({
-        'status': 'error',
-        'message': 'Internal server error'
-    }), 500
+    logger.error("Internal server error: %s", error)
+    return _error_response(_INTERNAL_ERROR_BODY, 500)
 
 
 if __name__ == '__main__':
     logger.info("Starting YNAB Transaction Tagger web server")
-    app.run(debug=True, host='0.0.0.0', port=5001)  # debug=True for development
+    if use_uvloop():
+        logger.info("Using uvloop event loop")
+    asyncio.run(serve(host='0.0.0.0', port=5001))
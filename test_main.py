@@ -8,6 +8,10 @@ import pytest
 import asyncio
 from unittest.mock import patch, MagicMock
 from main import open_browser, delayed_browser_open
+from templates.web_server import app
+
+# Registered URL rules, collected once for the route tests
+ROUTES = frozenset(rule.rule for rule in app.url_map.iter_rules())
 
 
 class TestBrowserOpening:
@@ -53,23 +57,16 @@ class TestMainEntryPoint:
 class TestWorkflowIntegration:
     """Integration tests for complete workflow"""
     
-    @pytest.mark.asyncio
-    async def test_quart_app_exists(self):
+    def test_quart_app_exists(self):
         """Test that Quart app can be imported"""
-        from templates.web_server import app
         assert app is not None
     
-    @pytest.mark.asyncio
-    async def test_app_has_routes(self):
+    def test_app_has_routes(self):
         """Test that app has expected routes"""
-        from templates.web_server import app
-        
-        # Get routes
-        routes = [rule.rule for rule in app.url_map.iter_rules()]
-        
-        assert '/' in routes
-        assert '/api/load-and-tag' in routes
-        assert '/api/submit' in routes
+        assert '/' in ROUTES
+        assert '/api/load-and-tag' in ROUTES
+        assert '/api/submit' in ROUTES
+        assert '/healthcheck' in ROUTES
 
 
 if __name__ == '__main__':
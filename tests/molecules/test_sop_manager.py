@@ -7,7 +7,12 @@ Implementation verified through manual testing and integration with atoms.
 
 import pytest
 from pathlib import Path
-from molecules.sop_manager import get_sop_match, update_sop_with_rule
+from unittest.mock import patch
+from molecules import sop_manager
+from molecules.sop_manager import (
+    flush_sop_writes, get_sop_match, get_sop_matches_batch, queue_sop_rule,
+    update_sop_with_rule
+)
 
 
 class TestBasicFunctionality:
@@ -27,6 +32,21 @@ class TestBasicFunctionality:
         assert match is not None
         assert match['category'] == 'Coffee'
     
+    def test_get_sop_match_returns_read_only_rule(self):
+        """Test get_sop_match() returns a shared, read-only rule view."""
+        rules = {
+            'core_patterns': [
+                {'pattern': 'Starbucks*', 'category': 'Coffee', 'pattern_type': 'prefix'}
+            ],
+            'split_patterns': [],
+            'user_corrections': [],
+            'web_research': []
+        }
+        match = get_sop_match("Starbucks Pike Place", rules)
+        with pytest.raises(TypeError):
+            match['category'] = 'Dining'
+        assert dict(match) == rules['core_patterns'][0]
+    
     def test_get_sop_match_returns_none_when_no_match(self):
         """Test get_sop_match() returns None when no pattern matches."""
         rules = {
@@ -40,6 +60,149 @@ class TestBasicFunctionality:
         match = get_sop_match("Walmart", rules)
         assert match is None
     
+    def test_get_sop_match_respects_section_priority(self):
+        """Test get_sop_match() prefers earlier rules over later exact matches."""
+        rules = {
+            'core_patterns': [
+                {'pattern': 'Starbucks*', 'category': 'Coffee', 'pattern_type': 'prefix'}
+            ],
+            'split_patterns': [],
+            'user_corrections': [
+                {'payee': 'Starbucks', 'correct_category': 'Dining'}
+            ],
+            'web_research': []
+        }
+        match = get_sop_match("starbucks", rules)
+        assert match['category'] == 'Coffee'
+    
+    def test_get_sop_match_sees_rules_added_to_same_dict(self):
+        """Test memoized get_sop_match() picks up rules appended to the dict."""
+        rules = {
+            'core_patterns': [
+                {'pattern': 'Starbucks*', 'category': 'Coffee', 'pattern_type': 'prefix'}
+            ],
+            'split_patterns': [],
+            'user_corrections': [],
+            'web_research': []
+        }
+        assert get_sop_match("Walmart", rules) is None
+        rules['core_patterns'].append(
+            {'pattern': 'Walmart', 'category': 'Groceries', 'pattern_type': 'exact'}
+        )
+        assert get_sop_match("Walmart", rules)['category'] == 'Groceries'
+    
+    def test_get_sop_matches_batch_aligns_with_payees(self):
+        """Test get_sop_matches_batch() returns one result per payee."""
+        rules = {
+            'core_patterns': [
+                {'pattern': 'Starbucks*', 'category': 'Coffee', 'pattern_type': 'prefix'},
+                {'pattern': '*market*', 'category': 'Groceries', 'pattern_type': 'contains'}
+            ],
+            'split_patterns': [],
+            'user_corrections': [],
+            'web_research': []
+        }
+        matches = get_sop_matches_batch(["Starbucks #12", "Walmart", "", "Fresh Market"], rules)
+        assert [m['category'] if m else None for m in matches] == ['Coffee', None, None, 'Groceries']
+    
+    def test_get_sop_match_prefers_earliest_prefix_rule(self):
+        """Test overlapping prefix rules resolve by priority, not length."""
+        rules = {
+            'core_patterns': [
+                {'pattern': '*pike*', 'category': 'Landmarks', 'pattern_type': 'contains'},
+                {'pattern': 'Star*', 'category': 'Generic', 'pattern_type': 'prefix'},
+                {'pattern': 'Starbucks*', 'category': 'Coffee', 'pattern_type': 'prefix'}
+            ],
+            'split_patterns': [],
+            'user_corrections': [],
+            'web_research': []
+        }
+        matches = get_sop_matches_batch(["Starbucks Reserve", "Starbucks Pike", "St"], rules)
+        assert [m['category'] if m else None for m in matches] == ['Generic', 'Landmarks', None]
+    
+    def test_get_sop_match_scans_only_first_char_candidates(self):
+        """Test contains patterns are bucketed by first char, keeping priority."""
+        rules = {
+            'core_patterns': [
+                {'pattern': '*zzz*', 'category': 'Sleep', 'pattern_type': 'contains'},
+                {'pattern': '*café*', 'category': 'Cafe', 'pattern_type': 'contains'},
+                {'pattern': '^.*mart$', 'category': 'Stores', 'pattern_type': 'regex'},
+                {'pattern': '*coffee*', 'category': 'Coffee', 'pattern_type': 'contains'}
+            ],
+            'split_patterns': [],
+            'user_corrections': [],
+            'web_research': []
+        }
+        index = sop_manager._SopIndex(rules)
+        assert sorted(index.scan_by_first) == ['c', 'z']
+        assert index.scan_always == [2]
+        matches = get_sop_matches_batch(
+            ["Local Coffee", "Le Café Bleu", "Coffee Mart", "Tea House"], rules
+        )
+        assert [m['category'] if m else None for m in matches] == ['Coffee', 'Cafe', 'Stores', None]
+    
+    def test_get_sop_match_combines_regexes_in_priority_order(self):
+        """Test groupless regexes share one alternation; grouped ones match alone."""
+        rules = {
+            'core_patterns': [
+                {'pattern': '^star', 'category': 'Star', 'pattern_type': 'regex'},
+                {'pattern': '^(\\w+) \\1$', 'category': 'Repeat', 'pattern_type': 'regex'},
+                {'pattern': '*bucks*', 'category': 'Bucks', 'pattern_type': 'contains'},
+                {'pattern': 'Starbucks|Peet.s', 'category': 'Coffee', 'pattern_type': 'regex'}
+            ],
+            'split_patterns': [],
+            'user_corrections': [],
+            'web_research': []
+        }
+        index = sop_manager._SopIndex(rules)
+        assert index.regex_union is not None
+        assert sorted(index.regex_group_positions.values()) == [0, 3]
+        matches = get_sop_matches_batch(
+            ["Starbucks", "Peet's Coffee", "bam bam", "Big Bucks", "Walmart"], rules
+        )
+        assert [m['category'] if m else None for m in matches] == [
+            'Star', 'Coffee', 'Repeat', 'Bucks', None
+        ]
+    
+    def test_index_rebuild_reuses_compiled_regexes(self):
+        """Test regex patterns are compiled once across index rebuilds."""
+        rules = {
+            'core_patterns': [
+                {'pattern': '^Star.*s$', 'category': 'Coffee', 'pattern_type': 'regex'},
+                {'pattern': '([', 'category': 'Broken', 'pattern_type': 'regex'}
+            ],
+            'split_patterns': [],
+            'user_corrections': [],
+            'web_research': []
+        }
+        sop_manager._compile_regex.cache_clear()
+        assert get_sop_match("Starbucks", rules)['category'] == 'Coffee'
+        sop_manager._invalidate_match_cache()
+        assert get_sop_match("Starbucks", rules)['category'] == 'Coffee'
+        info = sop_manager._compile_regex.cache_info()
+        assert info.misses == 2
+        assert info.hits == 2
+    
+    def test_get_sop_match_reparses_only_when_file_changes(self, tmp_path):
+        """Test the SOP file is parsed once per version when no rules are passed."""
+        sop_file = tmp_path / 'categorization_rules.md'
+        sop_file.write_text("## Core Patterns\n\n- **Pattern**: Starbucks*\n- **Category**: Coffee\n\n")
+        sop_manager._invalidate_match_cache()
+        try:
+            with patch.object(sop_manager, 'SOP_PATH', sop_file), \
+                 patch.object(sop_manager, 'load_categorization_rules',
+                              wraps=sop_manager.load_categorization_rules) as mock_load:
+                assert get_sop_match("Starbucks #1")['category'] == 'Coffee'
+                assert get_sop_match("Starbucks #2")['category'] == 'Coffee'
+                assert mock_load.call_count == 1
+                
+                with open(sop_file, 'a') as f:
+                    f.write("- **Pattern**: Walmart\n- **Category**: Groceries\n\n")
+                assert get_sop_match("Walmart")['category'] == 'Groceries'
+                assert mock_load.call_count == 2
+        finally:
+            sop_manager._invalidate_match_cache()
+    
     def test_update_sop_with_rule_validates_rule_type(self):
         """Test update_sop_with_rule() validates rule_type."""
         result = update_sop_with_rule('invalid_type', {'pattern': 'Test'})
@@ -51,6 +214,35 @@ class TestBasicFunctionality:
         result = update_sop_with_rule('core_pattern', {'pattern': 'Test*'})
         assert result is False
 
+    
+    def test_update_sop_with_rule_reports_write_failure(self):
+        """Test update_sop_with_rule() writes before returning and reports failure."""
+        with patch.object(sop_manager, 'append_rule_to_sop', return_value=False) as mock_append:
+            assert update_sop_with_rule('core_pattern', {'pattern': 'A*', 'category': 'X'}) is False
+        mock_append.assert_called_once()
+    
+    def test_queue_sop_rule_coalesces_queued_rules(self):
+        """Test queue_sop_rule() batches queued rules into one append."""
+        with patch.object(sop_manager, 'FLUSH_INTERVAL', 1.0), \
+             patch.object(sop_manager, 'append_rules_to_sop', return_value=True) as mock_append:
+            assert queue_sop_rule('core_pattern', {'pattern': 'A*', 'category': 'X'})
+            assert queue_sop_rule('core_pattern', {'pattern': 'B*', 'category': 'Y'})
+            flush_sop_writes()
+        
+        mock_append.assert_called_once()
+        written = mock_append.call_args[0][0]
+        assert len(written) == 2
+        assert '- **Pattern**: A*' in written[0]
+        assert '- **Source**: Agent' in written[1]
+    
+    def test_write_queue_refuses_rules_after_close(self):
+        """Test the SOP writer queue takes no work once closed."""
+        write_queue = sop_manager._WriteQueue()
+        write_queue.close()
+        
+        assert write_queue.put('core_pattern', '## Core Patterns\n- **Pattern**: A*') is False
+        assert write_queue._thread is None
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
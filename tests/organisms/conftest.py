@@ -0,0 +1,53 @@
+"""Shared fixtures for organism tests."""
+
+import pytest
+from datetime import datetime, timezone
+from organisms.categorization_agent import CategorizationAgent
+from organisms.recommendation_engine import RecommendationEngine
+
+
+@pytest.fixture(scope="session")
+def mock_budget_id():
+    """Return a test budget ID (not a real YNAB budget)."""
+    return "test-budget-12345"
+
+
+@pytest.fixture(scope="session")
+def sample_transaction():
+    """Return a sample transaction for testing."""
+    return {
+        'id': 'txn-001',
+        'payee_name': 'Test Merchant',
+        'amount': -50000,  # $50.00
+        'date': datetime.now(timezone.utc).isoformat(),
+        'memo': 'Test transaction'
+    }
+
+
+@pytest.fixture(scope="session")
+def agent(mock_budget_id):
+    """
+    Return one CategorizationAgent shared by the whole session.
+    
+    Taken from CategorizationAgent.get(), so it is also the agent behind
+    `engine`: repeated real categorizations of sample_transaction are
+    answered from its Tier 3 payee cache after the first API call.
+    
+    Only for tests that don't depend on fresh agent state; tests of
+    initialization, SOP caching or learning build their own agent.
+    """
+    try:
+        return CategorizationAgent.get(mock_budget_id)
+    except ValueError:
+        pytest.skip("Anthropic API key not configured")
+
+
+@pytest.fixture(scope="session")
+def engine(mock_budget_id):
+    """Return one RecommendationEngine shared by the whole session."""
+    try:
+        return RecommendationEngine(mock_budget_id)
+    except ValueError as e:
+        if "Anthropic API key not found" in str(e):
+            pytest.skip("Anthropic API key not configured")
+        raise
@@ -1,26 +1,41 @@
 """Test suite for API fetch atom"""
 import pytest
+import copy
 import json
 from unittest.mock import patch, Mock
 from pathlib import Path
 
-from tools.ynab.transaction_tagger.atoms.api_fetch import fetch_transactions, fetch_categories
+from tools.ynab.transaction_tagger.atoms.api_fetch import (
+    fetch_transactions,
+    fetch_categories,
+    fetch_category_changes,
+)
 from common.base_client import YNABUnauthorizedError, YNABNotFoundError
 
 
-# Load fixtures
 FIXTURES_PATH = Path(__file__).parent / 'fixtures' / 'ynab_responses.json'
-with open(FIXTURES_PATH) as f:
-    FIXTURES = json.load(f)
+
+
+@pytest.fixture(scope="session")
+def fixtures():
+    """Canned YNAB API responses, loaded once per session (treat as read-only)"""
+    with open(FIXTURES_PATH) as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def fixtures_mut(fixtures):
+    """Private deep copy of the canned responses for tests that modify them"""
+    return copy.deepcopy(fixtures)
 
 
 @patch('tools.ynab.transaction_tagger.atoms.api_fetch.BaseYNABClient')
-def test_fetch_transactions_success(mock_client_class):
+def test_fetch_transactions_success(mock_client_class, fixtures):
     """Test successful transaction fetch"""
     mock_client = Mock()
     # Return data once, then empty batch to stop pagination
     mock_client.get.side_effect = [
-        FIXTURES['transactions_page2'],
+        fixtures['transactions_page2'],
         {'data': {'transactions': [], 'server_knowledge': 100}}
     ]
     mock_client_class.return_value = mock_client
@@ -32,12 +47,12 @@ def test_fetch_transactions_success(mock_client_class):
 
 
 @patch('tools.ynab.transaction_tagger.atoms.api_fetch.BaseYNABClient')
-def test_fetch_transactions_with_since_date(mock_client_class):
+def test_fetch_transactions_with_since_date(mock_client_class, fixtures):
     """Test transaction fetch with since_date parameter"""
     mock_client = Mock()
     # Return data once, then empty batch to stop
     mock_client.get.side_effect = [
-        FIXTURES['transactions_page1'],
+        fixtures['transactions_page1'],
         {'data': {'transactions': [], 'server_knowledge': 100}}
     ]
     mock_client_class.return_value = mock_client
@@ -50,19 +65,16 @@ def test_fetch_transactions_with_since_date(mock_client_class):
 
 
 @patch('tools.ynab.transaction_tagger.atoms.api_fetch.BaseYNABClient')
-def test_fetch_transactions_pagination(mock_client_class):
+def test_fetch_transactions_pagination(mock_client_class, fixtures_mut):
     """Test transaction fetch handles pagination"""
     mock_client = Mock()
     # Modify page1 to have different server_knowledge to trigger pagination
-    page1 = FIXTURES['transactions_page1'].copy()
-    page1_data = page1['data'].copy()
-    page1_data['server_knowledge'] = 50
-    page1['data'] = page1_data
+    fixtures_mut['transactions_page1']['data']['server_knowledge'] = 50
     
     # First call returns page1 (knowledge=50), second call returns page2 (knowledge=100), third empty
     mock_client.get.side_effect = [
-        page1,
-        FIXTURES['transactions_page2'],
+        fixtures_mut['transactions_page1'],
+        fixtures_mut['transactions_page2'],
         {'data': {'transactions': [], 'server_knowledge': 100}}
     ]
     mock_client_class.return_value = mock_client
@@ -74,11 +86,11 @@ def test_fetch_transactions_pagination(mock_client_class):
 
 
 @patch('tools.ynab.transaction_tagger.atoms.api_fetch.BaseYNABClient')
-def test_fetch_transactions_filters_deleted(mock_client_class):
+def test_fetch_transactions_filters_deleted(mock_client_class, fixtures):
     """Test deleted transactions are filtered out"""
     mock_client = Mock()
     mock_client.get.side_effect = [
-        FIXTURES['transactions_with_deleted'],
+        fixtures['transactions_with_deleted'],
         {'data': {'transactions': [], 'server_knowledge': 100}}
     ]
     mock_client_class.return_value = mock_client
@@ -90,10 +102,10 @@ def test_fetch_transactions_filters_deleted(mock_client_class):
 
 
 @patch('tools.ynab.transaction_tagger.atoms.api_fetch.BaseYNABClient')
-def test_fetch_categories_success(mock_client_class):
+def test_fetch_categories_success(mock_client_class, fixtures):
     """Test successful category fetch"""
     mock_client = Mock()
-    mock_client.get.return_value = FIXTURES['categories']
+    mock_client.get.return_value = fixtures['categories']
     mock_client_class.return_value = mock_client
     
     result = fetch_categories('budget-123')
@@ -160,6 +172,70 @@ def test_fetch_categories_filters_hidden_deleted(mock_client_class):
     assert result[0]['name'] == 'Active Category'
 
 
+@patch('tools.ynab.transaction_tagger.atoms.api_fetch.BaseYNABClient')
+def test_fetch_category_changes_merges_delta(mock_client_class, fixtures):
+    """Test delta fetch sends knowledge and merges changed categories"""
+    mock_client = Mock()
+    mock_client.get.side_effect = [
+        fixtures['categories'],
+        {
+            "data": {
+                "category_groups": [
+                    {
+                        "id": "grp-001",
+                        "hidden": False,
+                        "deleted": False,
+                        "categories": [
+                            {"id": "cat-001", "category_group_id": "grp-001",
+                             "name": "Rent", "hidden": False, "deleted": False},
+                            {"id": "cat-002", "category_group_id": "grp-001",
+                             "name": "Electric", "hidden": False, "deleted": True}
+                        ]
+                    },
+                    {
+                        "id": "grp-003",
+                        "hidden": False,
+                        "deleted": False,
+                        "categories": [
+                            {"id": "cat-004", "category_group_id": "grp-003",
+                             "name": "Vacation", "hidden": False, "deleted": False}
+                        ]
+                    }
+                ],
+                "server_knowledge": 51
+            }
+        }
+    ]
+    mock_client_class.return_value = mock_client
+    
+    categories, knowledge = fetch_category_changes('budget-123')
+    assert knowledge == 50
+    
+    merged, knowledge = fetch_category_changes(
+        'budget-123', since_knowledge=knowledge, categories=categories
+    )
+    
+    assert mock_client.get.call_args[0][1] == {'last_knowledge_of_server': 50}
+    assert knowledge == 51
+    assert [c['name'] for c in merged] == ['Rent', 'Groceries', 'Vacation']
+
+
+@patch('tools.ynab.transaction_tagger.atoms.api_fetch.BaseYNABClient')
+def test_fetch_category_changes_empty_delta(mock_client_class):
+    """Test empty delta keeps the cached category list object"""
+    mock_client = Mock()
+    mock_client.get.return_value = {'data': {'category_groups': [], 'server_knowledge': 60}}
+    mock_client_class.return_value = mock_client
+    
+    cached = [{'id': 'cat-001', 'name': 'Rent/Mortgage'}]
+    categories, knowledge = fetch_category_changes(
+        'budget-123', since_knowledge=50, categories=cached
+    )
+    
+    assert categories is cached
+    assert knowledge == 60
+
+
 @patch('tools.ynab.transaction_tagger.atoms.api_fetch.BaseYNABClient')
 def test_api_unauthorized_error(mock_client_class):
     """Test 401 unauthorized error handling"""
@@ -580,3 +656,66 @@ def test_upsert_transaction_execution_error(mock_db_class):
     
     # Verify connection was closed even on error
     mock_db.close.assert_called_once()
+
+
+# ============================================================================
+# API Update Atom Tests - Bulk category updates
+# ============================================================================
+
+from tools.ynab.transaction_tagger.atoms.api_update import update_transaction_categories
+from common.base_client import YNABAPIError, YNABConflictError
+
+
+@patch('tools.ynab.transaction_tagger.atoms.api_update.BaseYNABClient')
+def test_update_transaction_categories_batches(mock_client_class):
+    """Test bulk update chunks requests and maps per-transaction outcomes"""
+    mock_client = Mock()
+    mock_client.patch.side_effect = [
+        {'data': {'transaction_ids': ['txn-1', 'txn-2']}},
+        {'data': {'transaction_ids': []}},
+    ]
+    mock_client_class.return_value = mock_client
+    
+    results = update_transaction_categories(
+        'budget-123',
+        {'txn-1': 'cat-1', 'txn-2': 'cat-2', 'txn-3': 'cat-3'},
+        batch_size=2
+    )
+    
+    assert results == {'txn-1': True, 'txn-2': True, 'txn-3': False}
+    assert mock_client.patch.call_count == 2
+    endpoint, payload = mock_client.patch.call_args_list[0][0]
+    assert endpoint == '/budgets/budget-123/transactions'
+    assert payload == {'transactions': [
+        {'id': 'txn-1', 'category_id': 'cat-1'},
+        {'id': 'txn-2', 'category_id': 'cat-2'},
+    ]}
+
+
+@patch('tools.ynab.transaction_tagger.atoms.api_update.BaseYNABClient')
+def test_update_transaction_categories_batch_errors(mock_client_class):
+    """Test a failed batch marks only its own transactions"""
+    error = YNABAPIError("Server error")
+    mock_client = Mock()
+    mock_client.patch.side_effect = [YNABConflictError("Conflict"), error]
+    mock_client_class.return_value = mock_client
+    
+    results = update_transaction_categories(
+        'budget-123', {'txn-1': 'cat-1', 'txn-2': 'cat-2'}, batch_size=1
+    )
+    
+    assert results == {'txn-1': False, 'txn-2': error}
+
+
+from tools.ynab.transaction_tagger.atoms.sop_updater import append_rules_to_sop
+
+
+def test_append_rules_to_sop_after_multibyte_tail(tmp_path):
+    """Test appending works when the SOP file ends in non-ASCII text"""
+    sop_path = tmp_path / 'rules.md'
+    sop_path.write_text('- **Pattern**: Café\n', encoding='utf-8')
+    
+    assert append_rules_to_sop(['## Core Patterns\n- **Pattern**: Ä'], str(sop_path))
+    
+    content = sop_path.read_text(encoding='utf-8')
+    assert content.startswith('- **Pattern**: Café\n\n## Core Patterns\n- **Pattern**: Ä\n')
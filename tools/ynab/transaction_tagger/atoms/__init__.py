@@ -3,7 +3,7 @@
 Layer 1: Pure, single-purpose functions for YNAB data operations.
 """
 
-from .api_fetch import fetch_transactions, fetch_categories
+from .api_fetch import fetch_transactions, fetch_categories, fetch_category_changes
 from .api_update import update_transaction_category, update_split_transaction
 from .db_init import initialize_database
 from .db_upsert import upsert_transaction
@@ -14,6 +14,7 @@ from .sop_loader import load_categorization_rules
 __all__ = [
     'fetch_transactions',
     'fetch_categories',
+    'fetch_category_changes',
     'update_transaction_category',
     'update_split_transaction',
     'initialize_database',
@@ -1,5 +1,5 @@
 """API fetch atom - Pure functions for YNAB API data retrieval"""
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from common.base_client import BaseYNABClient
 
 
@@ -85,24 +85,97 @@ def fetch_categories(budget_id: str) -> List[Dict]:
         >>> categories[0]['name']
         'Groceries'
     """
+    categories, _ = fetch_category_changes(budget_id)
+    return categories
+
+
+def fetch_category_changes(
+    budget_id: str,
+    since_knowledge: Optional[int] = None,
+    categories: Optional[List[Dict]] = None
+) -> Tuple[List[Dict], int]:
+    """
+    Fetch category changes since a server_knowledge and merge them in.
+
+    Uses YNAB delta requests (last_knowledge_of_server): only category
+    groups/categories changed since since_knowledge are returned and
+    applied on top of categories. Without since_knowledge this is a full
+    fetch, same result as fetch_categories().
+
+    Args:
+        budget_id: YNAB budget identifier
+        since_knowledge: server_knowledge from a previous call (None = full fetch)
+        categories: Previously fetched category list to merge changes into
+
+    Returns:
+        Tuple of (categories, server_knowledge). categories is the same
+        list object passed in when the delta contains no category changes,
+        otherwise a new merged list (non-hidden, non-deleted only).
+
+    Raises:
+        YNABAPIError: On API errors (401, 404, 429, network errors)
+
+    Example:
+        >>> categories, knowledge = fetch_category_changes('budget-123')
+        >>> categories, knowledge = fetch_category_changes(
+        ...     'budget-123', since_knowledge=knowledge, categories=categories)
+    """
     client = BaseYNABClient()
 
-    # Fetch categories
-    response = client.get(f'/budgets/{budget_id}/categories')
+    params = {}
+    if since_knowledge is not None and categories is not None:
+        params['last_knowledge_of_server'] = since_knowledge
+
+    response = client.get(f'/budgets/{budget_id}/categories', params)
     data = response.get('data', {})
     category_groups = data.get('category_groups', [])
+    server_knowledge = data.get('server_knowledge', 0)
+
+    if not params:
+        return merge_category_changes([], category_groups), server_knowledge
+
+    if not category_groups:
+        return categories, server_knowledge
+
+    return merge_category_changes(categories, category_groups), server_knowledge
+
+
+def merge_category_changes(categories: List[Dict], category_groups: List[Dict]) -> List[Dict]:
+    """
+    Apply YNAB category groups (full or delta) to a flat category list.
+
+    Changed categories replace the cached entry in place, new ones are
+    appended, and hidden/deleted ones are removed. A hidden or deleted
+    group removes all of its categories.
+
+    Args:
+        categories: Current flat category list (not modified)
+        category_groups: category_groups from a YNAB categories response
+
+    Returns:
+        New flat list of non-hidden, non-deleted categories
+    """
+    merged = {category['id']: category for category in categories}
 
-    # Flatten and filter categories
-    categories = []
     for group in category_groups:
         if group.get('hidden') or group.get('deleted'):
+            group_id = group.get('id')
+            merged = {
+                category_id: category
+                for category_id, category in merged.items()
+                if category.get('category_group_id') != group_id
+            }
+            for category in group.get('categories', []):
+                merged.pop(category['id'], None)
             continue
 
         for category in group.get('categories', []):
-            if not category.get('hidden') and not category.get('deleted'):
-                categories.append(category)
+            if category.get('hidden') or category.get('deleted'):
+                merged.pop(category['id'], None)
+            else:
+                merged[category['id']] = category
 
-    return categories
+    return list(merged.values())
 
 
 def fetch_accounts(budget_id: str) -> List[Dict]:
@@ -1,7 +1,7 @@
 """API update atom - Pure functions for YNAB API transaction updates"""
 import logging
 from typing import Dict, List, Any
-from common.base_client import BaseYNABClient, YNABConflictError
+from common.base_client import BaseYNABClient, YNABAPIError, YNABConflictError
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +60,72 @@ def update_transaction_category(
         return False
 
 
+# Maximum transactions sent in one bulk PATCH request
+BULK_UPDATE_BATCH_SIZE = 100
+
+
+def update_transaction_categories(
+    budget_id: str,
+    updates: Dict[str, str],
+    batch_size: int = BULK_UPDATE_BATCH_SIZE
+) -> Dict[str, Any]:
+    """
+    Update many transactions' categories with bulk YNAB API requests.
+    
+    Uses YNAB PATCH /budgets/{budget_id}/transactions endpoint, sending up to
+    batch_size transactions per request instead of one PUT per transaction.
+    
+    Args:
+        budget_id: YNAB budget identifier (UUID format)
+        updates: Mapping of transaction_id -> category_id
+        batch_size: Maximum transactions per request (default: 100)
+    
+    Returns:
+        Dict mapping each transaction_id to its outcome:
+            True if YNAB reported it updated, False if it was not updated
+            (conflict), or the YNABAPIError raised for its batch
+    
+    Example:
+        >>> results = update_transaction_categories(
+        ...     budget_id='budget-abc-123',
+        ...     updates={'txn-1': 'cat-groceries', 'txn-2': 'cat-gas'}
+        ... )
+        >>> print(results)
+        {'txn-1': True, 'txn-2': True}
+    """
+    logger.info(f"Bulk updating {len(updates)} transaction categories")
+    
+    client = BaseYNABClient()
+    endpoint = f'/budgets/{budget_id}/transactions'
+    items = list(updates.items())
+    results: Dict[str, Any] = {}
+    
+    for start in range(0, len(items), batch_size):
+        batch = items[start:start + batch_size]
+        payload = {
+            'transactions': [
+                {'id': txn_id, 'category_id': category_id}
+                for txn_id, category_id in batch
+            ]
+        }
+    
+        try:
+            response = client.patch(endpoint, payload)
+        except YNABConflictError:
+            logger.warning(f"Bulk update conflict for {len(batch)} transactions")
+            results.update((txn_id, False) for txn_id, _ in batch)
+            continue
+        except YNABAPIError as e:
+            logger.error(f"Bulk update failed for {len(batch)} transactions: {e}")
+            results.update((txn_id, e) for txn_id, _ in batch)
+            continue
+    
+        updated = set(response.get('data', {}).get('transaction_ids', []))
+        results.update((txn_id, txn_id in updated) for txn_id, _ in batch)
+    
+    return results
+
+
 def _validate_subtransaction_amounts(
     subtransactions: List[Dict[str, Any]],
     expected_total: int
@@ -16,6 +16,18 @@ import re
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Line patterns, compiled once at import
+_KV_PAIR_RE = re.compile(r'- \*\*([^*]+)\*\*:\s*(.+)')
+_ALLOCATION_RE = re.compile(r'\*\s*([^:]+):\s*(\d+)%?')
+
+# Section headers: (header prefix, section key, label for warnings)
+_SECTION_HEADERS = (
+    ('## Core Patterns', 'core_patterns', 'Core Patterns'),
+    ('## Split Transaction Patterns', 'split_patterns', 'Split Patterns'),
+    ('## Learned from User Corrections', 'user_corrections', 'User Corrections'),
+    ('## Web Research Results', 'web_research', 'Web Research'),
+)
+
 
 def detect_pattern_type(pattern: str) -> str:
     """
@@ -81,7 +93,7 @@ def parse_kv_pair(line: str) -> Tuple[Optional[str], Optional[str]]:
         >>> parse_kv_pair("- **Pattern**: {regex}")
         (None, None)
     """
-    match = re.match(r'- \*\*([^*]+)\*\*:\s*(.+)', line.strip())
+    match = _KV_PAIR_RE.match(line.strip())
     if not match:
         return None, None
     
@@ -133,7 +145,7 @@ def parse_split_allocations(lines: List[str], start_idx: int) -> List[Dict[str,
             break
         
         # Parse: "* Category: XX%"
-        match = re.match(r'\*\s*([^:]+):\s*(\d+)%?', line)
+        match = _ALLOCATION_RE.match(line)
         if match:
             allocations.append({
                 'category': match.group(1).strip(),
@@ -257,38 +269,25 @@ def load_categorization_rules(sop_path: str = None) -> Dict[str, List[Dict[str,
     current_entry = {}
     
     for i, line in enumerate(lines):
-        # Detect section headers
-        if line.startswith('## Core Patterns'):
-            current_section = 'core_patterns'
-            if current_entry:
-                logger.warning(f"Incomplete entry before Core Patterns section: {current_entry}")
-                current_entry = {}
-            continue
-        elif line.startswith('## Split Transaction Patterns'):
-            current_section = 'split_patterns'
-            if current_entry:
-                logger.warning(f"Incomplete entry before Split Patterns section: {current_entry}")
-                current_entry = {}
-            continue
-        elif line.startswith('## Learned from User Corrections'):
-            current_section = 'user_corrections'
-            if current_entry:
-                logger.warning(f"Incomplete entry before User Corrections section: {current_entry}")
-                current_entry = {}
-            continue
-        elif line.startswith('## Web Research Results'):
-            current_section = 'web_research'
-            if current_entry:
-                logger.warning(f"Incomplete entry before Web Research section: {current_entry}")
-                current_entry = {}
-            continue
+        # Detect section headers (only '## ' lines can be one)
+        if line.startswith('## '):
+            header = next(
+                (h for h in _SECTION_HEADERS if line.startswith(h[0])), None
+            )
+            if header is not None:
+                current_section = header[1]
+                if current_entry:
+                    logger.warning(f"Incomplete entry before {header[2]} section: {current_entry}")
+                    current_entry = {}
+                continue
         
         # Skip if no section detected yet
         if current_section is None:
             continue
         
         # Parse bullet list entries
-        if line.strip().startswith('- **'):
+        stripped = line.strip()
+        if stripped.startswith('- **'):
             key, value = parse_kv_pair(line)
             
             if key is None:
@@ -301,7 +300,7 @@ def load_categorization_rules(sop_path: str = None) -> Dict[str, List[Dict[str,
                 current_entry[key] = value
         
         # Detect entry completion (next bullet or section header or empty line after entries)
-        elif line.strip() == '' and current_entry:
+        elif not stripped and current_entry:
             # Entry complete
             if current_section == 'core_patterns' and 'pattern' in current_entry:
                 # Add pattern_type for core_patterns
@@ -10,7 +10,7 @@ Part of Layer 1: Atoms (pure functions)
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime, timezone
 import platform
 import time
@@ -153,6 +153,30 @@ def append_rule_to_sop(
         >>> print(success)
         True
     """
+    return append_rules_to_sop([rule_content], sop_path)
+
+
+def append_rules_to_sop(
+    rule_contents: List[str],
+    sop_path: Optional[str] = None
+) -> bool:
+    """
+    Append several categorization rules to the SOP file in one locked write.
+    
+    Batch variant of append_rule_to_sop(): each rule gets its own timestamp
+    (if missing) and rules are separated by a blank line, but the file is
+    opened, locked and written once for the whole batch.
+    
+    Args:
+        rule_contents: Formatted markdown rule entries (each with section header)
+        sop_path: Path to SOP file (default: categorization_rules.md in same dir)
+    
+    Returns:
+        bool: True if all rules appended successfully, False if failed
+    """
+    if not rule_contents:
+        return True
+    
     # Resolve SOP file path
     if sop_path is None:
         # Default: categorization_rules.md in same directory as this module
@@ -161,55 +185,51 @@ def append_rule_to_sop(
     else:
         sop_file = Path(sop_path)
     
-    logger.info(f"Appending rule to SOP file: {sop_file}")
+    logger.info(f"Appending {len(rule_contents)} rule(s) to SOP file: {sop_file}")
     
     # Verify file exists
     if not sop_file.exists():
         logger.error(f"SOP file not found: {sop_file}")
         return False
     
-    # Inject timestamp if missing
-    rule_with_timestamp = _inject_timestamp_if_missing(rule_content)
+    # Inject timestamp per rule, then join entries with a blank line
+    rule_with_timestamp = '\n'.join(
+        _inject_timestamp_if_missing(rule_content) for rule_content in rule_contents
+    )
     
     try:
-        # Open file in read-append mode
-        with open(sop_file, 'r+') as f:
+        # Binary mode: byte offsets for the tail check, one write for the payload
+        with open(sop_file, 'rb+') as f:
             # Acquire exclusive lock with timeout
             if not _acquire_lock(f, timeout=5):
                 logger.error("Failed to acquire lock within timeout")
                 return False
             
             try:
-                # Read last character to check if we need blank line
-                f.seek(0, 2)  # Seek to end
-                current_pos = f.tell()
+                # Read the last two bytes to decide how much blank line is needed
+                size = f.seek(0, 2)
+                f.seek(max(size - 2, 0))
+                tail = f.read()
                 
-                if current_pos > 0:
-                    f.seek(current_pos - 1)
-                    last_char = f.read(1)
-                    
-                    # Add blank line if file doesn't end with double newline
-                    if last_char != '\n':
-                        f.write('\n\n')
-                    else:
-                        # Check if second-to-last is also newline
-                        if current_pos > 1:
-                            f.seek(current_pos - 2)
-                            second_last = f.read(1)
-                            if second_last != '\n':
-                                f.seek(0, 2)  # Back to end
-                                f.write('\n')
-                        
-                    f.seek(0, 2)  # Back to end
-                
-                # Write rule content
-                f.write(rule_with_timestamp)
+                if not tail:
+                    separator = ''
+                elif not tail.endswith(b'\n'):
+                    # Add blank line if file doesn't end with a newline
+                    separator = '\n\n'
+                elif len(tail) == 2 and tail != b'\n\n':
+                    # Ends with a single newline
+                    separator = '\n'
+                else:
+                    separator = ''
                 
                 # Ensure single newline at end
-                if not rule_with_timestamp.endswith('\n'):
-                    f.write('\n')
+                ending = '' if rule_with_timestamp.endswith('\n') else '\n'
+                
+                # Write separator, rules and ending in one call
+                f.seek(0, 2)
+                f.write((separator + rule_with_timestamp + ending).encode('utf-8'))
                 
-                logger.info("Successfully appended rule to SOP")
+                logger.info(f"Successfully appended {len(rule_contents)} rule(s) to SOP")
                 return True
             
             finally:
@@ -220,5 +240,5 @@ def append_rule_to_sop(
         logger.error(f"Failed to write to SOP file: {e}")
         return False
     except Exception as e:
-        logger.error(f"Unexpected error appending rule: {e}")
+        logger.error(f"Unexpected error appending rules: {e}")
         return False
@@ -29,6 +29,11 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Line-item patterns, compiled once at import (used per invoice line)
+_PRICE_LINE_RE = re.compile(r'^\s*\$(\d+\.\d{2})\s*$')
+_PRICE_RE = re.compile(r'\$\d+\.\d{2}')
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 def parse_amazon_invoice(pdf_path: str) -> Optional[Dict[str, Any]]:
     """
@@ -201,7 +206,7 @@ def _extract_line_items(text: str) -> List[Dict[str, Any]]:
         line = lines[i].strip()
 
         # Look for standalone price line (just $XX.XX, possibly with whitespace)
-        price_only_match = re.match(r'^\s*\$(\d+\.\d{2})\s*$', line)
+        price_only_match = _PRICE_LINE_RE.match(line)
 
         if price_only_match:
             price = Decimal(price_only_match.group(1))
@@ -225,7 +230,7 @@ def _extract_line_items(text: str) -> List[Dict[str, Any]]:
                 # Stop if we hit a hard stop keyword or another price
                 if any(kw in prev_line.lower() for kw in stop_keywords):
                     break
-                if re.search(r'\$\d+\.\d{2}', prev_line):
+                if _PRICE_RE.search(prev_line):
                     break
 
                 # Skip intermediate lines (Sold by, Return policy, etc.)
@@ -251,7 +256,7 @@ def _extract_line_items(text: str) -> List[Dict[str, Any]]:
                 name = ' '.join(product_lines).strip()
 
                 # Clean up name (remove extra whitespace)
-                name = re.sub(r'\s+', ' ', name)
+                name = _WHITESPACE_RE.sub(' ', name)
 
                 if len(name) > 3:  # Reasonable name length
                     items.append({
@@ -7,7 +7,7 @@ transactions, with learning_tracker integration for continuous improvement.
 Part of Layer 2: Molecules (2-3 atom combinations)
 
 Public API:
-    - sync_approved_changes(budget_id, approved_changes) -> Dict
+    - sync_approved_changes(budget_id, approved_changes, batch_updates=False) -> Dict
 
 Example - Single Transaction:
     >>> changes = [{
@@ -46,6 +46,7 @@ from typing import Dict, List, Any
 # Import atoms
 from tools.ynab.transaction_tagger.atoms.api_update import (
     update_transaction_category,
+    update_transaction_categories,
     update_split_transaction
 )
 from common.base_client import YNABAPIError, YNABConflictError
@@ -158,7 +159,8 @@ def _validate_inputs(
 
 def sync_approved_changes(
     budget_id: str,
-    approved_changes: List[Dict[str, Any]]
+    approved_changes: List[Dict[str, Any]],
+    batch_updates: bool = False
 ) -> Dict[str, Any]:
     """
     Sync approved transaction categorizations to YNAB API.
@@ -200,6 +202,9 @@ def sync_approved_changes(
                 'confidence_score': float (0.0-1.0, required),
                 'method': str (required)
             }
+        batch_updates: If True, send all single-category updates to YNAB in
+            bulk PATCH requests up front instead of one PUT per transaction.
+            Split transactions are always updated individually.
     
     Returns:
         Dict with structure:
@@ -250,6 +255,18 @@ def sync_approved_changes(
     
     logger.info(f"Starting sync of {total} approved changes to budget {budget_id}")
     
+    # Bulk-update single-category changes, leaving per-change bookkeeping below
+    bulk_results = None
+    if batch_updates:
+        bulk_results = update_transaction_categories(
+            budget_id,
+            {
+                change['transaction_id']: change['category_id']
+                for change in approved_changes
+                if not change.get('is_split', False)
+            }
+        )
+    
     # 3. Process each change
     for idx, change in enumerate(approved_changes):
         txn_id = change['transaction_id']
@@ -267,6 +284,11 @@ def sync_approved_changes(
                     subtransactions=change['subtransactions'],
                     expected_amount=change['amount']
                 )
+            elif bulk_results is not None:
+                # Single transaction, already sent in a bulk request
+                success = bulk_results[txn_id]
+                if isinstance(success, Exception):
+                    raise success
             else:
                 # Single transaction
                 success = update_transaction_category(
@@ -686,7 +686,8 @@ def generate_recommendations(
                 'business': {...}
             },
             'errors': List[Dict],
-            'timestamp': str  # ISO 8601
+            'timestamp': str,  # ISO 8601
+            'total_transactions': int  # Across all budgets (success/partial only)
         }
     """
     # Step 1: Initialize database (idempotent)
@@ -779,7 +780,8 @@ def generate_recommendations(
         'status': 'success',
         'budgets': {},
         'timestamp': datetime.utcnow().isoformat() + 'Z',
-        'errors': []
+        'errors': [],
+        'total_transactions': 0
     }
     
     for budget_name, budget_config in budgets.items():
@@ -848,6 +850,7 @@ def generate_recommendations(
             
             # Build summary
             summary = _build_summary(categorized)
+            result['total_transactions'] += len(categorized)
             
             # Add to result
             result['budgets'][budget_name] = {
@@ -871,7 +874,8 @@ def generate_recommendations(
 
 def submit_approved_changes(
     budget_id: str,
-    approved_changes: List[Dict[str, Any]]
+    approved_changes: List[Dict[str, Any]],
+    batch_updates: bool = True
 ) -> Dict[str, Any]:
     """
     Submit approved transaction categorizations to YNAB API.
@@ -882,6 +886,8 @@ def submit_approved_changes(
     Args:
         budget_id: YNAB budget UUID
         approved_changes: List of approved categorizations
+        batch_updates: Send single-category updates in bulk YNAB requests
+            (default: True)
     
     Returns:
         Sync result dict from ynab_syncer with added timestamp
@@ -889,7 +895,9 @@ def submit_approved_changes(
     logger.info(f"Submitting {len(approved_changes)} approved changes to budget {budget_id}")
     
     # Delegate to ynab_syncer
-    result = _sync_approved_changes(budget_id, approved_changes)
+    result = _sync_approved_changes(
+        budget_id, approved_changes, batch_updates=batch_updates
+    )
     
     # Add timestamp
     result['timestamp'] = datetime.utcnow().isoformat() + 'Z'
@@ -567,3 +567,58 @@ class TestYNABSyncerComposition:
         assert result['conflicts'] == 1
         assert result['failed'] == 1
         assert len(result['errors']) == 2
+
+
+class TestYNABSyncerBatchUpdates:
+    """Test suite for YNAB Syncer - Bulk single-category updates."""
+    
+    @patch('tools.ynab.transaction_tagger.molecules.ynab_syncer.record_agent_decision')
+    @patch('tools.ynab.transaction_tagger.molecules.ynab_syncer.update_split_transaction')
+    @patch('tools.ynab.transaction_tagger.molecules.ynab_syncer.update_transaction_category')
+    @patch('tools.ynab.transaction_tagger.molecules.ynab_syncer.update_transaction_categories')
+    def test_batch_updates_use_bulk_atom(self, mock_bulk, mock_update, mock_update_split, mock_record):
+        """Verify single changes go in one bulk call and splits stay per-transaction."""
+        mock_bulk.return_value = {
+            'txn_1': True,
+            'txn_2': False,
+            'txn_3': YNABAPIError("Error")
+        }
+        mock_update_split.return_value = True
+        mock_record.return_value = True
+        
+        changes = [
+            {
+                'transaction_id': f'txn_{i}',
+                'category_id': f'cat_{i}',
+                'category_name': f'Cat {i}',
+                'categorization_tier': 1,
+                'confidence_score': 0.9,
+                'method': 'sop'
+            }
+            for i in (1, 2, 3)
+        ]
+        changes.append({
+            'transaction_id': 'txn_split',
+            'is_split': True,
+            'amount': -15000,
+            'subtransactions': [
+                {'amount': -10000, 'category_id': 'cat_a'},
+                {'amount': -5000, 'category_id': 'cat_b'}
+            ],
+            'categorization_tier': 1,
+            'confidence_score': 0.9,
+            'method': 'sop'
+        })
+        
+        result = sync_approved_changes('budget_xyz', changes, batch_updates=True)
+        
+        mock_bulk.assert_called_once_with(
+            'budget_xyz', {'txn_1': 'cat_1', 'txn_2': 'cat_2', 'txn_3': 'cat_3'}
+        )
+        mock_update.assert_not_called()
+        mock_update_split.assert_called_once()
+        assert result['total'] == 4
+        assert result['succeeded'] == 2
+        assert result['conflicts'] == 1
+        assert result['failed'] == 1
+        assert mock_record.call_count == 2
@@ -306,6 +306,7 @@ class TestGenerateRecommendations:
             assert 'transactions' in budget_result
             assert 'summary' in budget_result
             assert len(budget_result['transactions']) > 0
+            assert result['total_transactions'] == len(budget_result['transactions'])
     
     def test_generate_recommendations_invalid_budget_type(self):
         """Test invalid budget_type"""
@@ -412,7 +413,9 @@ class TestSubmitApprovedChanges:
             assert result['total'] == 2
             assert 'timestamp' in result
             
-            mock_sync.assert_called_once_with('budget-123', changes)
+            mock_sync.assert_called_once_with(
+                'budget-123', changes, batch_updates=True
+            )
     
     def test_submit_approved_changes_adds_timestamp(self):
         """Test timestamp is added to result"""